@@ -11,8 +11,12 @@ bl_info = {
 }
 
 import importlib
+import time
+
 import bpy
 
+from . import lazy as _lazy
+from . import profiling as _profiling
 from . import utils as _utils
 from . import ops_align as _ops_align
 from . import ops_distribute as _ops_distribute
@@ -21,14 +25,22 @@ from . import ops_cursor as _ops_cursor
 from . import ops_orient as _ops_orient
 from . import ops_snap as _ops_snap
 from . import ops_spacing as _ops_spacing
+from . import recipes as _recipes
 from . import ui as _ui
 
 
 def reload_modules():
-    for m in (_utils, _ops_align, _ops_distribute, _ops_mirror, _ops_cursor, _ops_orient, _ops_snap, _ops_spacing, _ui):
+    for m in (_lazy, _profiling, _utils, _ops_align, _ops_distribute, _ops_mirror, _ops_cursor, _ops_orient, _ops_snap, _ops_spacing, _recipes, _ui):
         importlib.reload(m)
 
 
+_OPERATOR_MODULES = (_ops_align, _ops_distribute, _ops_mirror, _ops_cursor, _ops_orient, _ops_snap, _ops_spacing)
+
+
+def _update_profiling(self, context):
+    _profiling.enabled = self.enable_profiling
+
+
 class ALIGNMENT_SUITE_Preferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
@@ -37,14 +49,32 @@ class ALIGNMENT_SUITE_Preferences(bpy.types.AddonPreferences):
         default=False,
         description="Expose additional advanced options in the UI",
     )
+    enable_profiling: bpy.props.BoolProperty(
+        name="Enable Profiling",
+        default=False,
+        description="Record time, objects, vertices, bounds and depsgraph updates per operator and show them in the panel",
+        update=_update_profiling,
+    )
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "show_advanced")
+        layout.prop(self, "enable_profiling")
+
+        box = layout.box()
+        box.label(text=f"Register: {_lazy.register_time:.1f} ms")
+        for name in sorted(_lazy.deferred):
+            if name in _lazy.import_times:
+                box.label(text=f"{name}: {_lazy.import_times[name]:.1f} ms, loaded on first use")
+            else:
+                box.label(text=f"{name}: deferred, not loaded yet")
 
 def register():
+    start = time.perf_counter()
     bpy.utils.register_class(ALIGNMENT_SUITE_Preferences)
     # Register submodules (they register their own classes and props)
+    _profiling.register()
+    _utils.register()
     _ops_align.register()
     _ops_distribute.register()
     _ops_mirror.register()
@@ -52,12 +82,22 @@ def register():
     _ops_orient.register()
     _ops_snap.register()
     _ops_spacing.register()
+    _recipes.register()
     _ui.register()
+    for module in _OPERATOR_MODULES:
+        _profiling.instrument(module.classes)
+    _profiling.instrument(_recipes.classes)
+    _recipes.set_operators([cls for module in _OPERATOR_MODULES for cls in module.classes])
+    _profiling.instrument(_ui.panels)
+    addon = bpy.context.preferences.addons.get(__name__)
+    _profiling.enabled = bool(addon and addon.preferences.enable_profiling)
+    _lazy.register_time = (time.perf_counter() - start) * 1000.0
 
 
 def unregister():
     # Unregister in reverse order
     _ui.unregister()
+    _recipes.unregister()
     _ops_cursor.unregister()
     _ops_spacing.unregister()
     _ops_snap.unregister()
@@ -65,6 +105,8 @@ def unregister():
     _ops_mirror.unregister()
     _ops_distribute.unregister()
     _ops_align.unregister()
+    _utils.unregister()
+    _profiling.unregister()
     bpy.utils.unregister_class(ALIGNMENT_SUITE_Preferences)
 
 
@@ -0,0 +1,155 @@
+"""Plain functions for scripts, running the operators' code without ``bpy.ops``.
+
+Each function takes the objects to work on and the same parameters as the
+matching operator, runs that operator's ``execute`` directly and returns the
+objects it moved (or created, for mirrored duplicates)::
+
+    from alignment_suite import api
+
+    api.align(objs, axis="Z", mode="WORLD", use_bounds=True, which_bound="MIN")
+    api.distribute(objs, axis="X", spacing_mode="GAP")
+
+There is no operator lookup, context override or undo push per call, and
+nothing depends on a window, so the functions work in ``blender -b`` scripts.
+The add-on does not need to be enabled; when it is not, bounds are measured
+afresh on every call because the handlers that invalidate the bounds caches
+are not installed. Objects must be in the current view layer, and the file
+must be in Object Mode like for the operators. After editing geometry, call
+``view_layer.update()`` before the next call, as for any evaluated data.
+"""
+
+from typing import Iterable, List, Optional
+
+import bpy
+
+from . import ops_align, ops_distribute, ops_mirror, ops_snap, ops_spacing
+from .lazy import lazy_import
+from .utils import ExecuteProxy, declared_properties, object_matrices
+
+np = lazy_import("numpy")
+
+__all__ = (
+    "align",
+    "distribute",
+    "distribute_by_distance",
+    "distribute_grid",
+    "mirror",
+    "resolve_overlaps",
+    "run",
+    "snap",
+    "snap_to_increment",
+    "space",
+)
+
+
+class _Override:
+    """``base`` with some attributes replaced."""
+
+    def __init__(self, base, **overrides) -> None:
+        self._base = base
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._base, name)
+
+
+class _LinkRecorder(_Override):
+    """Collection objects that remember what gets linked through them."""
+
+    def __init__(self, base) -> None:
+        super().__init__(base, linked=[])
+
+    def link(self, obj) -> None:
+        self._base.link(obj)
+        self.linked.append(obj)
+
+
+def _check_properties(cls, properties) -> None:
+    declared = declared_properties(cls)
+    for name, value in properties.items():
+        prop = declared.get(name)
+        if prop is None:
+            raise TypeError(f"{cls.bl_idname} has no property {name!r}")
+        items = prop.keywords.get("items")
+        if items and not callable(items) and value not in {item[0] for item in items}:
+            choices = ", ".join(item[0] for item in items)
+            raise ValueError(f"{cls.bl_idname}: {name}={value!r} is not one of {choices}")
+
+
+def run(
+    cls: type,
+    objects: Iterable[bpy.types.Object],
+    active: Optional[bpy.types.Object] = None,
+    context: Optional[bpy.types.Context] = None,
+    **properties,
+) -> List[bpy.types.Object]:
+    """Run operator class ``cls`` on ``objects`` as if they were selected.
+
+    ``active`` stands in for the active object (targets such as "ACTIVE" use
+    it). Returns the objects whose world matrix changed plus any it created.
+    Raises ``TypeError``/``ValueError`` for unknown properties or enum values
+    and ``RuntimeError`` when the operator cannot run or cancels.
+    """
+    objs = list(objects)
+    _check_properties(cls, properties)
+    base = context or bpy.context
+    if active is None and objs:
+        active = objs[0]
+    view_layer = base.view_layer
+    recorder = _LinkRecorder(base.collection.objects)
+    context = _Override(
+        base,
+        selected_objects=objs,
+        active_object=active,
+        view_layer=_Override(view_layer, objects=_Override(view_layer.objects, active=active)),
+        collection=_Override(base.collection, objects=recorder),
+    )
+    if hasattr(cls, "poll") and not cls.poll(context):
+        raise RuntimeError(f"{cls.bl_idname} cannot run on these objects in the current mode")
+
+    before = object_matrices(objs)
+    operator = ExecuteProxy(cls, properties)
+    result = cls.execute(operator, context)
+    if "FINISHED" not in result:
+        messages = "; ".join(message for _level, message in operator.reports)
+        raise RuntimeError(f"{cls.bl_idname} was cancelled" + (f": {messages}" if messages else ""))
+    changed = np.any(np.abs(object_matrices(objs) - before) > 1e-9, axis=1)
+    return [obj for obj, moved in zip(objs, changed) if moved] + recorder.linked
+
+
+def align(objects, axis="X", mode="CENTER", active=None, **properties) -> List[bpy.types.Object]:
+    """Align Objects. ``axes=(True, True, False)`` aligns several axes at once."""
+    return run(ops_align.ALIGNMENT_SUITE_OT_align_objects, objects, active, axis=axis, mode=mode, **properties)
+
+
+def distribute(objects, axis="X", spacing_mode="GAP", **properties) -> List[bpy.types.Object]:
+    return run(ops_distribute.ALIGNMENT_SUITE_OT_distribute_objects, objects, axis=axis, spacing_mode=spacing_mode, **properties)
+
+
+def distribute_by_distance(objects, axis="X", distance=1.0, **properties) -> List[bpy.types.Object]:
+    return run(ops_distribute.ALIGNMENT_SUITE_OT_distribute_by_distance, objects, axis=axis, distance=distance, **properties)
+
+
+def distribute_grid(objects, **properties) -> List[bpy.types.Object]:
+    return run(ops_distribute.ALIGNMENT_SUITE_OT_distribute_grid, objects, **properties)
+
+
+def mirror(objects, axis="X", duplicate=False, active=None, **properties) -> List[bpy.types.Object]:
+    """Mirror Objects; with ``duplicate`` the returned objects are the new copies."""
+    return run(ops_mirror.ALIGNMENT_SUITE_OT_mirror_objects, objects, active, axis=axis, duplicate=duplicate, **properties)
+
+
+def snap(objects, axis="X", target="ACTIVE", active=None, **properties) -> List[bpy.types.Object]:
+    return run(ops_snap.ALIGNMENT_SUITE_OT_snap_minmax_to_minmax, objects, active, axis=axis, target=target, **properties)
+
+
+def snap_to_increment(objects, axis="X", increment=0.1) -> List[bpy.types.Object]:
+    return run(ops_snap.ALIGNMENT_SUITE_OT_snap_to_increment, objects, axis=axis, increment=increment)
+
+
+def space(objects, axis="X", range_min=0.0, range_max=10.0, **properties) -> List[bpy.types.Object]:
+    return run(ops_spacing.ALIGNMENT_SUITE_OT_space_inside, objects, axis=axis, range_min=range_min, range_max=range_max, **properties)
+
+
+def resolve_overlaps(objects, axis="X", gap=0.0, **properties) -> List[bpy.types.Object]:
+    return run(ops_spacing.ALIGNMENT_SUITE_OT_resolve_overlaps, objects, axis=axis, gap=gap, **properties)
@@ -0,0 +1,203 @@
+"""Normalize a directory of .blend files with a pool of background Blenders.
+
+Every worker is one ``blender -b`` process running :mod:`worker`; it stays up
+and is fed one file at a time, so Blender starts once per worker rather than
+once per file. Each result is appended to a JSON-lines log as soon as it
+arrives; running the same command again skips the files already logged as
+done, so an interrupted batch resumes where it stopped::
+
+    python batch/run.py assets/ --jobs 8
+    python batch/run.py assets/ --steps ground,center --output normalized/
+    python batch/run.py assets/ --mock          # no Blender needed
+
+A worker that crashes or hangs past ``--timeout`` is replaced, and the file
+it was on is logged as an error. This script does not need ``bpy``.
+"""
+
+import argparse
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WORKER = os.path.join(HERE, "worker.py")
+sys.path.insert(0, HERE)
+
+from worker import RESULT_PREFIX, STEPS  # noqa: E402
+
+LOG_NAME = "alignment_batch.jsonl"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="folder of .blend files")
+    parser.add_argument("--recursive", action="store_true", help="also process subfolders")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="worker processes (default: half the CPUs)")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or blender)")
+    parser.add_argument("--steps", default="ground,center,snap", help="comma separated steps: " + ", ".join(STEPS))
+    parser.add_argument("--increment", type=float, default=0.01, help="grid size for the snap step")
+    parser.add_argument("--output", help="save into this directory, keeping relative paths, instead of over the inputs (which are first copied to <file>.bak)")
+    parser.add_argument("--log", help=f"progress log (default: {LOG_NAME} in the directory)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="seconds one file may take before its worker is killed")
+    parser.add_argument("--retry-failed", action="store_true", help="process files logged as errors again")
+    parser.add_argument("--mock", action="store_true", help="use the mock worker under this Python instead of Blender")
+    return parser.parse_args(argv)
+
+
+def find_files(directory, recursive):
+    if not recursive:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".blend"))
+        return [os.path.join(directory, name) for name in names]
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        files += [os.path.join(root, name) for name in sorted(names) if name.endswith(".blend")]
+    return files
+
+
+def read_log(path):
+    """Last logged status per file; lines cut short by a crash are ignored."""
+    status = {}
+    if not os.path.exists(path):
+        return status
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            status[entry["file"]] = entry["status"]
+    return status
+
+
+def worker_command(args):
+    options = ["--steps", args.steps, "--increment", str(args.increment), "--root", os.path.abspath(args.directory)]
+    if args.output:
+        options += ["--output", os.path.abspath(args.output)]
+    if args.mock:
+        return [sys.executable, WORKER, "--mock"] + options
+    return [args.blender, "-b", "--factory-startup", "--python-exit-code", "1", "--python", WORKER, "--"] + options
+
+
+class Worker:
+    """One worker process, fed one path at a time."""
+
+    def __init__(self, command):
+        self.command = command
+        self.process = None
+        self.results = queue.Queue()
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self.results = queue.Queue()
+        threading.Thread(target=self._read, args=(self.process, self.results), daemon=True).start()
+
+    @staticmethod
+    def _read(process, results):
+        for line in process.stdout:
+            if line.startswith(RESULT_PREFIX):
+                results.put(json.loads(line[len(RESULT_PREFIX):]))
+        results.put(None)  # the process ended
+
+    def run(self, path, timeout):
+        """Result for ``path``; a crash or timeout restarts the worker and returns an error."""
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+        start = time.perf_counter()
+        try:
+            self.process.stdin.write(path + "\n")
+            self.process.stdin.flush()
+            result = self.results.get(timeout=timeout)
+        except (BrokenPipeError, queue.Empty) as exc:
+            result = None
+            reason = "timed out" if isinstance(exc, queue.Empty) else "worker exited"
+        else:
+            reason = f"worker exited with code {self.process.wait()}" if result is None else None
+        if result is None:
+            self.stop(kill=True)
+            result = {"file": path, "status": "error", "error": reason, "seconds": round(time.perf_counter() - start, 3)}
+        return result
+
+    def stop(self, kill=False):
+        if self.process is None:
+            return
+        if kill:
+            self.process.kill()
+            self.process.wait()
+        elif self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    unknown = [name for name in args.steps.split(",") if name and name not in STEPS]
+    if unknown:
+        print(f"Unknown steps: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if not args.mock and shutil.which(args.blender) is None:
+        print(f"Blender not found: {args.blender} (use --blender or $BLENDER, or --mock)", file=sys.stderr)
+        return 2
+
+    log_path = args.log or os.path.join(args.directory, LOG_NAME)
+    logged = read_log(log_path)
+    skip = {"ok"} if args.retry_failed else {"ok", "error"}
+    files = [os.path.abspath(path) for path in find_files(args.directory, args.recursive)]
+    todo = [path for path in files if logged.get(path) not in skip]
+    print(f"{len(files)} files, {len(files) - len(todo)} already done, {len(todo)} to process with {args.jobs} workers")
+
+    pending = queue.Queue()
+    for path in todo:
+        pending.put(path)
+    lock = threading.Lock()
+    counts = {"ok": 0, "error": 0}
+
+    def work():
+        worker = Worker(worker_command(args))
+        try:
+            while True:
+                try:
+                    path = pending.get_nowait()
+                except queue.Empty:
+                    return
+                result = worker.run(path, args.timeout)
+                with lock:
+                    log.write(json.dumps(result) + "\n")
+                    log.flush()
+                    counts[result["status"]] += 1
+                    done = counts["ok"] + counts["error"]
+                    detail = result.get("error") or f"{result.get('moved', 0)} moved"
+                    print(f"[{done}/{len(todo)}] {result['status']:5} {result['seconds']:7.2f}s  {os.path.relpath(path, args.directory)}  {detail}")
+        finally:
+            worker.stop()
+
+    with open(log_path, "a", encoding="utf-8") as log:
+        threads = [threading.Thread(target=work) for _ in range(min(args.jobs, len(todo)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    print(f"Done: {counts['ok']} ok, {counts['error']} failed; log: {log_path}")
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
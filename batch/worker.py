@@ -0,0 +1,176 @@
+"""Batch worker: normalizes the .blend files named on stdin, one per line.
+
+Started by :mod:`run` inside a background Blender::
+
+    blender -b --factory-startup --python batch/worker.py -- --steps ground,center,snap
+
+For every path it opens the file, runs the steps on the scene's root objects,
+saves, and prints one result line starting with ``RESULT_PREFIX`` followed by
+JSON. Ground and center treat the scene as one asset: they measure the world
+bounds of every object under the roots and move all roots by the same offset,
+so the layout inside the asset is kept. Snap puts each root's location on the
+grid through ``alignment_suite.api``. Without ``--output`` the file is saved
+in place after the original is copied to ``<file>.bak``. Blender's own output can be mixed
+in, so the controller only reads the prefixed lines. With ``--mock`` no
+Blender is needed: files are only read, which lets the controller be tested
+anywhere.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+import traceback
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ADDON_ROOT = os.path.dirname(HERE)
+PACKAGE_NAME = "alignment_suite"
+
+RESULT_PREFIX = "@@alignment-batch "
+BACKUP_SUFFIX = ".bak"
+
+STEPS = ("ground", "center", "snap")
+SNAP_AXES = ("X", "Y", "Z")
+# Lights and cameras are part of the scene, not of the asset
+SKIPPED_TYPES = {"LIGHT", "CAMERA", "SPEAKER", "LIGHT_PROBE"}
+# Objects whose bounds are only their origin do not count towards the asset's bounds
+UNMEASURED_TYPES = SKIPPED_TYPES | {"EMPTY"}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", default="ground,center,snap", help="comma separated steps: " + ", ".join(STEPS))
+    parser.add_argument("--increment", type=float, default=0.01, help="grid size for the snap step")
+    parser.add_argument("--output", help="save into this directory instead of over the input files (backed up to <file>.bak)")
+    parser.add_argument("--root", help="input directory, to keep relative paths under --output")
+    parser.add_argument("--mock", action="store_true", help="do not use Blender; only read each file")
+    args = parser.parse_args(argv)
+    args.steps = [name for name in args.steps.split(",") if name]
+    unknown = [name for name in args.steps if name not in STEPS]
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(unknown)}")
+    return args
+
+
+def output_path(path, args):
+    if not args.output:
+        return path
+    relative = os.path.relpath(path, args.root) if args.root else os.path.basename(path)
+    return os.path.join(args.output, relative)
+
+
+def load_addon():
+    """Import the add-on from this checkout without enabling it."""
+    if PACKAGE_NAME in sys.modules:
+        return sys.modules[PACKAGE_NAME]
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME, os.path.join(ADDON_ROOT, "__init__.py"), submodule_search_locations=[ADDON_ROOT]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def shared_offset(step, mins, maxs):
+    """World offset that grounds or centers the box ``mins``..``maxs`` as a whole."""
+    offset = [0.0, 0.0, 0.0]
+    if step == "ground":
+        offset[2] = -mins[2]
+    else:
+        offset[0] = -0.5 * (mins[0] + maxs[0])
+        offset[1] = -0.5 * (mins[1] + maxs[1])
+    return offset
+
+
+def move_asset(step, roots):
+    """Run ``step`` on the asset under ``roots``; True if it moved."""
+    import bpy
+
+    from alignment_suite.utils import TransformBatch, world_bounds_array
+
+    objs = [obj for root in roots for obj in (root, *root.children_recursive)]
+    measured = [obj for obj in objs if obj.type not in UNMEASURED_TYPES] or objs
+    mins, maxs = world_bounds_array(measured, exact=True)
+    offset = shared_offset(step, mins.min(axis=0), maxs.max(axis=0))
+    if max(abs(value) for value in offset) < 1e-9:
+        return False
+    batch = TransformBatch()
+    for root in roots:
+        batch.offset_world(root, offset)
+    batch.flush(bpy.context)
+    return True
+
+
+def process(path, args):
+    """Normalize one file in Blender; returns the result fields."""
+    import bpy
+
+    from alignment_suite import api
+
+    bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+    roots = [obj for obj in bpy.context.view_layer.objects if obj.parent is None and obj.type not in SKIPPED_TYPES]
+    moved = set()
+    for step in args.steps:
+        if not roots:
+            break
+        if step == "snap":
+            for axis in SNAP_AXES:
+                moved.update(obj.name for obj in api.snap_to_increment(roots, axis=axis, increment=args.increment))
+        elif move_asset(step, roots):
+            moved.update(obj.name for obj in roots)
+    target = output_path(path, args)
+    result = {"objects": len(roots), "moved": len(moved), "output": target}
+    if target == path:
+        # Keep the first original; a rerun must not back up an already normalized file
+        backup = path + BACKUP_SUFFIX
+        if not os.path.exists(backup):
+            shutil.copy2(path, backup)
+        result["backup"] = backup
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=target, copy=target != path)
+    return result
+
+
+def process_mock(path, args):
+    """Stand-in for :func:`process`: reads the file, saves nothing."""
+    with open(path, "rb") as fh:
+        size = len(fh.read())
+    name = os.path.basename(path)
+    if "crash" in name:
+        os._exit(3)  # simulate Blender dying mid-file
+    if "fail" in name:
+        raise RuntimeError("mock failure")
+    if "hang" in name:
+        time.sleep(3600)
+    return {"objects": 0, "moved": 0, "bytes": size, "output": output_path(path, args)}
+
+
+def main(argv):
+    args = parse_args(argv)
+    if not args.mock:
+        load_addon()
+
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+        start = time.perf_counter()
+        result = {"file": path}
+        try:
+            result.update(process_mock(path, args) if args.mock else process(path, args))
+            result["status"] = "ok"
+        except Exception as exc:  # report and keep going with the next file
+            result.update(status="error", error=f"{type(exc).__name__}: {exc}", traceback=traceback.format_exc(limit=5))
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    # Blender passes the script's own arguments after "--"
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,367 @@
+"""Headless benchmarks for the Alignment Suite hot paths.
+
+Runs ``utils`` helpers and every registered operator's ``execute`` against the
+stand-in ``bpy``/``bmesh``/``mathutils`` from :mod:`standin`, on synthetic
+scenes, and reports wall time and peak Python memory per case::
+
+    python benchmarks/run.py
+    python benchmarks/run.py --objects 10 1000 100000 --verts 1000000
+    python benchmarks/run.py --only distribute --json results.json
+
+Absolute numbers are not Blender's; compare runs against each other to catch
+regressions such as a second bounds pass sneaking back into an operator.
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import numpy as np  # noqa: E402
+
+import standin  # noqa: E402
+
+bpy = standin.install()
+
+PACKAGE_NAME = "alignment_suite"
+
+
+def load_addon():
+    """Import and register the add-on; ``api`` is imported too, like a script would."""
+    root = os.path.dirname(HERE)
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME, os.path.join(root, "__init__.py"), submodule_search_locations=[root]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE_NAME] = module
+    spec.loader.exec_module(module)
+    module.register()
+    importlib.import_module(PACKAGE_NAME + ".api")
+    return module
+
+
+# Startup is timed in fresh interpreters, since this one has NumPy loaded
+# already. The stand-in imports NumPy itself, so the add-on's import and
+# register are timed with NumPy present; what deferring it saves is the NumPy
+# import on its own, which a Blender start paid before the first operator.
+STARTUP_SCRIPTS = {
+    "numpy import, deferred from startup to the first operator": """
+import json, time
+start = time.perf_counter()
+import numpy
+print(json.dumps((time.perf_counter() - start) * 1000.0))
+""",
+    "addon import + register (stand-in bpy)": """
+import importlib.util, json, os, sys
+sys.path.insert(0, {here!r})
+import standin
+standin.install()
+import time
+start = time.perf_counter()
+root = os.path.dirname({here!r})
+spec = importlib.util.spec_from_file_location({package!r}, os.path.join(root, "__init__.py"), submodule_search_locations=[root])
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+module.register()
+print(json.dumps((time.perf_counter() - start) * 1000.0))
+""",
+}
+STARTUP_RUNS = 5
+
+
+def startup_time(script):
+    """Median milliseconds reported by ``script`` over fresh interpreters."""
+    script = script.format(here=HERE, package=PACKAGE_NAME)
+    return statistics.median(
+        json.loads(subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout)
+        for _ in range(STARTUP_RUNS)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Synthetic scenes
+# ---------------------------------------------------------------------------
+
+
+def object_scene(count, seed=0):
+    """``count`` selected cubes with random location, rotation and scale."""
+    ctx = standin.reset_scene()
+    rng = np.random.default_rng(seed)
+    cube = standin.Mesh("Cube", [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+    locs = rng.uniform(-100.0, 100.0, (count, 3))
+    rots = rng.uniform(-3.0, 3.0, (count, 3))
+    scales = rng.uniform(0.5, 2.0, (count, 3))
+    for i in range(count):
+        obj = bpy.data.objects.new(f"Cube.{i:06d}", cube)
+        ctx.scene.collection.objects.link(obj)
+        obj.location = locs[i]
+        obj.rotation_euler = standin.Euler(rots[i])
+        obj.scale = scales[i]
+        obj.select_set(True)
+    if count:
+        ctx.view_layer.objects.active = bpy.data.objects[0]
+    return ctx
+
+
+def path_scene(count, seed=0):
+    """``count`` selected cubes plus an active, selected poly curve winding through them."""
+    ctx = object_scene(count, seed)
+    t = np.linspace(0.0, 4.0 * np.pi, 500)
+    curve = standin.Curve("Path", np.column_stack((t * 8.0, 50.0 * np.sin(t), np.zeros_like(t))))
+    obj = bpy.data.objects.new("Path", curve)
+    ctx.scene.collection.objects.link(obj)
+    obj.select_set(True)
+    ctx.view_layer.objects.active = obj
+    return ctx
+
+
+RECIPE_STEPS = (
+    ("alignment_suite.align_objects", {"axis": "Z", "mode": "WORLD", "use_bounds": True, "which_bound": "MIN"}),
+    ("alignment_suite.distribute_objects", {"axis": "X", "spacing_mode": "GAP"}),
+    ("alignment_suite.snap_to_increment", {"axis": "X", "increment": 0.5}),
+)
+
+
+def recipe_scene(count, seed=0):
+    """object_scene() with a recipe named "Bench" made of RECIPE_STEPS."""
+    ctx = object_scene(count, seed)
+    recipe = ctx.scene.alignment_suite.recipes.add()
+    recipe.name = "Bench"
+    for idname, props in RECIPE_STEPS:
+        step = recipe.steps.add()
+        step.operator = idname
+        step.label = idname
+        step.properties = json.dumps(props)
+    return ctx
+
+
+def edit_mesh_scene(verts, seed=0, shape_keys=False):
+    """One mesh in Edit Mode with ``verts`` vertices, half of them selected."""
+    ctx = standin.reset_scene()
+    rng = np.random.default_rng(seed)
+    me = standin.Mesh("Scan", rng.normal(size=(verts, 3)), rng.random(verts) < 0.5)
+    if shape_keys:
+        me.shape_keys = object()  # forces the per-vertex fallback path
+    obj = bpy.data.objects.new("Scan", me)
+    ctx.scene.collection.objects.link(obj)
+    obj.location = (1.0, 2.0, 3.0)
+    obj.select_set(True)
+    ctx.view_layer.objects.active = obj
+    ctx.mode = "EDIT_MESH"
+    ctx.edit_object = obj
+    return ctx
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+# Extra property sets per operator; operators not listed run once with defaults.
+OPERATOR_CASES = {
+    "alignment_suite.align_objects": [
+        {"axis": "X", "mode": "CENTER"},
+        {"axis": "Z", "mode": "MIN", "use_bounds": True, "which_bound": "MIN"},
+        {"axes": (True, True, True), "mode": "CENTER", "use_bounds": True},
+    ],
+    "alignment_suite.distribute_objects": [
+        {"axis": "X", "spacing_mode": "GAP"},
+        {"axis": "X", "spacing_mode": "CENTER"},
+    ],
+    "alignment_suite.distribute_by_distance": [
+        {"axis": "Y", "distance_mode": "GAP", "distance": 0.5},
+    ],
+    "alignment_suite.space_inside": [
+        {"axis": "X", "mode": "GAP", "range_min": 0.0, "range_max": 1000.0},
+    ],
+    "alignment_suite.distribute_grid": [
+        {"mode": "SHELF", "gap": 0.1},
+    ],
+    "alignment_suite.distribute_along_path": [
+        {"spacing_mode": "CENTER", "align_rotation": True},
+        {"spacing_mode": "GAP"},
+    ],
+    "alignment_suite.distribute_circle": [
+        {"center_mode": "WORLD", "radius": 50.0, "face_center": True},
+    ],
+    "alignment_suite.recipe_run": [
+        {"recipe": "Bench"},
+    ],
+    "alignment_suite.resolve_overlaps": [
+        {"axis": "X", "gap": 0.1},
+    ],
+    "alignment_suite.mirror_objects": [
+        {"duplicate": False},
+        {"duplicate": True, "duplicate_data": "UNIQUE"},
+    ],
+    "alignment_suite.snap_minmax_to_minmax": [
+        {"axis": "X", "target": "ACTIVE"},
+        {"axis": "X", "target": "NEIGHBOR"},
+    ],
+}
+
+# Operators that need something other than object_scene()
+SCENES = {
+    "alignment_suite.distribute_along_path": path_scene,
+    "alignment_suite.recipe_run": recipe_scene,
+}
+
+# Bookkeeping operators that do not touch the scene's objects
+NOT_TIMED = {
+    "alignment_suite.export_profile",
+    "alignment_suite.clear_profile",
+    "alignment_suite.recipe_record",
+    "alignment_suite.recipe_remove",
+}
+
+EDIT_MODE_OPERATORS = {
+    "alignment_suite.align_mesh_verts": [{"axis": "X", "mode": "MIN"}],
+    "alignment_suite.mirror_mesh": [{"axis": "X", "plane_origin_mode": "SELECTION"}],
+}
+
+
+def utils_cases(addon, count):
+    utils = addon.utils
+    yield "utils.world_bounds_array", lambda: object_scene(count), lambda ctx: utils.world_bounds_array(ctx.selected_objects)
+    yield "utils.world_bounds_array[exact]", lambda: object_scene(count), lambda ctx: utils.world_bounds_array(ctx.selected_objects, exact=True)
+    yield "utils.axis_snapshot", lambda: object_scene(count), lambda ctx: utils.axis_snapshot(ctx.selected_objects, "X")
+    # One drag step of the interactive operators, after the snapshot is taken
+    yield "api.align", lambda: object_scene(count), lambda ctx: addon.api.align(ctx.selected_objects, axis="Z", mode="MIN")
+    # The same chain as recipe_run, one operator at a time
+    yield "recipe steps run separately", lambda: object_scene(count), _run_steps
+    yield "modal.AxisMovePreview.apply", lambda: _preview_scene(addon, count), lambda ctx: ctx.preview.apply(0.5)
+    # distribute_objects written in 1000-object slices, as after invoke on a huge selection
+    yield "distribute_objects chunked", lambda: object_scene(count), lambda ctx: _run_chunked(addon, ctx)
+
+
+def _run_steps(ctx):
+    for idname, props in RECIPE_STEPS:
+        _operator_runner(standin._ClassRegistry.classes[idname], props)(ctx)
+
+
+def _run_chunked(addon, ctx):
+    cls = standin._ClassRegistry.classes["alignment_suite.distribute_objects"]
+    job = cls.chunked_job(addon.utils.ExecuteProxy(cls, {"axis": "X", "spacing_mode": "GAP"}), ctx)
+    while job.done < job.total:
+        job.step(1000, ctx)
+    job.finish(ctx)
+
+
+def _preview_scene(addon, count):
+    ctx = object_scene(count)
+    ctx.preview = addon.modal.AxisMovePreview(ctx.selected_objects, 0, np.zeros(count), np.ones(count))
+    return ctx
+
+
+def operator_cases(count):
+    for idname, cls in sorted(standin._ClassRegistry.classes.items()):
+        if not idname.startswith(PACKAGE_NAME + ".") or idname in EDIT_MODE_OPERATORS or idname in NOT_TIMED:
+            continue
+        scene = SCENES.get(idname, object_scene)
+        for props in OPERATOR_CASES.get(idname, [{}]):
+            label = idname + _props_label(props)
+            yield label, lambda scene=scene: scene(count), _operator_runner(cls, props)
+
+
+def edit_mode_cases(verts):
+    for idname, prop_sets in EDIT_MODE_OPERATORS.items():
+        cls = standin._ClassRegistry.classes.get(idname)
+        if cls is None:
+            continue
+        for props in prop_sets:
+            label = idname + _props_label(props)
+            yield label, lambda: edit_mesh_scene(verts), _operator_runner(cls, props)
+            yield label + "[bmesh]", lambda: edit_mesh_scene(verts, shape_keys=True), _operator_runner(cls, props)
+
+
+def _props_label(props):
+    return "(" + ", ".join(f"{k}={v}" for k, v in props.items()) + ")" if props else ""
+
+
+def _operator_runner(cls, props):
+    def run(ctx):
+        if not cls.poll(ctx):
+            raise RuntimeError("poll() failed")
+        return standin.run_operator(cls, context=ctx, **props)
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def measure(build, run, with_memory=True):
+    ctx = build()
+    gc.collect()
+    start = time.perf_counter()
+    run(ctx)
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if with_memory:
+        ctx = build()
+        gc.collect()
+        tracemalloc.start()
+        run(ctx)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, nargs="+", default=[10, 1000, 10000], help="object counts for object-mode cases")
+    parser.add_argument("--verts", type=int, nargs="+", default=[100000], help="vertex counts for edit-mode cases")
+    parser.add_argument("--only", default="", help="run only cases whose name contains this text")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass (halves the run time)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    addon = load_addon()
+    plans = []
+    for count in args.objects:
+        plans += [(name, count, build, run) for name, build, run in utils_cases(addon, count)]
+        plans += [(name, count, build, run) for name, build, run in operator_cases(count)]
+    for verts in args.verts:
+        plans += [(name, verts, build, run) for name, build, run in edit_mode_cases(verts)]
+
+    results = []
+    print(f"{'case':<90} {'size':>9} {'time ms':>10} {'peak MB':>9}")
+    for name, script in STARTUP_SCRIPTS.items():
+        if args.only and args.only not in name:
+            continue
+        elapsed_ms = startup_time(script)
+        print(f"{name:<90} {STARTUP_RUNS:>9} {elapsed_ms:>10.1f} {'-':>9}")
+        results.append({"case": name, "size": STARTUP_RUNS, "seconds": elapsed_ms / 1000.0, "peak_bytes": None})
+    for name, size, build, run in plans:
+        if args.only and args.only not in name:
+            continue
+        try:
+            elapsed, peak = measure(build, run, not args.no_memory)
+        except Exception as exc:  # keep going; a broken case should not hide the others
+            print(f"{name:<90} {size:>9} {'error':>10}  {exc}")
+            results.append({"case": name, "size": size, "error": str(exc)})
+            continue
+        peak_mb = "-" if peak is None else f"{peak / 2**20:.1f}"
+        print(f"{name:<90} {size:>9} {elapsed * 1000.0:>10.1f} {peak_mb:>9}")
+        results.append({"case": name, "size": size, "seconds": elapsed, "peak_bytes": peak})
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1482 @@
+"""Lightweight stand-ins for ``bpy``, ``bmesh`` and ``mathutils``.
+
+Only the API surface the add-on touches is modelled, closely enough that
+each operator's ``execute`` runs unchanged. Geometry lives in NumPy arrays
+so synthetic meshes of millions of vertices stay cheap to build, while
+per-element access (``BMVert``, ``Vector``) stays as slow as pure Python,
+which keeps loop-heavy code paths honest in the benchmark numbers.
+
+Call :func:`install` before importing the add-on package.
+"""
+
+import math
+import sys
+import types
+from itertools import count
+from typing import Dict, Optional
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------------
+# mathutils
+# ---------------------------------------------------------------------------
+
+
+class Vector:
+    __slots__ = ("_v",)
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._v = [float(c) for c in seq]
+
+    def __len__(self):
+        return len(self._v)
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Vector(self._v[i])
+        return self._v[i]
+
+    def __setitem__(self, i, value):
+        self._v[i] = float(value)
+
+    def __repr__(self):
+        return f"Vector({tuple(self._v)})"
+
+    def __eq__(self, other):
+        try:
+            return len(other) == len(self._v) and all(a == b for a, b in zip(self._v, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def _get(i):
+        return property(lambda self: self._v[i], lambda self, value: self.__setitem__(i, value))
+
+    x = _get(0)
+    y = _get(1)
+    z = _get(2)
+    w = _get(3)
+    del _get
+
+    def copy(self):
+        return Vector(self._v)
+
+    def __add__(self, other):
+        return Vector([a + b for a, b in zip(self._v, other)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return Vector([a - b for a, b in zip(self._v, other)])
+
+    def __rsub__(self, other):
+        return Vector([b - a for a, b in zip(self._v, other)])
+
+    def __iadd__(self, other):
+        self._v = [a + b for a, b in zip(self._v, other)]
+        return self
+
+    def __isub__(self, other):
+        self._v = [a - b for a, b in zip(self._v, other)]
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return Vector([a * other for a in self._v])
+        return Vector([a * b for a, b in zip(self._v, other)])
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        result = self * other
+        self._v = result._v
+        return self
+
+    def __truediv__(self, other):
+        return Vector([a / other for a in self._v])
+
+    def __neg__(self):
+        return Vector([-a for a in self._v])
+
+    def __matmul__(self, other):
+        if isinstance(other, Vector):
+            return self.dot(other)
+        return NotImplemented
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._v, other))
+
+    def cross(self, other):
+        ax, ay, az = self._v[:3]
+        bx, by, bz = list(other)[:3]
+        return Vector((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+    @property
+    def length_squared(self):
+        return sum(a * a for a in self._v)
+
+    @property
+    def length(self):
+        return math.sqrt(self.length_squared)
+
+    def normalized(self):
+        ln = self.length
+        return Vector(self._v) if ln == 0.0 else self / ln
+
+    def to_3d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3])
+
+    def to_4d(self):
+        return Vector(self.to_3d()._v + [1.0])
+
+    def to_track_quat(self, track="Y", up="Z"):
+        axes = {"X": 0, "Y": 1, "Z": 2, "-X": 0, "-Y": 1, "-Z": 2}
+        fwd = self.normalized()
+        if track.startswith("-"):
+            fwd = -fwd
+        ti, ui = axes[track], axes[up]
+        up_vec = Vector((0.0, 0.0, 0.0))
+        up_vec[ui] = 1.0
+        side = up_vec - fwd * fwd.dot(up_vec)
+        if side.length_squared < 1e-12:
+            alt = Vector((0.0, 0.0, 0.0))
+            alt[(ui + 1) % 3] = 1.0
+            side = alt - fwd * fwd.dot(alt)
+        side = side.normalized()
+        third = fwd.cross(side) if (ui - ti) % 3 == 1 else side.cross(fwd)
+        cols = [None, None, None]
+        cols[ti] = fwd
+        cols[ui] = side
+        cols[3 - ti - ui] = third
+        rot = Matrix([[cols[c][r] for c in range(3)] for r in range(3)])
+        return rot.to_quaternion()
+
+
+class Matrix:
+    __slots__ = ("_m",)
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if r == c else 0.0 for c in range(4)] for r in range(4)]
+        self._m = [[float(c) for c in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[1.0 if r == c else 0.0 for c in range(size)] for r in range(size)])
+
+    @classmethod
+    def Translation(cls, vec):
+        m = cls.Identity(4)
+        for i in range(3):
+            m._m[i][3] = float(vec[i])
+        return m
+
+    @classmethod
+    def Scale(cls, factor, size, axis=None):
+        m = cls.Identity(size)
+        for i in range(min(size, 3)):
+            if axis is None:
+                m._m[i][i] = float(factor)
+            else:
+                # Scale along an arbitrary unit axis: I + (f - 1) * a a^T
+                for j in range(min(size, 3)):
+                    m._m[i][j] += (factor - 1.0) * axis[i] * axis[j]
+        return m
+
+    @classmethod
+    def Rotation(cls, angle, size, axis):
+        c, s = math.cos(angle), math.sin(angle)
+        idx = {"X": 0, "Y": 1, "Z": 2}[axis] if isinstance(axis, str) else None
+        m = cls.Identity(size)
+        if idx is None:
+            raise NotImplementedError("Stand-in Matrix.Rotation only supports named axes")
+        a, b = [(1, 2), (2, 0), (0, 1)][idx]
+        m._m[a][a], m._m[a][b] = c, -s
+        m._m[b][a], m._m[b][b] = s, c
+        return m
+
+    def __len__(self):
+        return len(self._m)
+
+    def __iter__(self):
+        return (Vector(row) for row in self._m)
+
+    def __getitem__(self, i):
+        return Vector(self._m[i])
+
+    def __setitem__(self, i, row):
+        self._m[i] = [float(c) for c in row]
+
+    def __repr__(self):
+        return f"Matrix({self._m})"
+
+    def copy(self):
+        return Matrix(self._m)
+
+    def __matmul__(self, other):
+        n = len(self._m)
+        if isinstance(other, Matrix):
+            o = other._m
+            return Matrix([[sum(self._m[r][k] * o[k][c] for k in range(n)) for c in range(len(o[0]))] for r in range(n)])
+        vec = list(other)
+        if n == 4 and len(vec) == 3:
+            m = self._m
+            return Vector([m[r][0] * vec[0] + m[r][1] * vec[1] + m[r][2] * vec[2] + m[r][3] for r in range(3)])
+        return Vector([sum(self._m[r][k] * vec[k] for k in range(n)) for r in range(n)])
+
+    @property
+    def translation(self):
+        return Vector([self._m[r][3] for r in range(3)])
+
+    @translation.setter
+    def translation(self, vec):
+        for r in range(3):
+            self._m[r][3] = float(vec[r])
+
+    def to_3x3(self):
+        return Matrix([row[:3] for row in self._m[:3]])
+
+    def to_4x4(self):
+        m = Matrix.Identity(4)
+        for r in range(min(3, len(self._m))):
+            for c in range(min(3, len(self._m))):
+                m._m[r][c] = self._m[r][c]
+        if len(self._m) == 4:
+            return self.copy()
+        return m
+
+    def transposed(self):
+        return Matrix([list(col) for col in zip(*self._m)])
+
+    def inverted(self):
+        inv = np.linalg.inv(np.array(self._m))
+        return Matrix(inv.tolist())
+
+    def inverted_safe(self):
+        try:
+            return self.inverted()
+        except np.linalg.LinAlgError:
+            return Matrix.Identity(len(self._m))
+
+    def to_scale(self):
+        return Vector([math.sqrt(sum(self._m[r][c] ** 2 for r in range(3))) for c in range(3)])
+
+    def to_quaternion(self):
+        m = np.array([row[:3] for row in self._m[:3]], dtype=float)
+        scale = np.linalg.norm(m, axis=0)
+        scale[scale == 0.0] = 1.0
+        m = m / scale
+        tr = m[0, 0] + m[1, 1] + m[2, 2]
+        if tr > 0.0:
+            s = math.sqrt(tr + 1.0) * 2.0
+            return Quaternion(((0.25 * s), (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s))
+        if m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+            s = math.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2.0
+            return Quaternion(((m[2, 1] - m[1, 2]) / s, 0.25 * s, (m[0, 1] + m[1, 0]) / s, (m[0, 2] + m[2, 0]) / s))
+        if m[1, 1] > m[2, 2]:
+            s = math.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2.0
+            return Quaternion(((m[0, 2] - m[2, 0]) / s, (m[0, 1] + m[1, 0]) / s, 0.25 * s, (m[1, 2] + m[2, 1]) / s))
+        s = math.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2.0
+        return Quaternion(((m[1, 0] - m[0, 1]) / s, (m[0, 2] + m[2, 0]) / s, (m[1, 2] + m[2, 1]) / s, 0.25 * s))
+
+    def to_euler(self, order="XYZ", compat=None):
+        return self.to_quaternion().to_euler(order, compat)
+
+    def decompose(self):
+        return self.translation, self.to_quaternion(), self.to_scale()
+
+
+class Quaternion:
+    __slots__ = ("_q",)
+
+    def __init__(self, seq=(1.0, 0.0, 0.0, 0.0)):
+        self._q = [float(c) for c in seq]
+
+    def __iter__(self):
+        return iter(self._q)
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return self._q[i]
+
+    def copy(self):
+        return Quaternion(self._q)
+
+    def inverted(self):
+        w, x, y, z = self._q
+        n = w * w + x * x + y * y + z * z
+        return Quaternion((w / n, -x / n, -y / n, -z / n))
+
+    def __matmul__(self, other):
+        w1, x1, y1, z1 = self._q
+        w2, x2, y2, z2 = other
+        return Quaternion((
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        ))
+
+    def to_matrix(self):
+        w, x, y, z = self._q
+        return Matrix([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ])
+
+    def to_euler(self, order="XYZ", compat=None):
+        m = self.to_matrix()._m
+        sy = -m[2][0]
+        y = math.asin(max(-1.0, min(1.0, sy)))
+        if abs(sy) < 0.999999:
+            x = math.atan2(m[2][1], m[2][2])
+            z = math.atan2(m[1][0], m[0][0])
+        else:
+            x = math.atan2(-m[1][2], m[1][1])
+            z = 0.0
+        return Euler((x, y, z), order)
+
+    def to_axis_angle(self):
+        w, x, y, z = self._q
+        angle = 2.0 * math.acos(max(-1.0, min(1.0, w)))
+        s = math.sqrt(max(0.0, 1.0 - w * w))
+        axis = Vector((x / s, y / s, z / s)) if s > 1e-12 else Vector((0.0, 0.0, 1.0))
+        return axis, angle
+
+
+class Euler:
+    __slots__ = ("_e", "order")
+
+    def __init__(self, seq=(0.0, 0.0, 0.0), order="XYZ"):
+        self._e = [float(c) for c in seq]
+        self.order = order
+
+    def __iter__(self):
+        return iter(self._e)
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, i):
+        return self._e[i]
+
+    def __setitem__(self, i, value):
+        self._e[i] = float(value)
+
+    def copy(self):
+        return Euler(self._e, self.order)
+
+    def to_matrix(self):
+        x, y, z = self._e
+        rx = Matrix.Rotation(x, 3, "X")
+        ry = Matrix.Rotation(y, 3, "Y")
+        rz = Matrix.Rotation(z, 3, "Z")
+        return rz @ ry @ rx
+
+    def to_quaternion(self):
+        return self.to_matrix().to_quaternion()
+
+
+class KDTree:
+    def __init__(self, size):
+        self._co = np.zeros((size, 3))
+        self._n = 0
+
+    def insert(self, co, index):
+        self._co[index] = list(co)[:3]
+        self._n = max(self._n, index + 1)
+
+    def balance(self):
+        pass
+
+    def find(self, co):
+        d = np.linalg.norm(self._co[: self._n] - np.asarray(list(co)[:3]), axis=1)
+        i = int(np.argmin(d))
+        return Vector(self._co[i]), i, float(d[i])
+
+
+def _build_mathutils():
+    mod = types.ModuleType("mathutils")
+    mod.Vector = Vector
+    mod.Matrix = Matrix
+    mod.Quaternion = Quaternion
+    mod.Euler = Euler
+    kd = types.ModuleType("mathutils.kdtree")
+    kd.KDTree = KDTree
+    mod.kdtree = kd
+    geometry = types.ModuleType("mathutils.geometry")
+    geometry.convex_hull_2d = lambda points: list(range(len(points)))
+    mod.geometry = geometry
+    return mod, kd, geometry
+
+
+# ---------------------------------------------------------------------------
+# bpy.props / bpy.types
+# ---------------------------------------------------------------------------
+
+
+class _Prop:
+    def __init__(self, kind, kwargs):
+        self.kind = kind
+        self.kwargs = kwargs
+        # Same shape as Blender's _PropertyDeferred
+        self.function = types.SimpleNamespace(__name__=kind)
+        self.keywords = kwargs
+
+    def __get__(self, instance, owner):
+        # Assigned on a class at runtime (``bpy.types.Scene.foo = ...``):
+        # materialise the default on first access.
+        if instance is None:
+            return self
+        for name, value in vars(owner).items():
+            if value is self:
+                default = self.default()
+                instance.__dict__[name] = default
+                return default
+        return self
+
+    def default(self):
+        if self.kind == "PointerProperty":
+            return self.kwargs["type"]()
+        if self.kind == "CollectionProperty":
+            return _Collection(self.kwargs["type"])
+        if "default" in self.kwargs:
+            value = self.kwargs["default"]
+            return list(value) if isinstance(value, (tuple, list)) else value
+        if self.kind == "EnumProperty":
+            items = self.kwargs.get("items") or [("", "", "")]
+            return items[0][0] if not callable(items) else ""
+        size = self.kwargs.get("size")
+        base = {"BoolProperty": False, "IntProperty": 0, "FloatProperty": 0.0, "StringProperty": "",
+                "BoolVectorProperty": False, "FloatVectorProperty": 0.0, "IntVectorProperty": 0}.get(self.kind)
+        if size:
+            return [base] * size
+        return base
+
+
+def _prop_factory(kind):
+    def make(**kwargs):
+        return _Prop(kind, kwargs)
+
+    make.__name__ = kind
+    return make
+
+
+class _Collection(list):
+    def __init__(self, item_type=None):
+        super().__init__()
+        self._item_type = item_type
+
+    def add(self):
+        item = self._item_type()
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def clear(self):
+        del self[:]
+
+    def find(self, key):
+        for i, item in enumerate(self):
+            if getattr(item, "name", None) == key:
+                return i
+        return -1
+
+    def get(self, key, default=None):
+        index = self.find(key)
+        return self[index] if index >= 0 else default
+
+
+def _declared_props(cls):
+    props = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in getattr(klass, "__annotations__", {}).items():
+            if isinstance(value, _Prop):
+                props[name] = value
+    return props
+
+
+class _PropertyOwner:
+    """Instances get per-instance defaults for every annotated bpy.props property."""
+
+    def __init__(self):
+        for name, prop in _declared_props(type(self)).items():
+            object.__setattr__(self, name, prop.default())
+
+
+class _OperatorProperties:
+    def __init__(self, op):
+        self._op = op
+        self._set = set()
+
+    def is_property_set(self, name):
+        return name in self._set
+
+
+class Operator(_PropertyOwner):
+    bl_options = set()
+
+    def __init__(self):
+        super().__init__()
+        self.properties = _OperatorProperties(self)
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((set(level), message))
+
+
+class Panel:
+    def __init__(self):
+        self.layout = _Layout()
+
+
+class Menu(Panel):
+    pass
+
+
+class UIList(Panel):
+    pass
+
+
+class AddonPreferences(_PropertyOwner):
+    pass
+
+
+class PropertyGroup(_PropertyOwner):
+    pass
+
+
+class _Layout:
+    """Records calls so that panel ``draw`` methods can be timed."""
+
+    def __init__(self):
+        self.calls = 0
+        self.use_property_split = False
+        self.use_property_decorate = False
+        self.enabled = True
+        self.active = True
+        self.alert = False
+        self.scale_y = 1.0
+
+    def _child(self, *args, **kwargs):
+        self.calls += 1
+        return self
+
+    column = row = box = split = grid_flow = column_flow = _child
+
+    def operator(self, idname, **kwargs):
+        self.calls += 1
+        return types.SimpleNamespace()
+
+    def prop(self, *args, **kwargs):
+        self.calls += 1
+
+    def panel(self, idname, default_closed=False):
+        self.calls += 1
+        return self, self
+
+    label = separator = template_list = prop_enum = menu = progress = _child
+    operator_menu_enum = prop_search = _child
+
+
+class _Scene(_PropertyOwner):
+    def __init__(self):
+        super().__init__()
+        self.cursor = types.SimpleNamespace(location=Vector((0.0, 0.0, 0.0)))
+        self.collection = _SceneCollection()
+
+
+class _SceneCollection:
+    def __init__(self):
+        self.objects = _CollectionObjects()
+
+
+class _CollectionObjects(list):
+    def link(self, obj):
+        if obj in self:
+            raise RuntimeError(f"Object '{obj.name}' already in collection")
+        self.append(obj)
+        obj._linked = True
+
+    def unlink(self, obj):
+        self.remove(obj)
+        obj._linked = False
+
+
+class _ClassRegistry:
+    classes: Dict[str, type] = {}
+
+
+def _build_bpy_types():
+    mod = types.ModuleType("bpy.types")
+    mod.Operator = Operator
+    mod.Panel = Panel
+    mod.Menu = Menu
+    mod.UIList = UIList
+    mod.AddonPreferences = AddonPreferences
+    mod.PropertyGroup = PropertyGroup
+    mod.Scene = _Scene
+    mod.Object = Object
+    mod.Mesh = Mesh
+    mod.Context = Context
+    mod.Depsgraph = Depsgraph
+    mod.Collection = _SceneCollection
+    mod.WindowManager = _WindowManager
+    mod.Event = types.SimpleNamespace
+    return mod
+
+
+# ---------------------------------------------------------------------------
+# Data: meshes, objects, collections
+# ---------------------------------------------------------------------------
+
+
+_uid = count(1)
+
+
+class _MeshVertex:
+    __slots__ = ("_me", "index")
+
+    def __init__(self, me, index):
+        self._me = me
+        self.index = index
+
+    @property
+    def co(self):
+        return Vector(self._me._co[self.index])
+
+    @co.setter
+    def co(self, value):
+        self._me._co[self.index] = list(value)[:3]
+        self._me._bbox = None
+
+    @property
+    def select(self):
+        return bool(self._me._sel[self.index])
+
+    @select.setter
+    def select(self, value):
+        self._me._sel[self.index] = bool(value)
+
+
+class _MeshVertices:
+    def __init__(self, me):
+        self._me = me
+
+    def __len__(self):
+        return len(self._me._co)
+
+    def __iter__(self):
+        return (_MeshVertex(self._me, i) for i in range(len(self._me._co)))
+
+    def __getitem__(self, i):
+        return _MeshVertex(self._me, i)
+
+    def foreach_get(self, attr, buf):
+        src = {"co": self._me._co, "select": self._me._sel, "hide": np.zeros(len(self._me._co), dtype=bool)}[attr]
+        buf[:] = src.ravel().astype(buf.dtype)
+
+    def foreach_set(self, attr, buf):
+        if attr == "co":
+            self._me._co[:] = np.asarray(buf, dtype=float).reshape(-1, 3)
+            self._me._bbox = None
+        elif attr == "select":
+            self._me._sel[:] = np.asarray(buf, dtype=bool)
+        else:
+            raise AttributeError(attr)
+
+    def add(self, n):
+        self._me._co = np.vstack([self._me._co, np.zeros((n, 3))])
+        self._me._sel = np.concatenate([self._me._sel, np.zeros(n, dtype=bool)])
+
+
+class _EmptyElems(list):
+    def foreach_get(self, attr, buf):
+        pass
+
+    def foreach_set(self, attr, buf):
+        pass
+
+
+class Mesh:
+    def __init__(self, name="Mesh", co=None, select=None):
+        self.name = name
+        self.name_full = name
+        self.session_uid = next(_uid)
+        co = np.zeros((0, 3)) if co is None else np.asarray(co, dtype=float).reshape(-1, 3)
+        self._co = co.copy()
+        self._sel = np.zeros(len(co), dtype=bool) if select is None else np.asarray(select, dtype=bool).copy()
+        self._bbox = None
+        self._bm = None
+        self.vertices = _MeshVertices(self)
+        self.edges = _EmptyElems()
+        self.polygons = _EmptyElems()
+        self.loops = _EmptyElems()
+        self.shape_keys = None
+        self.attributes = [types.SimpleNamespace(name="position", domain="POINT", data_type="FLOAT_VECTOR")]
+        self.is_editmode = False
+        self.users = 0
+
+    def as_pointer(self):
+        return id(self)
+
+    def copy(self):
+        dup = Mesh(self.name + ".001", self._co, self._sel)
+        _DATA.meshes.append(dup)
+        return dup
+
+    def update(self):
+        self._bbox = None
+
+    def bounds(self):
+        if self._bbox is None:
+            if len(self._co):
+                self._bbox = (self._co.min(axis=0), self._co.max(axis=0))
+            else:
+                self._bbox = (np.zeros(3), np.zeros(3))
+        return self._bbox
+
+
+class _SplinePoints(list):
+    def __init__(self, points):
+        super().__init__()
+        self._points = points
+
+    def __len__(self):
+        return len(self._points)
+
+    def foreach_get(self, attr, buf):
+        assert attr == "co"
+        buf[:] = np.column_stack((self._points, np.ones(len(self._points)))).ravel()
+
+
+class Curve:
+    """Poly curve stand-in; ``points`` are both the single spline and the evaluated polyline."""
+
+    def __init__(self, name="Curve", points=None, cyclic=False):
+        self.name = name
+        self.name_full = name
+        self.session_uid = next(_uid)
+        self._points = np.zeros((0, 3)) if points is None else np.asarray(points, dtype=float).reshape(-1, 3)
+        self.splines = [
+            types.SimpleNamespace(
+                type="POLY", use_cyclic_u=cyclic, points=_SplinePoints(self._points), bezier_points=[], resolution_u=12
+            )
+        ]
+        self.users = 0
+
+    def as_pointer(self):
+        return id(self)
+
+    def copy(self):
+        return Curve(self.name + ".001", self._points, self.splines[0].use_cyclic_u)
+
+    def bounds(self):
+        if len(self._points):
+            return self._points.min(axis=0), self._points.max(axis=0)
+        return np.zeros(3), np.zeros(3)
+
+
+def _compose(loc, rot, scale):
+    m = rot.to_matrix()
+    rows = [[m._m[r][c] * scale[c] for c in range(3)] + [loc[r]] for r in range(3)]
+    rows.append([0.0, 0.0, 0.0, 1.0])
+    return Matrix(rows)
+
+
+class _TrackedVector(Vector):
+    """Vector that notifies its owner object when mutated in place."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, seq, owner):
+        super().__init__(seq)
+        self._owner = owner
+
+    def __setitem__(self, i, value):
+        super().__setitem__(i, value)
+        self._owner._changed()
+
+    def __iadd__(self, other):
+        self._v = [a + b for a, b in zip(self._v, other)]
+        self._owner._changed()
+        return self
+
+    def __imul__(self, other):
+        self._v = (self * other)._v
+        self._owner._changed()
+        return self
+
+    def copy(self):
+        return Vector(self._v)
+
+
+class Object:
+    def __init__(self, name, data=None, obj_type=None):
+        self.name = name
+        self.name_full = name
+        self.session_uid = next(_uid)
+        self.data = data
+        if obj_type is None:
+            obj_type = "MESH" if isinstance(data, Mesh) else "CURVE" if isinstance(data, Curve) else "EMPTY"
+        self.type = obj_type
+        if data is not None:
+            data.users += 1
+        self._loc = _TrackedVector((0.0, 0.0, 0.0), self)
+        self._scale = _TrackedVector((1.0, 1.0, 1.0), self)
+        self._rot = Euler((0.0, 0.0, 0.0))
+        self.rotation_mode = "XYZ"
+        self.rotation_quaternion = Quaternion()
+        self.rotation_axis_angle = [0.0, 0.0, 1.0, 0.0]
+        self._parent: Optional[Object] = None
+        self.matrix_parent_inverse = Matrix.Identity(4)
+        self.modifiers = []
+        self.constraints = []
+        self.pose = None
+        self._select = False
+        self._linked = False
+        self._world_cache = None
+        self.rna_writes = 0
+
+    def __repr__(self):
+        return f"<Object {self.name}>"
+
+    def as_pointer(self):
+        return id(self)
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, value):
+        self._parent = value
+        _DATA._children = None
+
+    def _changed(self):
+        self.rna_writes += 1
+        self._invalidate()
+
+    def _invalidate(self):
+        self._world_cache = None
+        for child in _DATA.children_of(self):
+            child._invalidate()
+
+    # Transform channels -------------------------------------------------
+    @property
+    def location(self):
+        return self._loc
+
+    @location.setter
+    def location(self, value):
+        self._loc = _TrackedVector(list(value)[:3], self)
+        self._changed()
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self._scale = _TrackedVector(list(value)[:3], self)
+        self._changed()
+
+    @property
+    def rotation_euler(self):
+        return self._rot
+
+    @rotation_euler.setter
+    def rotation_euler(self, value):
+        self._rot = Euler(list(value)[:3])
+        self._changed()
+
+    def _rotation(self):
+        if self.rotation_mode == "QUATERNION":
+            return self.rotation_quaternion
+        return self._rot
+
+    @property
+    def matrix_basis(self):
+        return _compose(self._loc, self._rotation(), self._scale)
+
+    @matrix_basis.setter
+    def matrix_basis(self, mat):
+        loc, quat, scale = mat.decompose()
+        self._loc = _TrackedVector(loc, self)
+        self._scale = _TrackedVector(scale, self)
+        if self.rotation_mode == "QUATERNION":
+            self.rotation_quaternion = quat
+        else:
+            self._rot = quat.to_euler(self.rotation_mode)
+        self._changed()
+
+    @property
+    def matrix_world(self):
+        if self._world_cache is None:
+            basis = self.matrix_basis
+            if self.parent is not None:
+                basis = self.parent.matrix_world @ self.matrix_parent_inverse @ basis
+            self._world_cache = basis
+        return self._world_cache.copy()
+
+    @matrix_world.setter
+    def matrix_world(self, mat):
+        if self.parent is not None:
+            mat = (self.parent.matrix_world @ self.matrix_parent_inverse).inverted_safe() @ mat
+        self.matrix_basis = mat
+
+    @property
+    def bound_box(self):
+        if self.data is None or not hasattr(self.data, "bounds"):
+            return [(0.0, 0.0, 0.0)] * 8
+        mn, mx = self.data.bounds()
+        return [
+            (mn[0], mn[1], mn[2]), (mn[0], mn[1], mx[2]), (mn[0], mx[1], mx[2]), (mn[0], mx[1], mn[2]),
+            (mx[0], mn[1], mn[2]), (mx[0], mn[1], mx[2]), (mx[0], mx[1], mx[2]), (mx[0], mx[1], mn[2]),
+        ]
+
+    @property
+    def dimensions(self):
+        if self.data is None or not hasattr(self.data, "bounds"):
+            return Vector((0.0, 0.0, 0.0))
+        mn, mx = self.data.bounds()
+        return Vector([(mx[i] - mn[i]) * abs(self._scale[i]) for i in range(3)])
+
+    @property
+    def children(self):
+        return tuple(_DATA.children_of(self))
+
+    @property
+    def children_recursive(self):
+        out = []
+        for child in self.children:
+            out.append(child)
+            out.extend(child.children_recursive)
+        return out
+
+    # Selection / visibility ------------------------------------------------
+    def select_get(self):
+        return self._select
+
+    def select_set(self, state):
+        self._select = bool(state)
+
+    def hide_get(self):
+        return False
+
+    def visible_get(self):
+        return self._linked
+
+    # Evaluation -----------------------------------------------------------
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def to_mesh(self, preserve_all_data_layers=False, depsgraph=None):
+        if isinstance(self.data, Mesh):
+            return self.data
+        if isinstance(self.data, Curve):
+            return Mesh(self.data.name, self.data._points)
+        return None
+
+    def to_mesh_clear(self):
+        pass
+
+    def update_tag(self, refresh=None):
+        pass
+
+    def update_from_editmode(self):
+        return True
+
+    def copy(self):
+        dup = Object(self.name + ".001", self.data, self.type)
+        dup._loc = _TrackedVector(self._loc, dup)
+        dup._scale = _TrackedVector(self._scale, dup)
+        dup._rot = self._rot.copy()
+        dup.rotation_mode = self.rotation_mode
+        dup.parent = self.parent
+        dup.matrix_parent_inverse = self.matrix_parent_inverse.copy()
+        _DATA.objects.append(dup)  # ID.copy() registers the copy in bpy.data
+        return dup
+
+
+class _IDCollection(list):
+    def __init__(self, factory=None):
+        super().__init__()
+        self._factory = factory
+
+    def new(self, name, *args):
+        item = self._factory(name, *args)
+        self.append(item)
+        return item
+
+    def remove(self, item, do_unlink=True):
+        super().remove(item)
+        if isinstance(item, Object):
+            for coll in _DATA.collections:
+                if item in coll.objects:
+                    coll.objects.remove(item)
+            item._linked = False
+
+    def get(self, name, default=None):
+        for item in self:
+            if item.name == name:
+                return item
+        return default
+
+    def find(self, name):
+        for i, item in enumerate(self):
+            if item.name == name:
+                return i
+        return -1
+
+    def foreach_get(self, attr, buf):
+        values = [getattr(item, attr) for item in self]
+        if values and not hasattr(values[0], "__iter__"):
+            buf[:] = np.asarray(values)
+            return
+        if isinstance(values[0], Matrix):
+            # Matrix properties are flattened column-major, like Blender's
+            buf[:] = np.asarray([[list(row) for row in m] for m in values], dtype=float).transpose(0, 2, 1).ravel()
+            return
+        width = len(buf) // max(1, len(self))
+        buf[:] = np.asarray([list(v)[:width] for v in values], dtype=float).ravel()
+
+    def foreach_set(self, attr, buf):
+        width = len(buf) // max(1, len(self))
+        vals = np.asarray(buf, dtype=float).reshape(len(self), width)
+        for item, v in zip(self, vals):
+            # foreach_set bypasses RNA update callbacks
+            if attr == "location":
+                item._loc = _TrackedVector(v, item)
+            elif attr == "scale":
+                item._scale = _TrackedVector(v, item)
+            elif attr == "rotation_euler":
+                item._rot = Euler(v)
+            else:
+                setattr(item, attr, v.tolist())
+        # Every object is in this collection, so dropping all caches covers the children too
+        for item in self:
+            item._world_cache = None
+
+
+class _BlendData:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.objects = _IDCollection(lambda name, data=None: Object(name, data))
+        self.meshes = _IDCollection(lambda name: Mesh(name))
+        self.curves = _IDCollection(lambda name, kind="CURVE": Curve(name))
+        self.collections = []
+        self._children = None
+
+    def batch_remove(self, ids):
+        ids = set(ids)
+        for collection in (self.objects, self.meshes, self.curves):
+            for item in [item for item in collection if item in ids]:
+                collection.remove(item)
+        self._children = None
+
+    def children_of(self, obj):
+        if self._children is None:
+            self._children = {}
+            for o in self.objects:
+                if o.parent is not None:
+                    self._children.setdefault(id(o.parent), []).append(o)
+        return self._children.get(id(obj), ())
+
+
+_DATA = _BlendData()
+
+
+# ---------------------------------------------------------------------------
+# Context
+# ---------------------------------------------------------------------------
+
+
+class Depsgraph:
+    def __init__(self):
+        self.updates = []
+
+
+class _ViewLayer:
+    def __init__(self, scene):
+        self._scene = scene
+        self._active = None
+        self.update_count = 0
+
+    @property
+    def objects(self):
+        return _ActiveProxy(self, self._scene.collection.objects)
+
+    def update(self):
+        self.update_count += 1
+
+
+class _ActiveProxy(list):
+    def __init__(self, view_layer, objs):
+        super().__init__(objs)
+        self._vl = view_layer
+
+    @property
+    def active(self):
+        return self._vl._active
+
+    @active.setter
+    def active(self, obj):
+        self._vl._active = obj
+
+
+class _WindowManager:
+    def __init__(self):
+        self.progress = None
+        self.operators = []
+        self.timers = []
+
+    def progress_begin(self, lo, hi):
+        self.progress = lo
+
+    def progress_update(self, value):
+        self.progress = value
+
+    def progress_end(self):
+        self.progress = None
+
+    def event_timer_add(self, step, window=None):
+        timer = types.SimpleNamespace(time_step=step)
+        self.timers.append(timer)
+        return timer
+
+    def event_timer_remove(self, timer):
+        self.timers.remove(timer)
+
+    def modal_handler_add(self, op):
+        return True
+
+    def invoke_props_dialog(self, op, width=300):
+        return {"RUNNING_MODAL"}
+
+    def fileselect_add(self, op):
+        return {"RUNNING_MODAL"}
+
+
+class Context:
+    def __init__(self):
+        self.scene = _Scene()
+        self.view_layer = _ViewLayer(self.scene)
+        self.window_manager = _WindowManager()
+        self.window = types.SimpleNamespace(cursor_modal_set=lambda *_: None, cursor_modal_restore=lambda: None)
+        self.area = types.SimpleNamespace(header_text_set=lambda *_: None, tag_redraw=lambda: None)
+        self.workspace = types.SimpleNamespace(status_text_set=lambda *_: None)
+        self.region = None
+        self.mode = "OBJECT"
+        self.edit_object: Optional[Object] = None
+        self.preferences = types.SimpleNamespace(addons={})
+        self._depsgraph = Depsgraph()
+        _DATA.collections = [self.scene.collection]
+
+    @property
+    def collection(self):
+        return self.scene.collection
+
+    @property
+    def active_object(self):
+        return self.view_layer._active
+
+    @property
+    def object(self):
+        return self.view_layer._active
+
+    @property
+    def selected_objects(self):
+        return [o for o in self.scene.collection.objects if o._select]
+
+    @property
+    def visible_objects(self):
+        return list(self.scene.collection.objects)
+
+    def evaluated_depsgraph_get(self):
+        return self._depsgraph
+
+
+# ---------------------------------------------------------------------------
+# bmesh
+# ---------------------------------------------------------------------------
+
+
+class BMVert:
+    __slots__ = ("_me", "index")
+
+    def __init__(self, me, index):
+        self._me = me
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, BMVert) and other._me is self._me and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self._me), self.index))
+
+    @property
+    def co(self):
+        return Vector(self._me._co[self.index])
+
+    @co.setter
+    def co(self, value):
+        self._me._co[self.index] = list(value)[:3]
+        self._me._bbox = None
+
+    @property
+    def select(self):
+        return bool(self._me._sel[self.index])
+
+    @select.setter
+    def select(self, value):
+        self._me._sel[self.index] = bool(value)
+
+    def select_set(self, value):
+        self.select = value
+
+
+class _BMVertSeq:
+    def __init__(self, me):
+        self._me = me
+
+    def __len__(self):
+        return len(self._me._co)
+
+    def __iter__(self):
+        return (BMVert(self._me, i) for i in range(len(self._me._co)))
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self._me._co)
+        return BMVert(self._me, i)
+
+    def ensure_lookup_table(self):
+        pass
+
+    def index_update(self):
+        pass
+
+    def new(self, co=(0.0, 0.0, 0.0)):
+        self._me.vertices.add(1)
+        self._me._co[-1] = list(co)[:3]
+        return BMVert(self._me, len(self._me._co) - 1)
+
+
+class _BMElemSeq(list):
+    def ensure_lookup_table(self):
+        pass
+
+    def index_update(self):
+        pass
+
+
+class BMesh:
+    def __init__(self, me=None):
+        self._me = me if me is not None else Mesh("bmesh")
+        self.verts = _BMVertSeq(self._me)
+        self.edges = _BMElemSeq()
+        self.faces = _BMElemSeq()
+        self.select_history = []
+
+    def clear(self):
+        pass
+
+    def from_mesh(self, me):
+        if me is not self._me:
+            self._me._co = me._co.copy()
+            self._me._sel = me._sel.copy()
+
+    def to_mesh(self, me):
+        me._co = self._me._co.copy()
+        me._sel = self._me._sel.copy()
+
+    def select_flush_mode(self):
+        pass
+
+    def normal_update(self):
+        pass
+
+    def free(self):
+        pass
+
+
+def _build_bmesh():
+    mod = types.ModuleType("bmesh")
+    btypes = types.ModuleType("bmesh.types")
+    btypes.BMesh = BMesh
+    btypes.BMVert = BMVert
+    btypes.BMEdge = type("BMEdge", (), {})
+    btypes.BMFace = type("BMFace", (), {})
+    mod.types = btypes
+
+    def from_edit_mesh(me):
+        if me._bm is None:
+            me._bm = BMesh(me)
+        return me._bm
+
+    def update_edit_mesh(me, loop_triangles=True, destructive=True):
+        me._bbox = None
+
+    def new():
+        return BMesh()
+
+    def duplicate(bm, geom=()):
+        verts = [g for g in geom if isinstance(g, BMVert)]
+        start = len(bm._me._co)
+        if verts:
+            idx = np.fromiter((v.index for v in verts), dtype=np.int64, count=len(verts))
+            bm._me._co = np.vstack([bm._me._co, bm._me._co[idx]])
+            bm._me._sel = np.concatenate([bm._me._sel, np.zeros(len(idx), dtype=bool)])
+        new_verts = [BMVert(bm._me, i) for i in range(start, len(bm._me._co))]
+        return {"geom": new_verts, "vert_map": dict(zip(verts, new_verts))}
+
+    def reverse_faces(bm, faces=(), flip_multires=False):
+        return {}
+
+    def recalc_face_normals(bm, faces=()):
+        return {}
+
+    def convex_hull(bm, input=(), use_existing_faces=False):
+        # Conservative: every input vertex is reported as part of the hull.
+        return {"geom": list(input), "geom_interior": [], "geom_unused": [], "geom_holes": []}
+
+    ops = types.ModuleType("bmesh.ops")
+    ops.convex_hull = convex_hull
+    ops.duplicate = duplicate
+    ops.reverse_faces = reverse_faces
+    ops.recalc_face_normals = recalc_face_normals
+    mod.ops = ops
+    mod.from_edit_mesh = from_edit_mesh
+    mod.update_edit_mesh = update_edit_mesh
+    mod.new = new
+    return mod, btypes, ops
+
+
+# ---------------------------------------------------------------------------
+# bpy module assembly
+# ---------------------------------------------------------------------------
+
+
+class _OpsNamespace:
+    def __init__(self, prefix):
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        if not self._prefix:
+            return _OpsNamespace(name)
+        idname = f"{self._prefix}.{name}"
+
+        def call(*args, **kwargs):
+            cls = _ClassRegistry.classes.get(idname)
+            if cls is None:
+                raise AttributeError(f"Operator {idname} is not registered")
+            return run_operator(cls, **kwargs)
+
+        return call
+
+
+def run_operator(cls, context=None, invoke=False, **props):
+    """Instantiate an operator class, assign properties and run ``execute``.
+
+    With ``invoke`` the operator's ``invoke`` runs instead, as for a panel button.
+    """
+    context = context or _BPY.context
+    op = cls()
+    for name, value in props.items():
+        setattr(op, name, value)
+        op.properties._set.add(name)
+    if hasattr(cls, "poll") and not cls.poll(context):
+        raise RuntimeError(f"{cls.bl_idname}.poll() failed, context is incorrect")
+    if invoke and hasattr(op, "invoke"):
+        result = op.invoke(context, None)
+    else:
+        result = op.execute(context)
+    context.window_manager.operators.append(op)
+    return result
+
+
+def _register_class(cls):
+    idname = getattr(cls, "bl_idname", None)
+    if idname:
+        _ClassRegistry.classes[idname] = cls
+
+
+def _unregister_class(cls):
+    idname = getattr(cls, "bl_idname", None)
+    if idname:
+        _ClassRegistry.classes.pop(idname, None)
+
+
+_BPY = None
+
+
+def _build_bpy():
+    bpy = types.ModuleType("bpy")
+    bpy.types = _build_bpy_types()
+    props = types.ModuleType("bpy.props")
+    for kind in ("BoolProperty", "IntProperty", "FloatProperty", "StringProperty", "EnumProperty",
+                 "PointerProperty", "CollectionProperty", "BoolVectorProperty", "FloatVectorProperty",
+                 "IntVectorProperty"):
+        setattr(props, kind, _prop_factory(kind))
+    bpy.props = props
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = _register_class
+    bpy.utils.unregister_class = _unregister_class
+    bpy.data = _DATA
+    bpy.context = Context()
+    bpy.ops = _OpsNamespace("")
+    bpy.app = types.SimpleNamespace(
+        version=(4, 5, 0),
+        background=True,
+        handlers=types.SimpleNamespace(
+            depsgraph_update_post=[], undo_post=[], redo_post=[], load_post=[], undo_pre=[], redo_pre=[],
+            persistent=lambda fn: fn,
+        ),
+        timers=types.SimpleNamespace(register=lambda fn, first_interval=0.0, persistent=False: None,
+                                     unregister=lambda fn: None, is_registered=lambda fn: False),
+    )
+    bpy.path = types.SimpleNamespace(abspath=lambda p: p)
+    return bpy
+
+
+def install():
+    """Register the stand-in modules in ``sys.modules`` (idempotent)."""
+    global _BPY
+    if _BPY is not None:
+        return _BPY
+    mathutils, kdtree, geometry = _build_mathutils()
+    bmesh_mod, bmesh_types, bmesh_ops = _build_bmesh()
+    _BPY = _build_bpy()
+    sys.modules.update({
+        "bpy": _BPY,
+        "bpy.types": _BPY.types,
+        "bpy.props": _BPY.props,
+        "bpy.utils": _BPY.utils,
+        "mathutils": mathutils,
+        "mathutils.kdtree": kdtree,
+        "mathutils.geometry": geometry,
+        "bmesh": bmesh_mod,
+        "bmesh.types": bmesh_types,
+        "bmesh.ops": bmesh_ops,
+    })
+    return _BPY
+
+
+def reset_scene():
+    """Drop all data and return a fresh context."""
+    _DATA.reset()
+    _BPY.context = Context()
+    return _BPY.context
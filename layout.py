@@ -0,0 +1,349 @@
+"""Pure layout math shared by the distribute, spacing and snap operators.
+
+Nothing here touches ``bpy``: every function takes NumPy arrays of positions
+or bounds along one axis, already in layout order, and returns the per-item
+deltas to apply. The operators only gather the arrays and write the deltas.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Optional, Tuple
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def packed_mins(start: float, widths: np.ndarray, gap: float) -> np.ndarray:
+    """Min positions that lay out ``widths`` back to back from ``start`` with ``gap`` between them."""
+    widths = np.asarray(widths, dtype=float)
+    offsets = np.zeros(len(widths))
+    offsets[1:] = np.cumsum(widths[:-1] + gap)
+    return start + offsets
+
+
+def equal_center(keys: np.ndarray) -> np.ndarray:
+    """Keep the first and last key and space the ones between evenly."""
+    keys = np.asarray(keys, dtype=float)
+    if len(keys) < 2:
+        return np.zeros(len(keys))
+    return np.linspace(keys[0], keys[-1], len(keys)) - keys
+
+
+def equal_gap(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """Keep the first min and the last max and make every gap between bounds equal."""
+    mins = np.asarray(mins, dtype=float)
+    maxs = np.asarray(maxs, dtype=float)
+    if len(mins) < 2:
+        return np.zeros(len(mins))
+    widths = maxs - mins
+    gap = (maxs[-1] - mins[0] - widths.sum()) / (len(widths) - 1)
+    return packed_mins(mins[0], widths, gap) - mins
+
+
+def fixed_center(keys: np.ndarray, distance: float) -> np.ndarray:
+    """Place keys ``distance`` apart, starting at the first one."""
+    keys = np.asarray(keys, dtype=float)
+    if len(keys) == 0:
+        return np.zeros(0)
+    return keys[0] + distance * np.arange(len(keys)) - keys
+
+
+def fixed_gap(mins: np.ndarray, maxs: np.ndarray, distance: float) -> np.ndarray:
+    """Pack bounds with a ``distance`` gap between them, starting at the first min."""
+    mins = np.asarray(mins, dtype=float)
+    if len(mins) == 0:
+        return np.zeros(0)
+    return packed_mins(mins[0], np.asarray(maxs, dtype=float) - mins, distance) - mins
+
+
+def fit_center(keys: np.ndarray, range_min: float, range_max: float) -> np.ndarray:
+    """Spread keys evenly from ``range_min`` to ``range_max``."""
+    keys = np.asarray(keys, dtype=float)
+    return np.linspace(range_min, range_max, len(keys)) - keys
+
+
+def fit_gap(mins: np.ndarray, maxs: np.ndarray, range_min: float, range_max: float) -> np.ndarray:
+    """Pack bounds from ``range_min`` with equal gaps that fill the range.
+
+    When the bounds are wider than the range the gaps collapse to zero and the
+    row overflows past ``range_max``.
+    """
+    mins = np.asarray(mins, dtype=float)
+    widths = np.asarray(maxs, dtype=float) - mins
+    if len(widths) < 2:
+        return range_min - mins
+    gap = max(range_max - range_min - widths.sum(), 0.0) / (len(widths) - 1)
+    return packed_mins(range_min, widths, gap) - mins
+
+
+def grid(
+    positions: np.ndarray,
+    columns: int,
+    spacing: Tuple[float, float],
+    origin: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """Deltas that arrange (N, 2) primary/secondary ``positions`` in rows of ``columns``.
+
+    The grid starts at ``origin``, or at the first position when it is omitted.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    if len(positions) == 0:
+        return np.zeros((0, 2))
+    if origin is None:
+        origin = positions[0]
+    index = np.arange(len(positions))
+    cells = np.column_stack((index % columns, index // columns))
+    return np.asarray(origin, dtype=float) + cells * np.asarray(spacing, dtype=float) - positions
+
+
+def shelf_pack(sizes: np.ndarray, gap: float, width: float = 0.0) -> np.ndarray:
+    """Min corners that pack (N, 2) primary/secondary ``sizes`` into shelves.
+
+    Items are sorted by decreasing secondary size and laid out left to right
+    with ``gap`` between them; a new shelf starts once a row would exceed
+    ``width``. A ``width`` of zero picks one that makes the pack roughly
+    square. The corners are relative to the pack's origin and come back in
+    the input order. Sorting dominates, so this is O(n log n).
+    """
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 2)
+    count = len(sizes)
+    corners = np.zeros((count, 2))
+    if count == 0:
+        return corners
+    if width <= 0.0:
+        width = float(np.sqrt(((sizes[:, 0] + gap) * (sizes[:, 1] + gap)).sum()))
+    width = max(width, float(sizes[:, 0].max()))
+
+    order = np.argsort(-sizes[:, 1], kind="stable")
+    x = y = shelf_height = 0.0
+    for i in order.tolist():
+        item_width, item_height = sizes[i]
+        if x > 0.0 and x + item_width > width:
+            y += shelf_height + gap
+            x = shelf_height = 0.0
+        corners[i] = x, y
+        x += item_width + gap
+        shelf_height = max(shelf_height, item_height)
+    return corners
+
+
+def arc_length_table(points: np.ndarray) -> np.ndarray:
+    """Cumulative length along the (M, 3) polyline ``points``, starting at 0."""
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    table = np.zeros(len(points))
+    if len(points) > 1:
+        table[1:] = np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))
+    return table
+
+
+def point_on_path(points: np.ndarray, table: np.ndarray, distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions and unit tangents at arc lengths ``distances`` along a polyline.
+
+    Each distance is located with one binary search in the ``table`` from
+    :func:`arc_length_table` and interpolated linearly inside its segment.
+    Distances outside the path are clamped to its ends.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    distances = np.clip(np.asarray(distances, dtype=float), 0.0, table[-1])
+    if len(points) < 2:
+        return np.repeat(points[:1], len(distances), axis=0), np.zeros((len(distances), 3))
+    segment = np.clip(np.searchsorted(table, distances, side="right") - 1, 0, len(points) - 2)
+    start = points[segment]
+    step = points[segment + 1] - start
+    length = table[segment + 1] - table[segment]
+    t = np.divide(distances - table[segment], length, out=np.zeros(len(distances)), where=length > 0.0)
+    tangents = np.divide(step, length[:, None], out=np.zeros_like(step), where=length[:, None] > 0.0)
+    return start + t[:, None] * step, tangents
+
+
+def project_onto_path(points: np.ndarray, table: np.ndarray, locations: np.ndarray, nearest: np.ndarray) -> np.ndarray:
+    """Arc length of the closest point on the path to each of ``locations``.
+
+    ``nearest`` holds the index of the closest polyline point to each location
+    (from a KD-tree); only the two segments meeting there are tested.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    locations = np.asarray(locations, dtype=float).reshape(-1, 3)
+    nearest = np.asarray(nearest, dtype=np.int64)
+    if len(points) < 2:
+        return np.zeros(len(locations))
+    best = np.full(len(locations), np.inf)
+    result = table[nearest].astype(float)
+    for segment in (np.clip(nearest - 1, 0, len(points) - 2), np.clip(nearest, 0, len(points) - 2)):
+        start = points[segment]
+        step = points[segment + 1] - start
+        length_sq = (step * step).sum(axis=1)
+        t = np.divide(((locations - start) * step).sum(axis=1), length_sq, out=np.zeros(len(locations)), where=length_sq > 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        dist = np.linalg.norm(start + t[:, None] * step - locations, axis=1)
+        closer = dist < best
+        best = np.where(closer, dist, best)
+        result = np.where(closer, table[segment] + t * (table[segment + 1] - table[segment]), result)
+    return result
+
+
+def path_center_distances(count: int, total: float, cyclic: bool = False) -> np.ndarray:
+    """Arc lengths that space ``count`` centers evenly over a path of length ``total``.
+
+    Open paths get an item on both ends; closed ones leave the same spacing
+    between the last item and the first.
+    """
+    if cyclic:
+        return total * np.arange(count) / max(count, 1)
+    return np.linspace(0.0, total, count)
+
+
+def path_gap_distances(lengths: np.ndarray, total: float, cyclic: bool = False) -> np.ndarray:
+    """Center arc lengths of items ``lengths`` long that leave equal gaps along the path."""
+    lengths = np.asarray(lengths, dtype=float)
+    gaps = len(lengths) if cyclic else len(lengths) - 1
+    if gaps <= 0:
+        return lengths / 2.0
+    gap = (total - lengths.sum()) / gaps
+    return packed_mins(0.0, lengths, gap) + lengths / 2.0
+
+
+def circle_angles(count: int, start: float, end: float) -> np.ndarray:
+    """Evenly spaced angles (radians) for ``count`` items from ``start`` to ``end``.
+
+    A full turn or more leaves the same step between the last item and the
+    first instead of stacking them on the same spot.
+    """
+    if abs(end - start) >= 2.0 * np.pi - 1e-9:
+        return start + (end - start) * np.arange(count) / max(count, 1)
+    return np.linspace(start, end, count)
+
+
+def resolve_overlaps(mins: np.ndarray, maxs: np.ndarray, axis: int, gap: float = 0.0) -> np.ndarray:
+    """Deltas along ``axis`` that separate intersecting (N, 3) boxes by at least ``gap``.
+
+    Boxes keep their order along the axis and only move towards +axis, each
+    by the least amount that clears every earlier box it overlaps on the other
+    two axes; boxes that intersect nothing stay put.
+
+    A sweep in order of the original mins keeps the placed boxes still in
+    reach in a compact active list; a box whose (moved) max plus ``gap`` lies
+    at or before the current min can no longer touch any later box and is
+    pruned through a heap. The list is compacted once half of it has been
+    pruned, so each step tests O(boxes in reach) candidates however long any
+    single box is. The worst case stays O(n²) when most boxes are in reach of
+    each other at once, e.g. a pile that all overlaps one spot.
+    """
+    mins = np.asarray(mins, dtype=float).reshape(-1, 3)
+    maxs = np.asarray(maxs, dtype=float).reshape(-1, 3)
+    count = len(mins)
+    if count < 2:
+        return np.zeros(count)
+    order = np.argsort(mins[:, axis], kind="stable")
+    lo_axis = mins[order, axis]
+    widths = maxs[order, axis] - lo_axis
+    u, v = [a for a in range(3) if a != axis]
+    u_min, u_max = mins[order, u], maxs[order, u]
+    v_min, v_max = mins[order, v], maxs[order, v]
+
+    placed_min = lo_axis.copy()
+    placed_max = np.empty(count)
+    alive = np.zeros(count, dtype=bool)
+    heap = []
+    active = np.empty(count, dtype=np.intp)
+    size = pruned = 0
+    for p in range(count):
+        current = lo_axis[p]
+        while heap and heap[0][0] + gap <= current:
+            alive[heapq.heappop(heap)[1]] = False
+            pruned += 1
+        if pruned * 2 > size:
+            kept = active[:size][alive[active[:size]]]
+            size, pruned = len(kept), 0
+            active[:size] = kept
+        if size:
+            window = active[:size]
+            hit = (
+                alive[window]
+                & (u_min[window] < u_max[p])
+                & (u_max[window] > u_min[p])
+                & (v_min[window] < v_max[p])
+                & (v_max[window] > v_min[p])
+            )
+            if hit.any():
+                placed_min[p] = max(current, placed_max[window[hit]].max() + gap)
+        placed_max[p] = placed_min[p] + widths[p]
+        alive[p] = True
+        active[size] = p
+        size += 1
+        heapq.heappush(heap, (placed_max[p], p))
+
+    deltas = np.empty(count)
+    deltas[order] = placed_min - lo_axis
+    return deltas
+
+
+def edge_snap(values: np.ndarray, target: float) -> np.ndarray:
+    """Move every value onto ``target``."""
+    return target - np.asarray(values, dtype=float)
+
+
+def nearest_face_snap(
+    values: np.ndarray,
+    faces: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    face_mins: np.ndarray,
+    face_maxs: np.ndarray,
+) -> np.ndarray:
+    """Move every value onto the closest entry of ``faces`` that lies across from it.
+
+    ``mins``/``maxs`` (n, k) are the extents of each moving box on the other
+    axes and ``face_mins``/``face_maxs`` (m, k) those of each face's box; a
+    face only counts for a value when the two boxes overlap on all of those
+    axes. Values without such a face stay put. The faces are sorted once and
+    each value walks outwards from its insertion point on both sides in
+    doubling blocks, so the cost is O((n + m) log m) plus the faces skipped
+    for not overlapping.
+    """
+    values = np.asarray(values, dtype=float)
+    faces = np.asarray(faces, dtype=float)
+    deltas = np.zeros(len(values))
+    if len(faces) == 0 or len(values) == 0:
+        return deltas
+    mins = np.asarray(mins, dtype=float).reshape(len(values), -1)
+    maxs = np.asarray(maxs, dtype=float).reshape(len(values), -1)
+    order = np.argsort(faces, kind="stable")
+    sorted_faces = faces[order]
+    face_mins = np.asarray(face_mins, dtype=float).reshape(len(faces), -1)[order]
+    face_maxs = np.asarray(face_maxs, dtype=float).reshape(len(faces), -1)[order]
+    insert = np.searchsorted(sorted_faces, values)
+    best = np.full(len(values), np.inf)
+
+    # Walking away from the insertion point, the first overlapping face on a side is the nearest there
+    for first, step in ((insert - 1, -1), (insert, 1)):
+        pending = np.arange(len(values))
+        offset, block = 0, 4
+        while len(pending):
+            probes = first[pending, None] + step * (offset + np.arange(block))
+            valid = (probes >= 0) & (probes < len(faces))
+            probes = np.clip(probes, 0, len(faces) - 1)
+            across = valid & np.all(
+                (face_mins[probes] < maxs[pending, None]) & (face_maxs[probes] > mins[pending, None]), axis=2
+            )
+            hit = across.any(axis=1)
+            rows = pending[hit]
+            found = sorted_faces[probes[hit, np.argmax(across[hit], axis=1)]]
+            closer = np.abs(found - values[rows]) < best[rows]
+            rows, found = rows[closer], found[closer]
+            best[rows] = np.abs(found - values[rows])
+            deltas[rows] = found - values[rows]
+            pending = pending[~hit & valid[:, -1]]
+            offset += block
+            block *= 2
+    return deltas
+
+
+def increment_snap(values: np.ndarray, increment: float) -> np.ndarray:
+    """Round values to the nearest multiple of ``increment``; a zero increment leaves them alone."""
+    values = np.asarray(values, dtype=float)
+    if increment <= 0.0:
+        return np.zeros(len(values))
+    return np.round(values / increment) * increment - values
@@ -0,0 +1,60 @@
+"""Deferred imports and add-on startup timings.
+
+Heavy modules such as NumPy are bound at import time to a proxy that imports
+them on first attribute access, so enabling the add-on (and every Blender
+start with it enabled) does not pay for them until an operator actually runs.
+The proxy is private to the add-on: nothing is put into ``sys.modules`` until
+the real import happens, so other add-ons import these modules as usual.
+"""
+
+import importlib
+import importlib.util
+import sys
+import time
+from typing import Dict, Set
+
+# Milliseconds spent importing each deferred module, filled in on first use
+import_times: Dict[str, float] = {}
+# Milliseconds spent in the add-on's register()
+register_time = 0.0
+# Modules bound through lazy_import()
+deferred: Set[str] = set()
+
+
+class _LazyModule:
+    """Stands in for module ``name`` and imports it on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        self.__dict__["_lazy_name"] = name
+
+    def _load(self):
+        name = self.__dict__["_lazy_name"]
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        import_times.setdefault(name, (time.perf_counter() - start) * 1000.0)
+        # Later lookups hit the copied attributes directly instead of __getattr__
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        name = self.__dict__["_lazy_name"]
+        return f"<deferred module {name!r}>" if name not in import_times else repr(sys.modules[name])
+
+
+def lazy_import(name: str):
+    """Return module ``name``, or a proxy that imports it when an attribute is first used."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    deferred.add(name)
+    return _LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    """Whether ``name`` has actually been imported, as opposed to only bound lazily."""
+    return name in sys.modules
@@ -0,0 +1,292 @@
+"""Modal operator support: interactive drags and chunked execution.
+
+Aligning with an offset and distributing by a distance both move each object
+along one world axis by ``base + value * rate``. :class:`AxisMovePreview`
+resolves that once into per-object location changes, so every mouse move is
+a single vectorized write of the objects that actually move.
+
+:class:`ChunkedModalMixin` lets operators on huge selections plan their
+result up front and write it a time-budgeted slice per timer tick, so the UI
+keeps redrawing, shows progress and can be cancelled with everything put back.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import List, Optional, Sequence
+
+import bpy
+
+from . import profiling
+from .lazy import lazy_import
+from .utils import (
+    SceneSettingsMixin,
+    TransformBatch,
+    apply_scene_settings,
+    world_to_parent_space,
+    write_vector_array,
+)
+
+np = lazy_import("numpy")
+
+
+class AxisMovePreview:
+    """Snapshot of a selection moved by ``base + value * rate`` along a world axis.
+
+    ``base`` and ``rate`` are per-object world offsets. Moves are resolved
+    parent-first like :class:`utils.TransformBatch`: a selected child only
+    gets the part of its move that its moved ancestors do not carry already.
+    """
+
+    def __init__(self, objs: Sequence[bpy.types.Object], axis: int, base: np.ndarray, rate: np.ndarray) -> None:
+        index = {obj: i for i, obj in enumerate(objs)}
+        ancestors = np.full(len(objs), -1)
+        for i, obj in enumerate(objs):
+            parent = obj.parent
+            while parent is not None and parent not in index:
+                parent = parent.parent
+            if parent is not None:
+                ancestors[i] = index[parent]
+
+        base = np.asarray(base, dtype=float)
+        rate = np.asarray(rate, dtype=float)
+        has_ancestor = ancestors >= 0
+        base = base - np.where(has_ancestor, base[ancestors], 0.0)
+        rate = rate - np.where(has_ancestor, rate[ancestors], 0.0)
+
+        moving = np.flatnonzero((np.abs(base) > 1e-9) | (np.abs(rate) > 1e-9))
+        self.objs = [objs[i] for i in moving]
+        # Location change caused by a unit world move along the axis
+        columns = np.array([np.array(world_to_parent_space(obj))[:, axis] for obj in self.objs]).reshape(-1, 3)
+        self.original = np.array([obj.location for obj in self.objs], dtype=float).reshape(-1, 3)
+        self.base = columns * base[moving, None]
+        self.rate = columns * rate[moving, None]
+
+    def apply(self, value: float, context: Optional[bpy.types.Context] = None) -> None:
+        """Write the locations for ``value``; with ``context`` also update its view layer."""
+        write_vector_array("location", self.objs, self.original + self.base + value * self.rate)
+        profiling.count("objects", len(self.objs))
+        if context is not None:
+            context.view_layer.update()
+            profiling.count("depsgraph_updates")
+
+    def restore(self, context: Optional[bpy.types.Context] = None) -> None:
+        write_vector_array("location", self.objs, self.original)
+        if context is not None:
+            context.view_layer.update()
+
+
+def _pixel_size(context: bpy.types.Context) -> float:
+    """Rough world size of one pixel at the view's focal distance."""
+    rv3d = context.region_data
+    region = context.region
+    if rv3d is None or region is None or region.width <= 0:
+        return 0.01
+    return 2.0 * rv3d.view_distance / region.width
+
+
+class ModalAxisDragMixin(SceneSettingsMixin):
+    """Drag the mouse horizontally to change ``value_prop`` with a live preview.
+
+    Subclasses implement :meth:`build_preview`. Shift drags ten times slower,
+    Ctrl snaps to 0.1, click or Enter confirms, and Esc or right click
+    restores the snapshot. ``execute`` applies the current value without
+    interaction, which is what the redo panel runs.
+    """
+
+    value_prop = "offset"
+    value_label = "Offset"
+    value_min = None
+
+    def build_preview(self, context: bpy.types.Context) -> Optional[AxisMovePreview]:
+        raise NotImplementedError
+
+    def execute(self, context):
+        preview = self.build_preview(context)
+        if preview is None:
+            return {"CANCELLED"}
+        preview.apply(getattr(self, self.value_prop), context)
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        apply_scene_settings(self, context, self.scene_settings)
+        self._preview = self.build_preview(context)
+        if self._preview is None:
+            return {"CANCELLED"}
+        self._start_x = event.mouse_x
+        self._start_value = getattr(self, self.value_prop)
+        self._pixel = _pixel_size(context)
+        self._preview.apply(self._start_value)
+        self._show_value(context)
+        context.window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == "MOUSEMOVE":
+            scale = self._pixel * (0.1 if event.shift else 1.0)
+            value = self._start_value + (event.mouse_x - self._start_x) * scale
+            if event.ctrl:
+                value = round(value * 10.0) / 10.0
+            if self.value_min is not None:
+                value = max(value, self.value_min)
+            setattr(self, self.value_prop, value)
+            self._preview.apply(value)
+            self._show_value(context)
+        elif event.type in {"LEFTMOUSE", "RET", "NUMPAD_ENTER"} and event.value == "PRESS":
+            self._preview.apply(getattr(self, self.value_prop), context)
+            context.area.header_text_set(None)
+            profiling.notify_executed(self, context, {"FINISHED"})
+            return {"FINISHED"}
+        elif event.type in {"RIGHTMOUSE", "ESC"} and event.value == "PRESS":
+            self._preview.restore(context)
+            context.area.header_text_set(None)
+            return {"CANCELLED"}
+        return {"RUNNING_MODAL"}
+
+    def _show_value(self, context: bpy.types.Context) -> None:
+        context.area.header_text_set(f"{self.value_label}: {getattr(self, self.value_prop):.4f}   (Shift: precise, Ctrl: snap, Esc: cancel)")
+
+
+# Objects written in the first slice, before the write rate is known
+CHUNK_START = 1000
+CHUNK_MIN = 100
+# Events that still reach the viewport while a chunked operator runs
+_NAVIGATION_EVENTS = {
+    "MIDDLEMOUSE",
+    "WHEELUPMOUSE",
+    "WHEELDOWNMOUSE",
+    "TRACKPADPAN",
+    "TRACKPADZOOM",
+    "MOUSEMOVE",
+    "INBETWEEN_MOUSEMOVE",
+}
+
+
+class ChunkedJob:
+    """A planned change to ``total`` objects that can be applied in slices.
+
+    :meth:`step` applies the next slice; :meth:`cancel` undoes every slice
+    applied so far, so a cancelled job leaves the scene as it found it.
+    """
+
+    total = 0
+    done = 0
+
+    def step(self, count: int, context: bpy.types.Context) -> int:
+        """Apply up to ``count`` more objects and return how many were applied."""
+        raise NotImplementedError
+
+    def finish(self, context: bpy.types.Context) -> None:
+        context.view_layer.update()
+        profiling.count("depsgraph_updates")
+
+    def cancel(self, context: bpy.types.Context) -> None:
+        raise NotImplementedError
+
+
+class ChunkedTransform(ChunkedJob):
+    """Writes a :class:`TransformBatch` in parts, keeping the values each part replaced."""
+
+    def __init__(self, batch: TransformBatch) -> None:
+        batch.resolve()
+        self.batch = batch
+        self.total = len(batch)
+        self.done = 0
+        self._undo: List[TransformBatch] = []
+
+    def step(self, count, context):
+        part = self.batch.take(count)
+        self._undo.append(part.originals())
+        written = part.flush(context, update=False)
+        self.done += written
+        return written
+
+    def cancel(self, context):
+        for part in reversed(self._undo):
+            part.flush(context, update=False)
+        self._undo.clear()
+        self.done = 0
+        context.view_layer.update()
+
+
+class ChunkedModalMixin(SceneSettingsMixin):
+    """Runs selections of ``Chunk Above`` objects or more in time slices.
+
+    Subclasses implement :meth:`chunked_job`, returning the planned result as
+    a :class:`ChunkedJob`. Each timer tick applies as many objects as fit in
+    the scene's time slice, sizing the next slice from the measured rate, and
+    updates the progress bar. Esc or right click cancels and restores the
+    scene; view navigation keeps working. Smaller selections, the redo panel
+    and scripts run ``execute`` in one go.
+    """
+
+    def chunked_job(self, context: bpy.types.Context) -> Optional[ChunkedJob]:
+        raise NotImplementedError
+
+    def invoke(self, context, event):
+        apply_scene_settings(self, context, self.scene_settings)
+        settings = getattr(context.scene, "alignment_suite", None)
+        threshold = settings.chunk_threshold if settings is not None else 0
+        if not threshold or len(context.selected_objects) < threshold:
+            return self.execute(context)
+        self._job = self.chunked_job(context)
+        if self._job is None:
+            return {"CANCELLED"}
+        self._budget = settings.chunk_budget / 1000.0
+        self._count = CHUNK_START
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.progress_begin(0, max(self._job.total, 1))
+        wm.modal_handler_add(self)
+        self._show_progress(context)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type in {"ESC", "RIGHTMOUSE"} and event.value == "PRESS":
+            self._job.cancel(context)
+            self._end(context)
+            self.report({"INFO"}, f"{self.bl_label} cancelled, nothing changed")
+            return {"CANCELLED"}
+        if event.type == "TIMER":
+            return self._tick(context)
+        if event.type in _NAVIGATION_EVENTS:
+            return {"PASS_THROUGH"}
+        # Anything else could edit the objects being written
+        return {"RUNNING_MODAL"}
+
+    def _tick(self, context):
+        job = self._job
+        deadline = time.perf_counter() + self._budget
+        written = 0
+        while job.done < job.total:
+            start = time.perf_counter()
+            written = job.step(self._count, context)
+            if not written:
+                break
+            elapsed = max(time.perf_counter() - start, 1e-6)
+            # Aim each slice at the whole budget, growing at most 4x per slice
+            self._count = max(CHUNK_MIN, min(4 * written, int(written * self._budget / elapsed)))
+            if time.perf_counter() >= deadline:
+                break
+        if job.done < job.total and written:
+            context.window_manager.progress_update(job.done)
+            self._show_progress(context)
+            return {"RUNNING_MODAL"}
+        job.finish(context)
+        self._end(context)
+        profiling.notify_executed(self, context, {"FINISHED"})
+        return {"FINISHED"}
+
+    def _end(self, context) -> None:
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        if context.area is not None:
+            context.area.header_text_set(None)
+
+    def _show_progress(self, context) -> None:
+        if context.area is None:
+            return
+        job = self._job
+        percent = 100.0 * job.done / max(job.total, 1)
+        context.area.header_text_set(f"{self.bl_label}: {job.done} / {job.total} objects ({percent:.0f}%)   Esc: cancel")
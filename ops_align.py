@@ -2,17 +2,32 @@ from typing import List
 
 import bpy
 
+from . import profiling
+from .lazy import lazy_import
+from .modal import AxisMovePreview, ModalAxisDragMixin
 from .utils import (
     AXES,
+    SceneSettingsMixin,
+    TransformBatch,
     active_object,
+    alignment_target,
     alignment_target_value,
+    axis_index,
     bmesh_from_active,
+    chosen_axes,
     bounds_of_selected_verts_world,
+    edit_mesh_arrays,
     origin_point,
     selected_objects,
     set_object_world_location_axis,
+    supports_bulk_edit,
+    transform_points,
+    world_bounds_array,
+    write_edit_mesh_coords,
 )
 
+np = lazy_import("numpy")
+
 
 ALIGN_MODES = [
     ("WORLD", "World 0", "Align to world origin along axis"),
@@ -24,42 +39,101 @@ ALIGN_MODES = [
 ]
 
 
-class ALIGNMENT_SUITE_OT_align_objects(bpy.types.Operator):
-    bl_idname = "alignment_suite.align_objects"
-    bl_label = "Align Objects"
-    bl_options = {"REGISTER", "UNDO"}
+class _AlignObjectsProperties:
+    # Listed before SceneSettingsMixin in the bases, so this scene_settings wins
+    scene_settings = {
+        "mode": "align_mode",
+        "use_bounds": "use_bounds",
+        "which_bound": "which_bound",
+        "offset": "align_offset",
+        "exact_bounds": "exact_bounds",
+    }
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Align along {a}") for a in AXES], name="Axis", default="X")
-    mode: bpy.props.EnumProperty(items=ALIGN_MODES, name="Target", default="CENTER")
+    mode: bpy.props.EnumProperty(items=ALIGN_MODES, name="Target", default="CENTER", options={"SKIP_SAVE"})
     use_bounds: bpy.props.BoolProperty(
         name="Use Bounds",
         description="Align object bounds instead of object origin",
         default=False,
+        options={"SKIP_SAVE"},
     )
-    offset: bpy.props.FloatProperty(name="Offset", default=0.0, description="Add an offset to the computed target value")
+    offset: bpy.props.FloatProperty(name="Offset", default=0.0, description="Add an offset to the computed target value", options={"SKIP_SAVE"})
     which_bound: bpy.props.EnumProperty(
         items=[("MIN", "Min", "Use minimum bound"), ("CENTER", "Center", "Use center of bounds"), ("MAX", "Max", "Use maximum bound")],
         name="Bound",
         default="CENTER",
+        options={"SKIP_SAVE"},
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
 
     @classmethod
     def poll(cls, context):
         return len(context.selected_objects) >= 1 and context.mode == 'OBJECT'
 
+
+class ALIGNMENT_SUITE_OT_align_objects(_AlignObjectsProperties, SceneSettingsMixin, bpy.types.Operator):
+    bl_idname = "alignment_suite.align_objects"
+    bl_label = "Align Objects"
+    bl_options = {"REGISTER", "UNDO"}
+
+    axes: bpy.props.BoolVectorProperty(
+        name="Axes",
+        size=3,
+        subtype="XYZ",
+        default=(False, False, False),
+        description="Align along several axes in one step; when none is set, Axis is used",
+    )
+
     def execute(self, context):
         objs: List[bpy.types.Object] = selected_objects(context)
         if not objs:
             return {"CANCELLED"}
 
-        target_value = alignment_target_value(context, self.axis, self.mode, objs) + self.offset
+        # Target and current positions for every chosen axis from one bounds read
+        indices = chosen_axes(self.axes, self.axis)
+        target = alignment_target(context, self.mode, objs, self.exact_bounds)[indices] + self.offset
+        if self.use_bounds:
+            mins, maxs = world_bounds_array(objs, self.exact_bounds)
+            current = {"MIN": mins, "MAX": maxs}.get(self.which_bound, 0.5 * (mins + maxs))
+        else:
+            current = np.array([obj.matrix_world.translation for obj in objs], dtype=float).reshape(-1, 3)
+        deltas = np.zeros((len(objs), 3))
+        deltas[:, indices] = target - current[:, indices]
 
-        for obj in objs:
-            set_object_world_location_axis(obj, self.axis, target_value, self.use_bounds, self.which_bound)
+        batch = TransformBatch()
+        for obj, delta in zip(objs, deltas):
+            batch.offset_world(obj, delta)
+        batch.flush(context)
 
         return {"FINISHED"}
 
 
+class ALIGNMENT_SUITE_OT_align_objects_modal(_AlignObjectsProperties, ModalAxisDragMixin, bpy.types.Operator):
+    """Align, then drag the mouse to adjust the offset interactively"""
+
+    bl_idname = "alignment_suite.align_objects_modal"
+    bl_label = "Align Objects (Drag Offset)"
+    bl_options = {"REGISTER", "UNDO", "BLOCKING", "GRAB_CURSOR"}
+
+    def build_preview(self, context):
+        objs = selected_objects(context)
+        if not objs:
+            return None
+        idx = axis_index(self.axis)
+        target = alignment_target_value(context, self.axis, self.mode, objs, self.exact_bounds)
+        if self.use_bounds:
+            mins, maxs = world_bounds_array(objs, self.exact_bounds)
+            current = {"MIN": mins, "MAX": maxs}.get(self.which_bound, 0.5 * (mins + maxs))[:, idx]
+        else:
+            current = np.array([obj.matrix_world.translation[idx] for obj in objs])
+        return AxisMovePreview(objs, idx, target - current, np.ones(len(objs)))
+
+
 class ALIGNMENT_SUITE_OT_align_active_to_selection(bpy.types.Operator):
     bl_idname = "alignment_suite.align_active_to_selection"
     bl_label = "Align Active To Selection"
@@ -71,6 +145,11 @@ class ALIGNMENT_SUITE_OT_align_active_to_selection(bpy.types.Operator):
         name="Bound",
         default="CENTER",
     )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context):
@@ -81,8 +160,10 @@ class ALIGNMENT_SUITE_OT_align_active_to_selection(bpy.types.Operator):
         act = active_object(context)
         if not act or not objs:
             return {"CANCELLED"}
-        target_value = alignment_target_value(context, self.axis, "CENTER", objs)
-        set_object_world_location_axis(act, self.axis, target_value, True, self.which_bound)
+        target_value = alignment_target_value(context, self.axis, "CENTER", objs, self.exact_bounds)
+        batch = TransformBatch()
+        set_object_world_location_axis(act, self.axis, target_value, True, self.which_bound, exact=self.exact_bounds, batch=batch)
+        batch.flush(context)
         return {"FINISHED"}
 
 
@@ -100,38 +181,57 @@ class ALIGNMENT_SUITE_OT_align_mesh_verts(bpy.types.Operator):
         return obj is not None and obj.type == 'MESH' and context.mode == 'EDIT_MESH'
 
     def execute(self, context):
+        bm, obj = bmesh_from_active()
+        if not supports_bulk_edit(obj):
+            return self._execute_bmesh(context, bm, obj)
+
+        co, sel = edit_mesh_arrays(obj)
+        if not sel.any():
+            return {"CANCELLED"}
+
+        idx = axis_index(self.axis)
+        world = transform_points(co[sel], obj.matrix_world)
+        target_value = self._target_value(context, world.min(axis=0), world.max(axis=0))
+        world[:, idx] = target_value
+        write_edit_mesh_coords(obj, np.flatnonzero(sel), transform_points(world, obj.matrix_world.inverted_safe()))
+
+        return {"FINISHED"}
+
+    def _execute_bmesh(self, context, bm, obj):
+        # Per-vertex fallback for meshes that cannot use the bulk array path
         import bmesh
         from .utils import set_selected_verts_axis
 
-        bm, obj = bmesh_from_active()
         if not any(v.select for v in bm.verts):
             return {"CANCELLED"}
 
-        # Compute target
-        if self.mode in {"WORLD", "CURSOR"}:
-            target_value = alignment_target_value(context, self.axis, self.mode)
-        elif self.mode == "ACTIVE":
-            # Active object's bound center
-            target_value = alignment_target_value(context, self.axis, "ACTIVE")
-        else:
-            # Bounds of selection
-            mn, mx = bounds_of_selected_verts_world(bm, obj)
-            idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-            if self.mode == "MIN":
-                target_value = mn[idx]
-            elif self.mode == "MAX":
-                target_value = mx[idx]
-            else:
-                target_value = 0.5 * (mn[idx] + mx[idx])
-
+        mn, mx = bounds_of_selected_verts_world(bm, obj) if self.mode in {"MIN", "CENTER", "MAX"} else (None, None)
+        target_value = self._target_value(context, mn, mx)
         set_selected_verts_axis(bm, obj, self.axis, target_value)
         bmesh.update_edit_mesh(obj.data)
+        profiling.count("verts", len(bm.verts))
+        profiling.count("depsgraph_updates")
 
         return {"FINISHED"}
 
+    def _target_value(self, context, mn, mx) -> float:
+        if self.mode in {"WORLD", "CURSOR"}:
+            return alignment_target_value(context, self.axis, self.mode)
+        if self.mode == "ACTIVE":
+            # Active object's bound center
+            return alignment_target_value(context, self.axis, "ACTIVE")
+        # Bounds of selection
+        idx = axis_index(self.axis)
+        if self.mode == "MIN":
+            return float(mn[idx])
+        if self.mode == "MAX":
+            return float(mx[idx])
+        return 0.5 * (mn[idx] + mx[idx])
+
 
 classes = (
     ALIGNMENT_SUITE_OT_align_objects,
+    ALIGNMENT_SUITE_OT_align_objects_modal,
     ALIGNMENT_SUITE_OT_align_active_to_selection,
     ALIGNMENT_SUITE_OT_align_mesh_verts,
 )
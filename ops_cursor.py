@@ -1,12 +1,13 @@
 import bpy
 
-from .utils import AXES, alignment_target_value
+from .utils import AXES, SceneSettingsMixin, TransformBatch, alignment_target, chosen_axes
 
 
-class ALIGNMENT_SUITE_OT_set_cursor(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_set_cursor(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.set_cursor"
     bl_label = "Set 3D Cursor"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {"mode": "cursor_mode", "exact_bounds": "exact_bounds"}
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
     mode: bpy.props.EnumProperty(
@@ -19,6 +20,20 @@ class ALIGNMENT_SUITE_OT_set_cursor(bpy.types.Operator):
         ],
         name="Mode",
         default="CENTER",
+        options={"SKIP_SAVE"},
+    )
+    axes: bpy.props.BoolVectorProperty(
+        name="Axes",
+        size=3,
+        subtype="XYZ",
+        default=(False, False, False),
+        description="Set several axes in one step; when none is set, Axis is used",
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
 
     @classmethod
@@ -26,10 +41,10 @@ class ALIGNMENT_SUITE_OT_set_cursor(bpy.types.Operator):
         return context.mode == 'OBJECT' and (context.selected_objects or context.view_layer.objects.active)
 
     def execute(self, context):
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-        target_value = alignment_target_value(context, self.axis, self.mode)
+        target = alignment_target(context, self.mode, exact=self.exact_bounds)
         cur = context.scene.cursor.location.copy()
-        cur[idx] = target_value
+        for idx in chosen_axes(self.axes, self.axis):
+            cur[idx] = target[idx]
         context.scene.cursor.location = cur
         return {"FINISHED"}
 
@@ -48,10 +63,12 @@ class ALIGNMENT_SUITE_OT_origin_to_cursor_axis(bpy.types.Operator):
     def execute(self, context):
         idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
         target = context.scene.cursor.location[idx]
+        batch = TransformBatch()
         for obj in context.selected_objects:
             loc = obj.location.copy()
             loc[idx] = target
-            obj.location = loc
+            batch.set_location(obj, loc)
+        batch.flush(context)
         return {"FINISHED"}
 
 
@@ -1,14 +1,36 @@
 from typing import List
 
 import bpy
+from mathutils import Quaternion, Vector
+from mathutils.kdtree import KDTree
+
+from . import layout
+from .lazy import lazy_import
+from .modal import AxisMovePreview, ChunkedModalMixin, ChunkedTransform, ModalAxisDragMixin
+from .utils import (
+    AXES,
+    SceneSettingsMixin,
+    TransformBatch,
+    axis_index,
+    axis_snapshot,
+    curve_path_points,
+    has_ancestor_in,
+    origin_point,
+    plane_axes_from_normal,
+    radians,
+    world_bounds_array,
+    world_extents_along,
+    world_to_local_rotation,
+)
 
-from .utils import AXES, sort_objects_by_axis, world_bounds_of_object
+np = lazy_import("numpy")
 
 
-class ALIGNMENT_SUITE_OT_distribute_objects(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_distribute_objects(ChunkedModalMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.distribute_objects"
     bl_label = "Distribute Objects"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {"spacing_mode": "spacing_mode", "exact_bounds": "exact_bounds"}
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Distribute along {a}") for a in AXES], name="Axis", default="X")
     spacing_mode: bpy.props.EnumProperty(
@@ -18,6 +40,13 @@ class ALIGNMENT_SUITE_OT_distribute_objects(bpy.types.Operator):
         ],
         name="Spacing",
         default="GAP",
+        options={"SKIP_SAVE"},
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
 
     @classmethod
@@ -25,55 +54,30 @@ class ALIGNMENT_SUITE_OT_distribute_objects(bpy.types.Operator):
         return len(context.selected_objects) >= 3 and context.mode == 'OBJECT'
 
     def execute(self, context):
-        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-        objs = sort_objects_by_axis(objs, self.axis)
+        self._plan(context).flush(context)
+        return {"FINISHED"}
 
-        first = objs[0]
-        last = objs[-1]
+    def chunked_job(self, context):
+        return ChunkedTransform(self._plan(context))
+
+    def _plan(self, context) -> TransformBatch:
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
+        snap = axis_snapshot(objs, self.axis, with_bounds=self.spacing_mode == "GAP", exact=self.exact_bounds)
+        idx = snap.axis
 
         if self.spacing_mode == "CENTER":
-            start = first.matrix_world.translation[idx]
-            end = last.matrix_world.translation[idx]
-            step = (end - start) / (len(objs) - 1)
-            for i, obj in enumerate(objs):
-                loc = obj.location.copy()
-                loc[idx] = start + step * i
-                obj.location = loc
+            deltas = layout.equal_center(snap.keys)
         else:
-            # Equal gap using bounds
-            fmn, fmx = world_bounds_of_object(first)
-            lmn, lmx = world_bounds_of_object(last)
-            start = fmn[idx]
-            end = lmx[idx]
-
-            total_len = 0.0
-            widths = []
-            for o in objs:
-                mn, mx = world_bounds_of_object(o)
-                w = mx[idx] - mn[idx]
-                widths.append(w)
-                total_len += w
-            total_span = end - start
-            total_gap = total_span - total_len
-            gap = total_gap / (len(objs) - 1)
-
-            cursor = start
-            for i, o in enumerate(objs):
-                mn, mx = world_bounds_of_object(o)
-                w = widths[i]
-                # move so that current min == cursor
-                delta = cursor - mn[idx]
-                o.location[idx] += delta
-                cursor += w + gap
+            deltas = layout.equal_gap(snap.mins[:, idx], snap.maxs[:, idx])
 
-        return {"FINISHED"}
+        batch = TransformBatch()
+        batch.offset_world_axis_many(snap.objs, idx, deltas)
+        return batch
 
 
-class ALIGNMENT_SUITE_OT_distribute_by_distance(bpy.types.Operator):
-    bl_idname = "alignment_suite.distribute_by_distance"
-    bl_label = "Distribute By Distance"
-    bl_options = {"REGISTER", "UNDO"}
+class _DistributeByDistanceProperties:
+    # Listed before SceneSettingsMixin in the bases, so this scene_settings wins
+    scene_settings = {"distance_mode": "distance_mode", "distance": "distance_value", "exact_bounds": "exact_bounds"}
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Distribute along {a}") for a in AXES], name="Axis", default="X")
     distance_mode: bpy.props.EnumProperty(
@@ -83,55 +87,115 @@ class ALIGNMENT_SUITE_OT_distribute_by_distance(bpy.types.Operator):
         ],
         name="Mode",
         default="CENTER",
+        options={"SKIP_SAVE"},
+    )
+    distance: bpy.props.FloatProperty(name="Distance", default=1.0, min=0.0, options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
-    distance: bpy.props.FloatProperty(name="Distance", default=1.0, min=0.0)
 
     @classmethod
     def poll(cls, context):
         return len(context.selected_objects) >= 2 and context.mode == 'OBJECT'
 
+
+class ALIGNMENT_SUITE_OT_distribute_by_distance(_DistributeByDistanceProperties, SceneSettingsMixin, bpy.types.Operator):
+    bl_idname = "alignment_suite.distribute_by_distance"
+    bl_label = "Distribute By Distance"
+    bl_options = {"REGISTER", "UNDO"}
+
     def execute(self, context):
         objs: List[bpy.types.Object] = [o for o in context.selected_objects]
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-        objs = sort_objects_by_axis(objs, self.axis)
+        snap = axis_snapshot(objs, self.axis, with_bounds=self.distance_mode == "GAP", exact=self.exact_bounds)
+        idx = snap.axis
 
         if self.distance_mode == "CENTER":
-            start_center = objs[0].matrix_world.translation[idx]
-            for i, obj in enumerate(objs):
-                loc = obj.location.copy()
-                loc[idx] = start_center + self.distance * i
-                obj.location = loc
+            deltas = layout.fixed_center(snap.keys, self.distance)
         else:
-            # GAP mode uses object bounds; maintain first object's min bound, then place others with fixed gap
-            # Precompute widths on axis
-            widths = []
-            for o in objs:
-                mn, mx = world_bounds_of_object(o)
-                widths.append(mx[idx] - mn[idx])
-            first_min = world_bounds_of_object(objs[0])[0][idx]
-            cursor = first_min
-            for i, o in enumerate(objs):
-                w = widths[i]
-                # place so that min == cursor
-                mn, _ = world_bounds_of_object(o)
-                delta = cursor - mn[idx]
-                o.location[idx] += delta
-                cursor += w + self.distance
+            deltas = layout.fixed_gap(snap.mins[:, idx], snap.maxs[:, idx], self.distance)
 
+        batch = TransformBatch()
+        batch.offset_world_axis_many(snap.objs, idx, deltas)
+        batch.flush(context)
         return {"FINISHED"}
 
 
-class ALIGNMENT_SUITE_OT_distribute_grid(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_distribute_by_distance_modal(
+    _DistributeByDistanceProperties, ModalAxisDragMixin, bpy.types.Operator
+):
+    """Distribute, then drag the mouse to adjust the distance interactively"""
+
+    bl_idname = "alignment_suite.distribute_by_distance_modal"
+    bl_label = "Distribute By Distance (Drag)"
+    bl_options = {"REGISTER", "UNDO", "BLOCKING", "GRAB_CURSOR"}
+    value_prop = "distance"
+    value_label = "Distance"
+    value_min = 0.0
+
+    def build_preview(self, context):
+        objs = list(context.selected_objects)
+        snap = axis_snapshot(objs, self.axis, with_bounds=self.distance_mode == "GAP", exact=self.exact_bounds)
+        idx = snap.axis
+        if self.distance_mode == "CENTER":
+            base = layout.fixed_center(snap.keys, 0.0)
+            rate = layout.fixed_center(snap.keys, 1.0) - base
+        else:
+            mins, maxs = snap.mins[:, idx], snap.maxs[:, idx]
+            base = layout.fixed_gap(mins, maxs, 0.0)
+            rate = layout.fixed_gap(mins, maxs, 1.0) - base
+        return AxisMovePreview(snap.objs, idx, base, rate)
+
+
+class ALIGNMENT_SUITE_OT_distribute_grid(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.distribute_grid"
     bl_label = "Distribute Grid"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "primary_axis": "grid_primary",
+        "secondary_axis": "grid_secondary",
+        "columns": "grid_columns",
+        "spacing_primary": "grid_spacing_primary",
+        "spacing_secondary": "grid_spacing_secondary",
+        "order_by_axis": "grid_sort",
+        "mode": "grid_mode",
+        "gap": "grid_gap",
+        "target_width": "grid_width",
+        "exact_bounds": "exact_bounds",
+    }
+
+    mode: bpy.props.EnumProperty(
+        items=[
+            ("PITCH", "Fixed Pitch", "Place objects on a fixed spacing, ignoring their sizes"),
+            ("SHELF", "Shelf Pack", "Pack world bounds into rows, tallest first, with a gap between them"),
+        ],
+        name="Mode",
+        default="PITCH",
+        options={"SKIP_SAVE"},
+    )
 
-    primary_axis: bpy.props.EnumProperty(items=[(a, a, f"Primary {a}") for a in AXES], name="Primary Axis", default="X")
-    secondary_axis: bpy.props.EnumProperty(items=[(a, a, f"Secondary {a}") for a in AXES], name="Secondary Axis", default="Y")
-    columns: bpy.props.IntProperty(name="Columns", default=3, min=1)
-    spacing_primary: bpy.props.FloatProperty(name="Primary Spacing", default=1.0, min=0.0)
-    spacing_secondary: bpy.props.FloatProperty(name="Secondary Spacing", default=1.0, min=0.0)
-    order_by_axis: bpy.props.EnumProperty(items=[(a, a, f"Sort by {a}") for a in AXES], name="Order By", default="X")
+    primary_axis: bpy.props.EnumProperty(items=[(a, a, f"Primary {a}") for a in AXES], name="Primary Axis", default="X", options={"SKIP_SAVE"})
+    secondary_axis: bpy.props.EnumProperty(items=[(a, a, f"Secondary {a}") for a in AXES], name="Secondary Axis", default="Y", options={"SKIP_SAVE"})
+    columns: bpy.props.IntProperty(name="Columns", default=3, min=1, options={"SKIP_SAVE"})
+    spacing_primary: bpy.props.FloatProperty(name="Primary Spacing", default=1.0, min=0.0, options={"SKIP_SAVE"})
+    spacing_secondary: bpy.props.FloatProperty(name="Secondary Spacing", default=1.0, min=0.0, options={"SKIP_SAVE"})
+    order_by_axis: bpy.props.EnumProperty(items=[(a, a, f"Sort by {a}") for a in AXES], name="Order By", default="X", options={"SKIP_SAVE"})
+    gap: bpy.props.FloatProperty(name="Gap", default=0.1, min=0.0, description="Space between packed bounds", options={"SKIP_SAVE"})
+    target_width: bpy.props.FloatProperty(
+        name="Target Width",
+        default=0.0,
+        min=0.0,
+        description="Row length along the primary axis before a new shelf starts; 0 packs roughly square",
+        options={"SKIP_SAVE"},
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
 
     @classmethod
     def poll(cls, context):
@@ -139,31 +203,250 @@ class ALIGNMENT_SUITE_OT_distribute_grid(bpy.types.Operator):
 
     def execute(self, context):
         objs: List[bpy.types.Object] = [o for o in context.selected_objects]
-        # Order selection to make grid stable
-        objs = sort_objects_by_axis(objs, self.order_by_axis)
+        pi = axis_index(self.primary_axis)
+        si = axis_index(self.secondary_axis)
+        if self.mode == "SHELF":
+            return self._shelf_pack(context, objs, [pi, si])
+
+        # Order selection to make grid stable; the first object is the grid origin
+        positions = np.array([o.matrix_world.translation for o in objs], dtype=float).reshape(-1, 3)
+        order = np.argsort(positions[:, axis_index(self.order_by_axis)], kind="stable")
+        objs = [objs[i] for i in order]
+        positions = positions[order]
+
+        # World moves, so parented objects land on the grid too
+        deltas = np.zeros((len(objs), 3))
+        deltas[:, [pi, si]] = layout.grid(positions[:, [pi, si]], self.columns, (self.spacing_primary, self.spacing_secondary))
+
+        batch = TransformBatch()
+        for obj, delta in zip(objs, deltas):
+            batch.offset_world(obj, delta)
+        batch.flush(context)
+
+        return {"FINISHED"}
 
-        pi = {"X": 0, "Y": 1, "Z": 2}[self.primary_axis]
-        si = {"X": 0, "Y": 1, "Z": 2}[self.secondary_axis]
+    def _shelf_pack(self, context, objs, axes):
+        mins, maxs = world_bounds_array(objs, self.exact_bounds)
+        corners = layout.shelf_pack(maxs[:, axes] - mins[:, axes], self.gap, self.target_width)
+        # The pack starts at the selection's lower corner
+        deltas = np.zeros((len(objs), 3))
+        deltas[:, axes] = mins[:, axes].min(axis=0) + corners - mins[:, axes]
+
+        batch = TransformBatch()
+        for obj, delta in zip(objs, deltas):
+            batch.offset_world(obj, delta)
+        batch.flush(context)
+        return {"FINISHED"}
+
+
+class ALIGNMENT_SUITE_OT_distribute_along_path(SceneSettingsMixin, bpy.types.Operator):
+    bl_idname = "alignment_suite.distribute_along_path"
+    bl_label = "Distribute Along Path"
+    bl_description = "Spread the selected objects along the active curve, in the order they lie along it"
+    bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "spacing_mode": "path_spacing",
+        "align_rotation": "path_align",
+        "track_axis": "path_track",
+        "up_axis": "path_up",
+        "exact_bounds": "exact_bounds",
+    }
+
+    spacing_mode: bpy.props.EnumProperty(
+        items=[
+            ("GAP", "Equal Gap", "Equalize the gaps, measuring each object along its Track Axis"),
+            ("CENTER", "Equal Center", "Equalize the distances between origins"),
+        ],
+        name="Spacing",
+        default="CENTER",
+        options={"SKIP_SAVE"},
+    )
+    align_rotation: bpy.props.BoolProperty(name="Align to Tangent", default=False, description="Point Track Axis along the path", options={"SKIP_SAVE"})
+    track_axis: bpy.props.EnumProperty(items=[(a, a, f"Track local {a}") for a in AXES], name="Track Axis", default="Y", options={"SKIP_SAVE"})
+    up_axis: bpy.props.EnumProperty(items=[(a, a, f"Up {a}") for a in AXES], name="Up", default="Z", options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        path = context.active_object
+        return (
+            context.mode == 'OBJECT'
+            and path is not None
+            and path.type == 'CURVE'
+            and len(context.selected_objects) >= 2
+        )
 
-        # Use first object's position as origin
-        origin_primary = objs[0].location[pi]
-        origin_secondary = objs[0].location[si]
+    def execute(self, context):
+        path = context.active_object
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects if o != path]
+        if self.align_rotation:
+            if self.track_axis == self.up_axis:
+                self.report({"ERROR"}, "Track Axis must differ from Up")
+                return {"CANCELLED"}
+            selected = set(objs)
+            if any(has_ancestor_in(obj, selected) for obj in objs):
+                self.report({"ERROR"}, "Align to Tangent cannot rotate objects whose parent is also selected")
+                return {"CANCELLED"}
+        points, cyclic = curve_path_points(path)
+        if len(points) < 2:
+            self.report({"WARNING"}, "The active curve has no path to follow")
+            return {"CANCELLED"}
+        table = layout.arc_length_table(points)
+
+        # Keep the order the objects already have along the path
+        locations = np.array([obj.matrix_world.translation for obj in objs], dtype=float).reshape(-1, 3)
+        tree = KDTree(len(points))
+        for i, co in enumerate(points):
+            tree.insert(co, i)
+        tree.balance()
+        nearest = np.fromiter((tree.find(co)[1] for co in locations), dtype=np.int64, count=len(objs))
+        order = np.argsort(layout.project_onto_path(points, table, locations, nearest), kind="stable")
+        objs = [objs[i] for i in order]
+        locations = locations[order]
+
+        if self.spacing_mode == "GAP":
+            # World length along each object's Track Axis, which is what ends up along the path
+            track = axis_index(self.track_axis)
+            directions = np.array([np.array(obj.matrix_world)[:3, track] for obj in objs], dtype=float).reshape(-1, 3)
+            norms = np.linalg.norm(directions, axis=1, keepdims=True)
+            directions = np.divide(directions, norms, out=np.zeros_like(directions), where=norms > 0.0)
+            lengths = world_extents_along(objs, directions, self.exact_bounds)
+            distances = layout.path_gap_distances(lengths, table[-1], cyclic)
+        else:
+            distances = layout.path_center_distances(len(objs), table[-1], cyclic)
+        targets, tangents = layout.point_on_path(points, table, distances)
+
+        batch = TransformBatch()
+        for obj, target, location, tangent in zip(objs, targets, locations, tangents):
+            batch.offset_world(obj, target - location)
+            if self.align_rotation and tangent.any():
+                rotation = Vector(tangent).to_track_quat(self.track_axis, self.up_axis)
+                batch.set_rotation(obj, world_to_local_rotation(obj, rotation))
+        batch.flush(context)
+        return {"FINISHED"}
 
-        for idx_obj, obj in enumerate(objs):
-            row = idx_obj // self.columns
-            col = idx_obj % self.columns
-            loc = obj.location.copy()
-            loc[pi] = origin_primary + col * self.spacing_primary
-            loc[si] = origin_secondary + row * self.spacing_secondary
-            obj.location = loc
 
+class ALIGNMENT_SUITE_OT_distribute_circle(SceneSettingsMixin, bpy.types.Operator):
+    bl_idname = "alignment_suite.distribute_circle"
+    bl_label = "Distribute Circle"
+    bl_description = "Place the selected objects evenly on a circle or arc, in their current order around the center"
+    bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "center_mode": "circle_center",
+        "normal_axis": "circle_normal",
+        "radius": "circle_radius",
+        "start_angle": "circle_start",
+        "end_angle": "circle_end",
+        "face_center": "circle_face",
+        "track_axis": "circle_track",
+        "exact_bounds": "exact_bounds",
+    }
+
+    center_mode: bpy.props.EnumProperty(
+        items=[
+            ("WORLD", "World Origin", "Center on the world origin"),
+            ("CURSOR", "3D Cursor", "Center on the 3D cursor"),
+            ("ACTIVE", "Active Object", "Center on the active object"),
+            ("SELECTION", "Selection Center", "Center on the selection bounds"),
+        ],
+        name="Center",
+        default="SELECTION",
+        options={"SKIP_SAVE"},
+    )
+    normal_axis: bpy.props.EnumProperty(items=[(a, a, f"Circle around world {a}") for a in AXES], name="Normal", default="Z", options={"SKIP_SAVE"})
+    radius: bpy.props.FloatProperty(name="Radius", default=5.0, min=0.0, options={"SKIP_SAVE"})
+    start_angle: bpy.props.FloatProperty(name="Start Angle", default=0.0, description="Degrees", options={"SKIP_SAVE"})
+    end_angle: bpy.props.FloatProperty(name="End Angle", default=360.0, description="Degrees; a full turn spaces the last object like the rest", options={"SKIP_SAVE"})
+    face_center: bpy.props.BoolProperty(name="Face Center", default=False, description="Point Track Axis at the center", options={"SKIP_SAVE"})
+    track_axis: bpy.props.EnumProperty(items=[(a, a, f"Track local {a}") for a in AXES], name="Track Axis", default="Y", options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(context.selected_objects) >= 2
+
+    def execute(self, context):
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
+        if self.center_mode == "ACTIVE":
+            objs = [o for o in objs if o != context.view_layer.objects.active]
+        if self.face_center:
+            if self.track_axis == self.normal_axis:
+                self.report({"ERROR"}, "Track Axis must differ from the circle normal")
+                return {"CANCELLED"}
+            selected = set(objs)
+            if any(has_ancestor_in(obj, selected) for obj in objs):
+                self.report({"ERROR"}, "Face Center cannot rotate objects whose parent is also selected")
+                return {"CANCELLED"}
+        a, b, n = plane_axes_from_normal(self.normal_axis)
+        center = np.array(origin_point(context, self.center_mode, objs, self.exact_bounds), dtype=float)
+        locations = np.array([obj.matrix_world.translation for obj in objs], dtype=float).reshape(-1, 3)
+
+        # Walk the circle in the order the objects already have around the center
+        start, end = radians(self.start_angle), radians(self.end_angle)
+        relative = locations - center
+        current = np.mod(np.arctan2(relative[:, b], relative[:, a]) - start, 2.0 * np.pi)
+        order = np.argsort(current, kind="stable")
+        objs = [objs[i] for i in order]
+        locations = locations[order]
+
+        angles = layout.circle_angles(len(objs), start, end)
+        targets = locations.copy()
+        targets[:, a] = center[a] + self.radius * np.cos(angles)
+        targets[:, b] = center[b] + self.radius * np.sin(angles)
+
+        batch = TransformBatch()
+        for obj, delta in zip(objs, targets - locations):
+            batch.offset_world(obj, delta)
+        if self.face_center:
+            for obj, rotation in zip(objs, self._facing_rotations(angles, a, b, n)):
+                batch.set_rotation(obj, world_to_local_rotation(obj, Quaternion(rotation)))
+        batch.flush(context)
         return {"FINISHED"}
 
+    def _facing_rotations(self, angles, a, b, n):
+        """(N, 4) quaternions that turn Track Axis towards the center at each angle."""
+        # Orientation at angle 0, then the same orientation turned about the normal
+        inward = Vector((0.0, 0.0, 0.0))
+        inward[a] = -1.0
+        base = np.array(inward.to_track_quat(self.track_axis, self.normal_axis), dtype=float)
+        # Turning by +angle about +normal takes axis a to b unless (a, b, n) is left-handed
+        sign = 1.0 if (a, b, n) in ((0, 1, 2), (1, 2, 0), (2, 0, 1)) else -1.0
+        half = sign * angles / 2.0
+        turn = np.zeros((len(angles), 4))
+        turn[:, 0] = np.cos(half)
+        turn[:, 1 + n] = np.sin(half)
+        return _quaternion_product(turn, base)
+
+
+def _quaternion_product(p: "np.ndarray", q: "np.ndarray") -> "np.ndarray":
+    """Hamilton product of (N, 4) ``p`` and (4,) ``q`` in (w, x, y, z) order."""
+    w1, x1, y1, z1 = p.T
+    w2, x2, y2, z2 = q
+    return np.column_stack((
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ))
+
 
 classes = (
     ALIGNMENT_SUITE_OT_distribute_objects,
     ALIGNMENT_SUITE_OT_distribute_by_distance,
+    ALIGNMENT_SUITE_OT_distribute_by_distance_modal,
     ALIGNMENT_SUITE_OT_distribute_grid,
+    ALIGNMENT_SUITE_OT_distribute_along_path,
+    ALIGNMENT_SUITE_OT_distribute_circle,
 )
 
 
@@ -1,15 +1,39 @@
-from typing import List
+from typing import List, Tuple
 
 import bpy
 from mathutils import Vector
 
-from .utils import AXES, active_object, alignment_target_value, mirror_point_across_plane, world_bounds_of_object
+from . import profiling
+from .lazy import lazy_import
+from .modal import ChunkedJob, ChunkedModalMixin, ChunkedTransform
+from .utils import (
+    AXES,
+    TransformBatch,
+    active_object,
+    alignment_target_value,
+    axis_index,
+    bmesh_from_active,
+    edit_mesh_arrays,
+    mirror_point_across_plane,
+    supports_bulk_edit,
+    transform_points,
+    world_bounds_of_object,
+    write_edit_mesh_coords,
+)
+
+np = lazy_import("numpy")
 
 
-class ALIGNMENT_SUITE_OT_mirror_objects(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_mirror_objects(ChunkedModalMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.mirror_objects"
     bl_label = "Mirror Objects"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "plane_origin_mode": "plane_origin",
+        "duplicate": "duplicate_on_mirror",
+        "duplicate_data": "duplicate_data",
+        "exact_bounds": "exact_bounds",
+    }
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Mirror across {a}") for a in AXES], name="Axis", default="X")
     plane_origin_mode: bpy.props.EnumProperty(
@@ -21,8 +45,25 @@ class ALIGNMENT_SUITE_OT_mirror_objects(bpy.types.Operator):
         ],
         name="Plane Origin",
         default="WORLD",
+        options={"SKIP_SAVE"},
+    )
+    duplicate: bpy.props.BoolProperty(name="Duplicate", default=True, description="If enabled, creates mirrored duplicates instead of transforming originals", options={"SKIP_SAVE"})
+    duplicate_data: bpy.props.EnumProperty(
+        items=[
+            ("UNIQUE", "Copy Once", "Copy each data block once and share the copy between all of its duplicates"),
+            ("LINKED", "Linked", "Share the original data; the negative scale already mirrors it"),
+            ("FULL", "Copy Each", "Give every duplicate its own copy of the data"),
+        ],
+        name="Duplicate Data",
+        default="UNIQUE",
+        options={"SKIP_SAVE"},
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
-    duplicate: bpy.props.BoolProperty(name="Duplicate", default=True, description="If enabled, creates mirrored duplicates instead of transforming originals")
 
     @classmethod
     def poll(cls, context):
@@ -30,37 +71,155 @@ class ALIGNMENT_SUITE_OT_mirror_objects(bpy.types.Operator):
 
     def execute(self, context):
         objs: List[bpy.types.Object] = [o for o in context.selected_objects]
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-
-        # Determine plane origin
-        if self.plane_origin_mode in {"WORLD", "CURSOR", "ACTIVE"}:
-            origin_value = alignment_target_value(context, self.axis, self.plane_origin_mode)
-        else:
-            # selection bounds center
-            from .utils import world_bounds_of_objects
-
-            mn_all, mx_all = world_bounds_of_objects(objs)
-            origin_value = 0.5 * (mn_all[idx] + mx_all[idx])
+        origin_value = self._origin_value(context, objs)
+        if self.duplicate:
+            objs, saved = self._duplicate(context, objs, {})
+            self._report_saved(saved)
+        self._mirrored(objs, origin_value).flush(context)
+        return {"FINISHED"}
 
-        for obj in objs:
-            if self.duplicate:
-                new_obj = obj.copy()
-                new_obj.data = obj.data.copy() if obj.data else None
-                context.collection.objects.link(new_obj)
-                target = new_obj
-            else:
-                target = obj
+    def chunked_job(self, context):
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
+        origin_value = self._origin_value(context, objs)
+        if self.duplicate:
+            return _ChunkedMirrorDuplicates(self, objs, origin_value)
+        return ChunkedTransform(self._mirrored(objs, origin_value))
 
+    def _origin_value(self, context, objs: List[bpy.types.Object]) -> float:
+        if self.plane_origin_mode in {"WORLD", "CURSOR", "ACTIVE"}:
+            return alignment_target_value(context, self.axis, self.plane_origin_mode, objs, self.exact_bounds)
+        # selection bounds center
+        from .utils import world_bounds_of_objects
+
+        idx = axis_index(self.axis)
+        mn_all, mx_all = world_bounds_of_objects(objs, self.exact_bounds)
+        return 0.5 * (mn_all[idx] + mx_all[idx])
+
+    def _mirrored(self, targets: List[bpy.types.Object], origin_value: float) -> TransformBatch:
+        idx = axis_index(self.axis)
+        batch = TransformBatch()
+        for target in targets:
             loc = target.location.copy()
             loc[idx] = 2.0 * origin_value - loc[idx]
-            target.location = loc
+            batch.set_location(target, loc)
 
             # Mirror rotation and scale along axis
-            scale = list(target.scale)
+            scale = target.scale.copy()
             scale[idx] *= -1.0
-            target.scale = scale
+            batch.set_scale(target, scale)
+        return batch
 
-        return {"FINISHED"}
+    def _report_saved(self, saved: int) -> None:
+        if saved:
+            self.report({"INFO"}, f"Shared data between duplicates, saved ~{_format_bytes(saved)}")
+
+    def _duplicate(self, context, objs: List[bpy.types.Object], copies: dict) -> Tuple[List[bpy.types.Object], int]:
+        """Linked copies of ``objs`` and the estimated bytes saved by sharing data.
+
+        ``copies`` maps original data to its copy for "Copy Once"; pass the
+        same dict to share copies across calls.
+        """
+        saved = 0
+        new_objs = []
+        for obj in objs:
+            # Object.copy() shares the original data, which is what LINKED wants
+            new_obj = obj.copy()
+            data = obj.data
+            if data is None:
+                pass
+            elif self.duplicate_data == "FULL":
+                new_obj.data = data.copy()
+            elif self.duplicate_data == "UNIQUE" and data not in copies:
+                copies[data] = new_obj.data = data.copy()
+            else:
+                if self.duplicate_data == "UNIQUE":
+                    new_obj.data = copies[data]
+                saved += _estimated_data_size(data)
+            new_objs.append(new_obj)
+
+        # Link all duplicates in one pass once they exist
+        link = context.collection.objects.link
+        for new_obj in new_objs:
+            link(new_obj)
+        return new_objs, saved
+
+
+class _ChunkedMirrorDuplicates(ChunkedJob):
+    """Duplicates and mirrors a slice of the selection per step; cancel deletes what it made."""
+
+    def __init__(self, operator, objs: List[bpy.types.Object], origin_value: float) -> None:
+        self.operator = operator
+        self.objs = objs
+        self.origin_value = origin_value
+        self.total = len(objs)
+        self.done = 0
+        self.created: List[bpy.types.Object] = []
+        self._copies = {}
+        self._saved = 0
+
+    def step(self, count, context):
+        sources = self.objs[self.done:self.done + count]
+        new_objs, saved = self.operator._duplicate(context, sources, self._copies)
+        self.created += new_objs
+        self._saved += saved
+        self.operator._mirrored(new_objs, self.origin_value).flush(context, update=False)
+        self.done += len(sources)
+        return len(sources)
+
+    def finish(self, context):
+        super().finish(context)
+        self.operator._report_saved(self._saved)
+
+    def cancel(self, context):
+        originals = {obj.data for obj in self.objs}
+        data = {obj.data for obj in self.created if obj.data is not None and obj.data not in originals}
+        bpy.data.batch_remove(self.created + list(data))
+        self.created.clear()
+        self._copies.clear()
+        self.done = 0
+        context.view_layer.update()
+
+
+# Bytes per element for mesh attribute data types
+_ATTRIBUTE_SIZES = {
+    "FLOAT": 4,
+    "INT": 4,
+    "FLOAT_VECTOR": 12,
+    "FLOAT_COLOR": 16,
+    "BYTE_COLOR": 4,
+    "STRING": 1,
+    "BOOLEAN": 1,
+    "FLOAT2": 8,
+    "INT8": 1,
+    "INT16_2D": 4,
+    "INT32_2D": 8,
+    "QUATERNION": 16,
+    "FLOAT4X4": 64,
+}
+
+
+def _estimated_data_size(data) -> int:
+    """Rough in-memory size of a mesh data block from its attribute layers; 0 for other types."""
+    if not isinstance(data, bpy.types.Mesh):
+        return 0
+    counts = {
+        "POINT": len(data.vertices),
+        "EDGE": len(data.edges),
+        "FACE": len(data.polygons),
+        "CORNER": len(data.loops),
+    }
+    size = 4 * (len(data.polygons) + 1)  # face offsets
+    for attr in data.attributes:
+        size += counts.get(attr.domain, 0) * _ATTRIBUTE_SIZES.get(attr.data_type, 4)
+    return size
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024.0 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} GB"
 
 
 class ALIGNMENT_SUITE_OT_mirror_mesh(bpy.types.Operator):
@@ -88,27 +247,54 @@ class ALIGNMENT_SUITE_OT_mirror_mesh(bpy.types.Operator):
 
     def execute(self, context):
         import bmesh
-        from .utils import bmesh_from_active, set_selected_verts_axis
 
         bm, obj = bmesh_from_active()
-        mw = obj.matrix_world
-        imw = mw.inverted_safe()
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
+        idx = axis_index(self.axis)
 
-        if self.plane_origin_mode in {"WORLD", "CURSOR", "ACTIVE"}:
-            origin_value = alignment_target_value(context, self.axis, self.plane_origin_mode)
-        else:
-            from .utils import bounds_of_selected_verts_world
+        if self.duplicate:
+            self._duplicate_selection(bm, obj)
+            bmesh.update_edit_mesh(obj.data)
+            profiling.count("depsgraph_updates")
+
+        if not supports_bulk_edit(obj):
+            return self._execute_bmesh(context, bm, obj)
+
+        co, sel = edit_mesh_arrays(obj)
+        world = transform_points(co[sel], obj.matrix_world)
+        origin_value = self._origin_value(context, world)
+        world[:, idx] = 2.0 * origin_value - world[:, idx]
+        write_edit_mesh_coords(obj, np.flatnonzero(sel), transform_points(world, obj.matrix_world.inverted_safe()))
+        return {"FINISHED"}
 
-            mn, mx = bounds_of_selected_verts_world(bm, obj)
-            origin_value = 0.5 * (mn[idx] + mx[idx])
+    def _duplicate_selection(self, bm, obj) -> None:
+        # Gather the selection through bulk reads instead of scanning every element
+        import bmesh
 
-        if self.duplicate:
-            geom = [v for v in bm.verts if v.select] + [e for e in bm.edges if e.select] + [f for f in bm.faces if f.select]
-            ret = bmesh.ops.duplicate(bm, geom=geom)
-            new_geom = ret.get("geom", [])
-            for elem in new_geom:
-                elem.select = True
+        obj.update_from_editmode()
+        me = obj.data
+        geom = []
+        for seq, elems in ((bm.verts, me.vertices), (bm.edges, me.edges), (bm.faces, me.polygons)):
+            flags = np.empty(len(elems), dtype=bool)
+            elems.foreach_get("select", flags)
+            seq.ensure_lookup_table()
+            geom.extend(seq[i] for i in np.flatnonzero(flags))
+
+        ret = bmesh.ops.duplicate(bm, geom=geom)
+        # Only the copies get mirrored; the originals stay where they are
+        for elem in geom:
+            elem.select = False
+        for elem in ret.get("geom", []):
+            elem.select = True
+
+    def _execute_bmesh(self, context, bm, obj):
+        # Per-vertex fallback for meshes that cannot use the bulk array path
+        import bmesh
+
+        mw = obj.matrix_world
+        imw = mw.inverted_safe()
+        idx = axis_index(self.axis)
+        coords = [mw @ v.co for v in bm.verts if v.select]
+        origin_value = self._origin_value(context, np.array(coords, dtype=float).reshape(-1, 3))
 
         for v in bm.verts:
             if not v.select:
@@ -118,8 +304,19 @@ class ALIGNMENT_SUITE_OT_mirror_mesh(bpy.types.Operator):
             v.co = imw @ w
 
         bmesh.update_edit_mesh(obj.data)
+        profiling.count("verts", len(bm.verts))
+        profiling.count("depsgraph_updates")
         return {"FINISHED"}
 
+    def _origin_value(self, context, world: "np.ndarray") -> float:
+        if self.plane_origin_mode in {"WORLD", "CURSOR", "ACTIVE"}:
+            return alignment_target_value(context, self.axis, self.plane_origin_mode)
+        # Selection bounds center
+        if len(world) == 0:
+            return 0.0
+        idx = axis_index(self.axis)
+        return 0.5 * (world[:, idx].min() + world[:, idx].max())
+
 
 classes = (
     ALIGNMENT_SUITE_OT_mirror_objects,
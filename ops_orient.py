@@ -3,16 +3,23 @@ from typing import List
 import bpy
 from mathutils import Vector
 
-from .utils import AXES, origin_point
+from .utils import AXES, SceneSettingsMixin, TransformBatch, origin_point
 
 
-class ALIGNMENT_SUITE_OT_orient_to_point(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_orient_to_point(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.orient_to_point"
     bl_label = "Aim At Target"
     bl_options = {"REGISTER", "UNDO"}
-
-    local_axis: bpy.props.EnumProperty(items=[(a, a, f"Track local {a}") for a in AXES], name="Local Axis", default="Y")
-    up_axis: bpy.props.EnumProperty(items=[(a, a, f"Up {a}") for a in AXES], name="Up", default="Z")
+    scene_settings = {
+        "local_axis": "orient_local",
+        "up_axis": "orient_up",
+        "target_mode": "orient_target",
+        "invert": "orient_invert",
+        "exact_bounds": "exact_bounds",
+    }
+
+    local_axis: bpy.props.EnumProperty(items=[(a, a, f"Track local {a}") for a in AXES], name="Local Axis", default="Y", options={"SKIP_SAVE"})
+    up_axis: bpy.props.EnumProperty(items=[(a, a, f"Up {a}") for a in AXES], name="Up", default="Z", options={"SKIP_SAVE"})
     target_mode: bpy.props.EnumProperty(
         items=[
             ("WORLD", "World Origin", "Aim at world origin"),
@@ -22,19 +29,27 @@ class ALIGNMENT_SUITE_OT_orient_to_point(bpy.types.Operator):
         ],
         name="Target",
         default="SELECTION",
+        options={"SKIP_SAVE"},
+    )
+    invert: bpy.props.BoolProperty(name="Invert Direction", default=False, options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
     )
-    invert: bpy.props.BoolProperty(name="Invert Direction", default=False)
 
     @classmethod
     def poll(cls, context):
         return context.mode == 'OBJECT' and context.selected_objects
 
     def execute(self, context):
-        target = origin_point(context, self.target_mode)
+        target = origin_point(context, self.target_mode, exact=self.exact_bounds)
 
         track = self.local_axis
         up = self.up_axis
 
+        batch = TransformBatch()
         for obj in context.selected_objects:
             direction = target - obj.matrix_world.translation
             if self.invert:
@@ -42,21 +57,21 @@ class ALIGNMENT_SUITE_OT_orient_to_point(bpy.types.Operator):
             if direction.length_squared == 0.0:
                 continue
             quat = direction.normalized().to_track_quat(track, up)
-            prev_mode = obj.rotation_mode
-            obj.rotation_mode = 'QUAT'
-            obj.rotation_quaternion = quat
-            obj.rotation_mode = prev_mode
+            # Converted to the object's own rotation mode on flush
+            batch.set_rotation(obj, quat)
+        batch.flush(context)
         return {"FINISHED"}
 
 
-class ALIGNMENT_SUITE_OT_match_size_axis(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_match_size_axis(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.match_size_axis"
     bl_label = "Match Size (Axis)"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {"size": "match_size", "uniform": "match_uniform"}
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
-    size: bpy.props.FloatProperty(name="Size", default=1.0, min=0.0)
-    uniform: bpy.props.BoolProperty(name="Uniform Scale", default=False, description="Scale uniformly to match the size along axis")
+    size: bpy.props.FloatProperty(name="Size", default=1.0, min=0.0, options={"SKIP_SAVE"})
+    uniform: bpy.props.BoolProperty(name="Uniform Scale", default=False, description="Scale uniformly to match the size along axis", options={"SKIP_SAVE"})
 
     @classmethod
     def poll(cls, context):
@@ -64,17 +79,19 @@ class ALIGNMENT_SUITE_OT_match_size_axis(bpy.types.Operator):
 
     def execute(self, context):
         idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
+        batch = TransformBatch()
         for obj in context.selected_objects:
             dims = obj.dimensions.copy()
             if dims[idx] <= 0.0:
                 continue
             factor = self.size / dims[idx]
+            sc = obj.scale.copy()
             if self.uniform:
-                obj.scale *= factor
+                sc *= factor
             else:
-                sc = list(obj.scale)
                 sc[idx] *= factor
-                obj.scale = sc
+            batch.set_scale(obj, sc)
+        batch.flush(context)
         return {"FINISHED"}
 
 
@@ -1,20 +1,48 @@
 from typing import List
 
 import bpy
-from mathutils import Vector
 
-from .utils import AXES, world_bounds_of_object
+from . import layout
+from .lazy import lazy_import
+from .utils import AXES, SceneSettingsMixin, TransformBatch, axis_index, world_bounds_array, world_bounds_of_object
 
+np = lazy_import("numpy")
 
-class ALIGNMENT_SUITE_OT_snap_minmax_to_minmax(bpy.types.Operator):
+# Object types whose bounds are only their origin
+_BOUNDLESS_TYPES = {"EMPTY", "LIGHT", "CAMERA", "SPEAKER", "LIGHT_PROBE"}
+
+
+class ALIGNMENT_SUITE_OT_snap_minmax_to_minmax(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.snap_minmax_to_minmax"
     bl_label = "Snap Edge -> Edge"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "source_side": "snap_source",
+        "target_side": "snap_target_side",
+        "target": "snap_target",
+        "exact_bounds": "exact_bounds",
+    }
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
-    source_side: bpy.props.EnumProperty(items=[("MIN", "Min", "Use minimum bound"), ("MAX", "Max", "Use maximum bound")], name="Source Side", default="MIN")
-    target_side: bpy.props.EnumProperty(items=[("MIN", "Min", "Use minimum bound"), ("MAX", "Max", "Use maximum bound")], name="Target Side", default="MIN")
-    target: bpy.props.EnumProperty(items=[("ACTIVE", "Active", "Use active object as target"), ("CURSOR", "Cursor", "Use 3D Cursor as target"), ("WORLD", "World 0", "Use world origin")], name="Target", default="ACTIVE")
+    source_side: bpy.props.EnumProperty(items=[("MIN", "Min", "Use minimum bound"), ("MAX", "Max", "Use maximum bound")], name="Source Side", default="MIN", options={"SKIP_SAVE"})
+    target_side: bpy.props.EnumProperty(items=[("MIN", "Min", "Use minimum bound"), ("MAX", "Max", "Use maximum bound")], name="Target Side", default="MIN", options={"SKIP_SAVE"})
+    target: bpy.props.EnumProperty(
+        items=[
+            ("ACTIVE", "Active", "Use active object as target"),
+            ("CURSOR", "Cursor", "Use 3D Cursor as target"),
+            ("WORLD", "World 0", "Use world origin"),
+            ("NEIGHBOR", "Nearest Face", "Snap each object to the closest opposing face of a visible, unselected object with geometry that lies across from it"),
+        ],
+        name="Target",
+        default="ACTIVE",
+        options={"SKIP_SAVE"},
+    )
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
 
     @classmethod
     def poll(cls, context):
@@ -25,43 +53,73 @@ class ALIGNMENT_SUITE_OT_snap_minmax_to_minmax(bpy.types.Operator):
         sel = [o for o in context.selected_objects]
         act = context.view_layer.objects.active
 
+        if self.target == "NEIGHBOR":
+            return self._snap_to_neighbors(context, sel, idx)
+
         if self.target == "ACTIVE" and act is not None:
-            t_mn, t_mx = world_bounds_of_object(act)
+            t_mn, t_mx = world_bounds_of_object(act, self.exact_bounds)
             t_val = t_mn[idx] if self.target_side == "MIN" else t_mx[idx]
         elif self.target == "CURSOR":
             t_val = context.scene.cursor.location[idx]
         else:
             t_val = 0.0
 
-        for o in sel:
-            if self.target == "ACTIVE" and o == act:
-                continue
-            s_mn, s_mx = world_bounds_of_object(o)
-            s_val = s_mn[idx] if self.source_side == "MIN" else s_mx[idx]
-            delta = t_val - s_val
-            o.location[idx] += delta
+        if self.target == "ACTIVE":
+            sel = [o for o in sel if o != act]
+        if not sel:
+            return {"FINISHED"}
+        s_mins, s_maxs = world_bounds_array(sel, self.exact_bounds)
+        s_vals = s_mins[:, idx] if self.source_side == "MIN" else s_maxs[:, idx]
+        batch = TransformBatch()
+        batch.offset_world_axis_many(sel, idx, layout.edge_snap(s_vals, t_val))
+        batch.flush(context)
+        return {"FINISHED"}
+
+    def _snap_to_neighbors(self, context, sel, idx):
+        # Min faces snap onto other objects' max faces and vice versa. Moving
+        # objects are no targets: they would snap onto each other's old
+        # faces. Objects without geometry have no faces, only their origin.
+        moving = set(sel)
+        candidates = [
+            obj for obj in context.visible_objects if obj.type not in _BOUNDLESS_TYPES and obj not in moving
+        ]
+        c_mins, c_maxs = world_bounds_array(candidates, self.exact_bounds)
+        s_mins, s_maxs = world_bounds_array(sel, self.exact_bounds)
+        # Only faces of boxes that lie across from the moving box on the other axes count
+        across = [i for i in range(3) if i != idx]
+        extents = (s_mins[:, across], s_maxs[:, across], c_mins[:, across], c_maxs[:, across])
+        if self.source_side == "MIN":
+            deltas = layout.nearest_face_snap(s_mins[:, idx], c_maxs[:, idx], *extents)
+        else:
+            deltas = layout.nearest_face_snap(s_maxs[:, idx], c_mins[:, idx], *extents)
+
+        batch = TransformBatch()
+        batch.offset_world_axis_many(sel, idx, deltas)
+        batch.flush(context)
         return {"FINISHED"}
 
 
-class ALIGNMENT_SUITE_OT_snap_to_increment(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_snap_to_increment(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.snap_to_increment"
     bl_label = "Snap To Increment"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {"increment": "snap_increment"}
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
-    increment: bpy.props.FloatProperty(name="Increment", default=0.1, min=0.0)
+    increment: bpy.props.FloatProperty(name="Increment", default=0.1, min=0.0, options={"SKIP_SAVE"})
 
     @classmethod
     def poll(cls, context):
         return context.mode == 'OBJECT' and context.selected_objects
 
     def execute(self, context):
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
-        inc = self.increment if self.increment > 0.0 else 0.0
-        for o in context.selected_objects:
-            loc = o.location.copy()
-            loc[idx] = round(loc[idx] / inc) * inc if inc > 0.0 else loc[idx]
-            o.location = loc
+        idx = axis_index(self.axis)
+        objs = context.selected_objects
+        values = np.array([o.location[idx] for o in objs], dtype=float)
+        batch = TransformBatch()
+        for o, delta in zip(objs, layout.increment_snap(values, self.increment)):
+            batch.offset_location(o, idx, delta)
+        batch.flush(context)
         return {"FINISHED"}
 
 
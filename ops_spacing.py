@@ -2,61 +2,92 @@ from typing import List
 
 import bpy
 
-from .utils import AXES, world_bounds_of_object
+from . import layout
+from .utils import AXES, SceneSettingsMixin, TransformBatch, axis_index, axis_snapshot, world_bounds_array
 
 
-class ALIGNMENT_SUITE_OT_space_inside(bpy.types.Operator):
+class ALIGNMENT_SUITE_OT_space_inside(SceneSettingsMixin, bpy.types.Operator):
     bl_idname = "alignment_suite.space_inside"
     bl_label = "Space Inside Range"
     bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {
+        "range_min": "space_min",
+        "range_max": "space_max",
+        "mode": "space_mode",
+        "exact_bounds": "exact_bounds",
+    }
 
     axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
-    range_min: bpy.props.FloatProperty(name="Range Min", default=0.0)
-    range_max: bpy.props.FloatProperty(name="Range Max", default=10.0)
-    mode: bpy.props.EnumProperty(items=[("CENTER", "Center", "Center-to-center spacing"), ("GAP", "Gap", "Gap between bounds")], default="CENTER")
+    range_min: bpy.props.FloatProperty(name="Range Min", default=0.0, options={"SKIP_SAVE"})
+    range_max: bpy.props.FloatProperty(name="Range Max", default=10.0, options={"SKIP_SAVE"})
+    mode: bpy.props.EnumProperty(items=[("CENTER", "Center", "Center-to-center spacing"), ("GAP", "Gap", "Gap between bounds")], default="CENTER", options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
 
     @classmethod
     def poll(cls, context):
         return context.mode == 'OBJECT' and len(context.selected_objects) >= 2
 
     def execute(self, context):
-        objs: List[bpy.types.Object] = sorted(context.selected_objects, key=lambda o: o.matrix_world.translation[{"X":0,"Y":1,"Z":2}[self.axis]])
-        idx = {"X": 0, "Y": 1, "Z": 2}[self.axis]
         span = self.range_max - self.range_min
         if span <= 0.0:
             return {"CANCELLED"}
 
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
+        snap = axis_snapshot(objs, self.axis, with_bounds=self.mode == "GAP", exact=self.exact_bounds)
+        idx = snap.axis
+
         if self.mode == "CENTER":
-            step = span / (len(objs) - 1)
-            for i, o in enumerate(objs):
-                loc = o.location.copy()
-                loc[idx] = self.range_min + i * step
-                o.location = loc
+            deltas = layout.fit_center(snap.keys, self.range_min, self.range_max)
         else:
-            # GAP mode requires widths
-            widths = []
-            total_w = 0.0
-            for o in objs:
-                mn, mx = world_bounds_of_object(o)
-                w = mx[idx] - mn[idx]
-                widths.append(w)
-                total_w += w
-            total_gap = span - total_w
-            if total_gap < 0.0:
-                total_gap = 0.0
-            gap = total_gap / (len(objs) - 1)
-            cursor = self.range_min
-            for i, o in enumerate(objs):
-                mn, _ = world_bounds_of_object(o)
-                delta = cursor - mn[idx]
-                o.location[idx] += delta
-                cursor += widths[i] + gap
+            deltas = layout.fit_gap(snap.mins[:, idx], snap.maxs[:, idx], self.range_min, self.range_max)
+
+        batch = TransformBatch()
+        batch.offset_world_axis_many(snap.objs, idx, deltas)
+        batch.flush(context)
+        return {"FINISHED"}
+
 
+class ALIGNMENT_SUITE_OT_resolve_overlaps(SceneSettingsMixin, bpy.types.Operator):
+    bl_idname = "alignment_suite.resolve_overlaps"
+    bl_label = "Resolve Overlaps"
+    bl_description = "Push intersecting objects apart along the axis, moving each as little as possible"
+    bl_options = {"REGISTER", "UNDO"}
+    scene_settings = {"gap": "overlap_gap", "exact_bounds": "exact_bounds"}
+
+    axis: bpy.props.EnumProperty(items=[(a, a, f"Axis {a}") for a in AXES], name="Axis", default="X")
+    gap: bpy.props.FloatProperty(name="Gap", default=0.0, min=0.0, description="Minimum gap left between objects that overlapped", options={"SKIP_SAVE"})
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry (modifiers, curves, text) instead of the transformed bounding box",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(context.selected_objects) >= 2
+
+    def execute(self, context):
+        objs: List[bpy.types.Object] = [o for o in context.selected_objects]
+        idx = axis_index(self.axis)
+        mins, maxs = world_bounds_array(objs, self.exact_bounds)
+        deltas = layout.resolve_overlaps(mins, maxs, idx, self.gap)
+
+        batch = TransformBatch()
+        batch.offset_world_axis_many(objs, idx, deltas)
+        batch.flush(context)
+        self.report({"INFO"}, f"Moved {int((deltas > 0.0).sum())} of {len(objs)} objects")
         return {"FINISHED"}
 
 
 classes = (
     ALIGNMENT_SUITE_OT_space_inside,
+    ALIGNMENT_SUITE_OT_resolve_overlaps,
 )
 
 
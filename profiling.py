@@ -0,0 +1,253 @@
+"""Opt-in per-operator instrumentation.
+
+When enabled from the add-on preferences, every wrapped ``execute`` records
+its wall time together with counters bumped from the hot paths in ``utils``
+(objects written, vertices touched, bounds computed, depsgraph updates).
+Modal runs get one record from ``invoke`` until they finish or cancel, timing
+only the calls into the operator, not the wait for events. Wrapped panels
+record how long their ``draw`` takes. The most recent records are shown in
+the panel and can be exported as JSON.
+
+The same wrapper calls every function in ``execute_hooks`` after each
+``execute``, whether profiling is enabled or not; recipes record their steps
+this way.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Tuple
+
+import bpy
+
+COUNTERS = ("objects", "verts", "bounds", "hulls", "cache_hits", "depsgraph_updates")
+MAX_RECORDS = 50
+MAX_DRAW_SAMPLES = 100
+
+enabled = False
+records: Deque[Dict] = deque(maxlen=MAX_RECORDS)
+draw_samples: Dict[str, Deque[float]] = {}
+_stack: List[Dict] = []
+# Called as hook(operator, context, result) after every wrapped execute
+execute_hooks: List[Callable] = []
+_originals: Dict[Tuple[type, str], object] = {}
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add ``amount`` to counter ``name`` of every operator currently being profiled."""
+    for record in _stack:
+        record[name] += amount
+
+
+def notify_executed(operator, context, result) -> None:
+    """Run ``execute_hooks`` for an operator that finished without going through ``execute``."""
+    for hook in execute_hooks:
+        hook(operator, context, result)
+
+
+def _new_record(cls) -> Dict:
+    record = {"operator": cls.bl_idname, "label": cls.bl_label, "timestamp": time.time(), "time_ms": 0.0}
+    record.update(dict.fromkeys(COUNTERS, 0))
+    return record
+
+
+def _wrap_execute(cls, execute):
+    def execute_profiled(self, context):
+        if not enabled:
+            result = execute(self, context)
+            notify_executed(self, context, result)
+            return result
+        record = _new_record(cls)
+        _stack.append(record)
+        start = time.perf_counter()
+        try:
+            result = execute(self, context)
+        finally:
+            record["time_ms"] = (time.perf_counter() - start) * 1000.0
+            _stack.remove(record)
+        record["result"] = sorted(result)
+        records.append(record)
+        notify_executed(self, context, result)
+        return result
+
+    execute_profiled.__name__ = execute.__name__
+    execute_profiled.__doc__ = execute.__doc__
+    execute_profiled.__wrapped__ = execute
+    return execute_profiled
+
+
+def _wrap_modal(cls, method):
+    # invoke starts the record of a run and modal adds to it until it ends. An
+    # invoke that finishes at once keeps no record: it ran execute, which has
+    # its own. Hooks are not called here; modal operators notify on finish.
+    starts = method.__name__ == "invoke"
+
+    def modal_profiled(self, context, event):
+        record = _new_record(cls) if starts and enabled else getattr(self, "_profile_record", None)
+        if record is None:
+            return method(self, context, event)
+        _stack.append(record)
+        start = time.perf_counter()
+        try:
+            result = method(self, context, event)
+        finally:
+            record["time_ms"] += (time.perf_counter() - start) * 1000.0
+            _stack.remove(record)
+        if "RUNNING_MODAL" in result or "PASS_THROUGH" in result:
+            self._profile_record = record
+            return result
+        self._profile_record = None
+        if not starts:
+            record["result"] = sorted(result)
+            records.append(record)
+        return result
+
+    modal_profiled.__name__ = method.__name__
+    modal_profiled.__doc__ = method.__doc__
+    modal_profiled.__wrapped__ = method
+    return modal_profiled
+
+
+def _wrap_draw(cls, draw):
+    def draw_profiled(self, context):
+        if not enabled:
+            return draw(self, context)
+        start = time.perf_counter()
+        try:
+            return draw(self, context)
+        finally:
+            samples = draw_samples.get(cls.bl_label)
+            if samples is None:
+                samples = draw_samples[cls.bl_label] = deque(maxlen=MAX_DRAW_SAMPLES)
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+    draw_profiled.__name__ = draw.__name__
+    draw_profiled.__doc__ = draw.__doc__
+    draw_profiled.__wrapped__ = draw
+    return draw_profiled
+
+
+def instrument(classes) -> None:
+    """Wrap ``execute`` of operator classes and ``draw`` of panels; a no-op for already wrapped ones.
+
+    Methods are looked up through the MRO, so ones inherited from a mixin are
+    wrapped on each class that uses them. Modal operators also get ``invoke``
+    and ``modal`` wrapped.
+    """
+    for cls in classes:
+        wrappers = [("execute", _wrap_execute), ("draw", _wrap_draw)]
+        if callable(getattr(cls, "modal", None)):
+            wrappers += [("invoke", _wrap_modal), ("modal", _wrap_modal)]
+        for name, wrap in wrappers:
+            method = getattr(cls, name, None)
+            if (cls, name) in _originals or not callable(method):
+                continue
+            # None marks a method the class inherited; uninstrument deletes it again
+            _originals[cls, name] = cls.__dict__.get(name)
+            setattr(cls, name, wrap(cls, getattr(method, "__wrapped__", method)))
+
+
+def uninstrument() -> None:
+    for (cls, name), original in _originals.items():
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+    _originals.clear()
+
+
+def as_dicts() -> List[Dict]:
+    return [dict(record) for record in records]
+
+
+def draw_stats() -> Dict[str, Dict[str, float]]:
+    """Mean and worst draw time in milliseconds per panel, over the recent redraws."""
+    return {
+        label: {"mean_ms": sum(samples) / len(samples), "max_ms": max(samples), "samples": len(samples)}
+        for label, samples in draw_samples.items()
+        if samples
+    }
+
+
+class ALIGNMENT_SUITE_OT_export_profile(bpy.types.Operator):
+    bl_idname = "alignment_suite.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Save the recorded operator timings as JSON"
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH", default="alignment_suite_profile.json")
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        return bool(records or draw_samples)
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        try:
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump({"records": as_dicts(), "panel_draw": draw_stats()}, fh, indent=2)
+        except OSError as exc:
+            self.report({"ERROR"}, f"Could not write {path}: {exc}")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Wrote {len(records)} records to {path}")
+        return {"FINISHED"}
+
+
+class ALIGNMENT_SUITE_OT_clear_profile(bpy.types.Operator):
+    bl_idname = "alignment_suite.clear_profile"
+    bl_label = "Clear Profile"
+    bl_description = "Forget the recorded operator timings"
+
+    def execute(self, context):
+        records.clear()
+        draw_samples.clear()
+        return {"FINISHED"}
+
+
+def draw(layout) -> None:
+    """Readout of the recorded operators, newest first."""
+    if not records:
+        layout.label(text="Run an operator to record timings")
+    for record in reversed(records):
+        box = layout.box()
+        row = box.row()
+        row.label(text=record["label"])
+        row.label(text=f"{record['time_ms']:.1f} ms")
+        box.label(
+            text=f"Objects {record['objects']}  Verts {record['verts']}  "
+            f"Bounds {record['bounds']} ({record['cache_hits']} cached)  Updates {record['depsgraph_updates']}"
+        )
+    stats = draw_stats()
+    if stats:
+        box = layout.box()
+        box.label(text="Panel draw (mean / max)")
+        for label, stat in stats.items():
+            row = box.row()
+            row.label(text=label)
+            row.label(text=f"{stat['mean_ms']:.2f} / {stat['max_ms']:.2f} ms")
+    row = layout.row(align=True)
+    row.operator("alignment_suite.export_profile", text="Export JSON", icon="EXPORT")
+    row.operator("alignment_suite.clear_profile", text="Clear", icon="X")
+
+
+classes = (
+    ALIGNMENT_SUITE_OT_export_profile,
+    ALIGNMENT_SUITE_OT_clear_profile,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    uninstrument()
+    records.clear()
+    draw_samples.clear()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,208 @@
+"""Recorded chains of Alignment Suite operators, replayed as one operator.
+
+While recording, every finished run of an undoable ``alignment_suite.*``
+operator is appended to the recipe with its properties. Running a recipe
+calls each step's ``execute`` directly inside a single operator, so the
+whole chain is one undo step and one redo panel instead of a full operator
+round-trip (poll, undo push, redraw) per step. The bounds snapshot cache is
+shared across the steps like across any other operators.
+"""
+
+import json
+from typing import Dict, Optional, Sequence
+
+import bpy
+
+from . import profiling
+from .utils import ExecuteProxy, declared_properties
+
+# Name of the recipe being recorded, or None
+recording: Optional[str] = None
+# Set while a recipe runs so its steps are not recorded again
+_replaying = False
+# bl_idname -> operator class for every operator a recipe may contain
+_operators: Dict[str, type] = {}
+
+
+class ALIGNMENT_SUITE_RecipeStep(bpy.types.PropertyGroup):
+    operator: bpy.props.StringProperty(name="Operator")
+    label: bpy.props.StringProperty(name="Label")
+    # JSON object of property values
+    properties: bpy.props.StringProperty(name="Properties", default="{}")
+
+
+class ALIGNMENT_SUITE_Recipe(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(name="Name", default="Recipe")
+    steps: bpy.props.CollectionProperty(type=ALIGNMENT_SUITE_RecipeStep)
+
+
+def set_operators(classes: Sequence[type]) -> None:
+    """Declare which operator classes recipes may record and run."""
+    _operators.clear()
+    for cls in classes:
+        if "UNDO" in getattr(cls, "bl_options", ()):
+            _operators[cls.bl_idname] = cls
+
+
+def _plain(value):
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return [_plain(v) for v in value]
+
+
+def operator_properties(operator) -> Dict[str, object]:
+    """JSON-friendly values of every property declared on ``operator``'s class."""
+    return {name: _plain(getattr(operator, name)) for name in declared_properties(type(operator))}
+
+
+def _record(operator, context, result) -> None:
+    if recording is None or _replaying or "FINISHED" not in result:
+        return
+    cls = type(operator)
+    if _operators.get(getattr(cls, "bl_idname", None)) is not cls:
+        return
+    # Steps live in scene data, so undo (and the redo panel, which undoes
+    # before running again) drops them together with the operator they record
+    recipes = context.scene.alignment_suite.recipes
+    recipe = recipes.get(recording)
+    if recipe is None:
+        recipe = recipes.add()
+        recipe.name = recording
+    step = recipe.steps.add()
+    step.operator = cls.bl_idname
+    step.label = cls.bl_label
+    step.properties = json.dumps(operator_properties(operator), sort_keys=True)
+
+
+def run_recipe(context: bpy.types.Context, recipe) -> int:
+    """Run every step of ``recipe``; returns how many steps finished.
+
+    Steps whose poll fails in the current context are skipped.
+    """
+    global _replaying
+    finished = 0
+    _replaying = True
+    try:
+        for step in recipe.steps:
+            cls = _operators[step.operator]
+            if hasattr(cls, "poll") and not cls.poll(context):
+                continue
+            result = cls.execute(ExecuteProxy(cls, json.loads(step.properties)), context)
+            finished += "FINISHED" in result
+    finally:
+        _replaying = False
+    return finished
+
+
+class ALIGNMENT_SUITE_OT_recipe_record(bpy.types.Operator):
+    bl_idname = "alignment_suite.recipe_record"
+    bl_label = "Record Recipe"
+    bl_description = "Start recording the Alignment Suite operators you run into a new recipe, or stop recording"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        global recording
+        recipes = context.scene.alignment_suite.recipes
+        if recording is not None:
+            index = recipes.find(recording)
+            if index >= 0 and not len(recipes[index].steps):
+                recipes.remove(index)
+            recording = None
+            return {"FINISHED"}
+        number = len(recipes) + 1
+        while recipes.get(f"Recipe {number}") is not None:
+            number += 1
+        recipe = recipes.add()
+        recipe.name = f"Recipe {number}"
+        recording = recipe.name
+        return {"FINISHED"}
+
+
+class ALIGNMENT_SUITE_OT_recipe_run(bpy.types.Operator):
+    bl_idname = "alignment_suite.recipe_run"
+    bl_label = "Run Recipe"
+    bl_description = "Run every step of the recipe as one operation and one undo step"
+    bl_options = {"REGISTER", "UNDO"}
+
+    recipe: bpy.props.StringProperty(name="Recipe")
+
+    @classmethod
+    def poll(cls, context):
+        return recording is None
+
+    def execute(self, context):
+        recipe = context.scene.alignment_suite.recipes.get(self.recipe)
+        if recipe is None:
+            self.report({"ERROR"}, f"No recipe named {self.recipe!r}")
+            return {"CANCELLED"}
+        missing = sorted({step.operator for step in recipe.steps if step.operator not in _operators})
+        if missing:
+            self.report({"ERROR"}, f"Unknown operators in recipe: {', '.join(missing)}")
+            return {"CANCELLED"}
+        finished = run_recipe(context, recipe)
+        if finished < len(recipe.steps):
+            self.report({"WARNING"}, f"Ran {finished} of {len(recipe.steps)} steps; the others do not apply here")
+        return {"FINISHED"}
+
+
+class ALIGNMENT_SUITE_OT_recipe_remove(bpy.types.Operator):
+    bl_idname = "alignment_suite.recipe_remove"
+    bl_label = "Remove Recipe"
+    bl_options = {"UNDO"}
+
+    recipe: bpy.props.StringProperty(name="Recipe")
+
+    def execute(self, context):
+        recipes = context.scene.alignment_suite.recipes
+        index = recipes.find(self.recipe)
+        if index < 0:
+            return {"CANCELLED"}
+        recipes.remove(index)
+        return {"FINISHED"}
+
+
+def draw(layout, context) -> None:
+    """Recipe list with the record toggle."""
+    recipes = context.scene.alignment_suite.recipes
+    if recording is None:
+        layout.operator("alignment_suite.recipe_record", text="Record", icon="REC")
+    else:
+        layout.operator("alignment_suite.recipe_record", text=f"Stop Recording {recording}", icon="PAUSE", depress=True)
+    for recipe in recipes:
+        box = layout.box()
+        row = box.row(align=True)
+        row.prop(recipe, "name", text="")
+        row.operator("alignment_suite.recipe_run", text="", icon="PLAY").recipe = recipe.name
+        row.operator("alignment_suite.recipe_remove", text="", icon="X").recipe = recipe.name
+        for number, step in enumerate(recipe.steps, 1):
+            box.label(text=f"{number}. {step.label}")
+
+
+property_groups = (
+    ALIGNMENT_SUITE_RecipeStep,
+    ALIGNMENT_SUITE_Recipe,
+)
+
+classes = (
+    ALIGNMENT_SUITE_OT_recipe_record,
+    ALIGNMENT_SUITE_OT_recipe_run,
+    ALIGNMENT_SUITE_OT_recipe_remove,
+)
+
+
+def register():
+    for cls in property_groups + classes:
+        bpy.utils.register_class(cls)
+    profiling.execute_hooks.append(_record)
+
+
+def unregister():
+    global recording
+    recording = None
+    if _record in profiling.execute_hooks:
+        profiling.execute_hooks.remove(_record)
+    _operators.clear()
+    for cls in reversed(property_groups + classes):
+        bpy.utils.unregister_class(cls)
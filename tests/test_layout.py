@@ -0,0 +1,218 @@
+"""Unit tests for the pure layout math; no Blender needed.
+
+Run from the add-on folder with ``python -m pytest tests``.
+"""
+
+import importlib
+import math
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = "alignment_suite"
+
+
+def _load_layout():
+    # A bare package module, so importing layout does not run __init__ (which needs bpy)
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [ROOT]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(PACKAGE_NAME + ".layout")
+
+
+layout = _load_layout()
+
+
+def test_equal_gap_keeps_ends_and_equalizes_gaps():
+    mins = np.array([0.0, 1.0, 7.0, 9.0])
+    maxs = np.array([2.0, 2.0, 8.0, 12.0])
+    deltas = layout.equal_gap(mins, maxs)
+    new_mins, new_maxs = mins + deltas, maxs + deltas
+    assert new_mins[0] == pytest.approx(0.0)
+    assert new_maxs[-1] == pytest.approx(12.0)
+    gaps = new_mins[1:] - new_maxs[:-1]
+    assert gaps == pytest.approx(np.full(3, gaps[0]))
+    assert new_maxs - new_mins == pytest.approx(maxs - mins)
+
+
+def test_equal_gap_needs_two_items():
+    assert layout.equal_gap([1.0], [2.0]) == pytest.approx([0.0])
+
+
+def test_fit_gap_fills_the_range():
+    deltas = layout.fit_gap([5.0, 0.0, 3.0], [6.0, 2.0, 4.0], 0.0, 10.0)
+    assert [5.0, 0.0, 3.0] + deltas == pytest.approx([0.0, 4.0, 9.0])
+
+
+def test_fit_gap_with_too_little_room_packs_without_gaps_and_overflows():
+    mins = np.array([0.0, 10.0, 20.0])
+    maxs = mins + 4.0
+    new_mins = mins + layout.fit_gap(mins, maxs, 0.0, 6.0)
+    assert new_mins == pytest.approx([0.0, 4.0, 8.0])
+    assert (new_mins + 4.0)[-1] > 6.0
+
+
+def test_grid_fills_rows_of_columns_from_the_first_position():
+    positions = np.array([[1.0, 1.0], [5.0, 5.0], [0.0, 0.0], [2.0, 9.0], [3.0, 3.0]])
+    cells = positions + layout.grid(positions, 2, (2.0, 3.0))
+    assert cells == pytest.approx(np.array([[1, 1], [3, 1], [1, 4], [3, 4], [1, 7]], dtype=float))
+
+
+def test_grid_with_explicit_origin():
+    cells = np.array([[4.0, 4.0]]) + layout.grid([[4.0, 4.0]], 3, (1.0, 1.0), origin=(0.0, 0.0))
+    assert cells == pytest.approx(np.zeros((1, 2)))
+
+
+def _overlapping(corners, sizes):
+    lo, hi = corners, corners + sizes
+    count = len(corners)
+    return [
+        (i, j)
+        for i in range(count)
+        for j in range(i + 1, count)
+        if np.all(lo[i] < hi[j] - 1e-9) and np.all(lo[j] < hi[i] - 1e-9)
+    ]
+
+
+def test_shelf_pack_rows_respect_width_and_do_not_overlap():
+    rng = np.random.default_rng(3)
+    sizes = rng.uniform(0.5, 3.0, (40, 2))
+    corners = layout.shelf_pack(sizes, 0.1, width=10.0)
+    assert not _overlapping(corners, sizes)
+    assert np.all(corners >= 0.0)
+    assert np.all(corners[:, 0] + sizes[:, 0] <= 10.0 + 1e-9)
+
+
+def test_shelf_pack_puts_tallest_first_and_keeps_input_order():
+    sizes = np.array([[1.0, 1.0], [1.0, 3.0], [1.0, 2.0]])
+    corners = layout.shelf_pack(sizes, 0.0, width=100.0)
+    assert corners == pytest.approx(np.array([[2.0, 0.0], [0.0, 0.0], [1.0, 0.0]]))
+
+
+def test_shelf_pack_widens_to_the_widest_item():
+    corners = layout.shelf_pack([[5.0, 1.0], [1.0, 1.0]], 0.0, width=2.0)
+    assert corners == pytest.approx(np.array([[0.0, 0.0], [0.0, 1.0]]))
+
+
+def test_circle_angles_full_turn_does_not_stack_ends():
+    angles = layout.circle_angles(4, 0.0, 2.0 * math.pi)
+    assert angles == pytest.approx([0.0, math.pi / 2.0, math.pi, 1.5 * math.pi])
+
+
+def test_circle_angles_arc_includes_both_ends():
+    assert layout.circle_angles(3, 0.0, math.pi) == pytest.approx([0.0, math.pi / 2.0, math.pi])
+
+
+def _l_path():
+    points = np.array([[0.0, 0.0, 0.0], [4.0, 0.0, 0.0], [4.0, 3.0, 0.0]])
+    return points, layout.arc_length_table(points)
+
+
+def test_point_on_path_interpolates_and_clamps():
+    points, table = _l_path()
+    assert table == pytest.approx([0.0, 4.0, 7.0])
+    positions, tangents = layout.point_on_path(points, table, [-1.0, 2.0, 5.5, 20.0])
+    assert positions == pytest.approx(np.array([[0, 0, 0], [2, 0, 0], [4, 1.5, 0], [4, 3, 0]], dtype=float))
+    assert tangents[1] == pytest.approx([1.0, 0.0, 0.0])
+    assert tangents[2] == pytest.approx([0.0, 1.0, 0.0])
+
+
+def test_project_onto_path_round_trips_point_on_path():
+    points, table = _l_path()
+    distances = np.array([0.5, 3.9, 4.2, 6.0])
+    positions, _tangents = layout.point_on_path(points, table, distances)
+    nearest = np.argmin(np.linalg.norm(positions[:, None] - points[None], axis=2), axis=1)
+    assert layout.project_onto_path(points, table, positions, nearest) == pytest.approx(distances)
+
+
+def test_project_onto_path_off_the_path():
+    points, table = _l_path()
+    # One unit off the first segment, and beyond the corner of the second
+    result = layout.project_onto_path(points, table, [[1.0, -1.0, 0.0], [5.0, 2.0, 0.0]], [0, 2])
+    assert result == pytest.approx([1.0, 6.0])
+
+
+def _boxes_overlap(mins, maxs):
+    return [
+        (i, j)
+        for i in range(len(mins))
+        for j in range(i + 1, len(mins))
+        if np.all(mins[i] < maxs[j] - 1e-9) and np.all(mins[j] < maxs[i] - 1e-9)
+    ]
+
+
+def test_resolve_overlaps_separates_boxes_by_gap():
+    rng = np.random.default_rng(7)
+    mins = rng.uniform(0.0, 10.0, (60, 3))
+    maxs = mins + rng.uniform(0.5, 2.0, (60, 3))
+    deltas = layout.resolve_overlaps(mins, maxs, 0, gap=0.25)
+    assert np.all(deltas >= 0.0)
+    moved_mins, moved_maxs = mins.copy(), maxs.copy()
+    moved_mins[:, 0] += deltas
+    moved_maxs[:, 0] += deltas
+    # Growing every box by the gap along the axis still leaves no overlaps
+    assert not _boxes_overlap(moved_mins, moved_maxs + [0.25 - 1e-6, 0.0, 0.0])
+
+
+def test_resolve_overlaps_leaves_separate_boxes_alone():
+    mins = np.array([[0.0, 0.0, 0.0], [0.5, 5.0, 0.0], [3.0, 0.0, 0.0]])
+    maxs = mins + 1.0
+    assert layout.resolve_overlaps(mins, maxs, 0) == pytest.approx([0.0, 0.0, 0.0])
+
+
+def test_resolve_overlaps_pushes_chain_in_order():
+    mins = np.array([[0.0, 0, 0], [0.5, 0, 0], [1.0, 0, 0]])
+    maxs = mins + [2.0, 1.0, 1.0]
+    assert layout.resolve_overlaps(mins, maxs, 0, gap=0.5) == pytest.approx([0.0, 2.0, 4.0])
+
+
+def test_resolve_overlaps_long_box_in_another_lane():
+    # A long box that overlaps no other box must not change their result
+    count = 50
+    mins = np.zeros((count, 3))
+    mins[:, 0] = np.arange(count) * 2.0
+    maxs = mins + 1.0
+    mins[0, 1], maxs[0] = 10.0, [1000.0, 11.0, 1.0]
+    assert layout.resolve_overlaps(mins, maxs, 0) == pytest.approx(np.zeros(count))
+
+
+def test_nearest_face_snap_needs_overlap_across():
+    # Both faces are at 5 and 8; only the second box overlaps the mover on the other axes
+    deltas = layout.nearest_face_snap(
+        [4.0], [5.0, 8.0], [[0.0, 0.0]], [[1.0, 1.0]], [[10.0, 10.0], [0.5, -1.0]], [[11.0, 11.0], [2.0, 0.5]]
+    )
+    assert deltas == pytest.approx([4.0])
+
+
+def test_nearest_face_snap_without_a_face_across_stays_put():
+    deltas = layout.nearest_face_snap([1.0, 2.0], [3.0], [[0.0], [5.0]], [[1.0], [6.0]], [[2.0]], [[4.0]])
+    assert deltas == pytest.approx([0.0, 0.0])
+
+
+def test_nearest_face_snap_matches_brute_force():
+    rng = np.random.default_rng(11)
+    values = rng.uniform(0.0, 100.0, 200)
+    faces = rng.uniform(0.0, 100.0, 300)
+    mins, face_mins = rng.uniform(0.0, 20.0, (200, 2)), rng.uniform(0.0, 20.0, (300, 2))
+    maxs, face_maxs = mins + rng.uniform(0.1, 2.0, (200, 2)), face_mins + rng.uniform(0.1, 2.0, (300, 2))
+    deltas = layout.nearest_face_snap(values, faces, mins, maxs, face_mins, face_maxs)
+    across = np.all((face_mins[None] < maxs[:, None]) & (face_maxs[None] > mins[:, None]), axis=2)
+    dist = np.where(across, np.abs(faces[None] - values[:, None]), np.inf)
+    nearest = np.argmin(dist, axis=1)
+    expected = np.where(across.any(axis=1), faces[nearest] - values, 0.0)
+    assert np.abs(deltas) == pytest.approx(np.abs(expected))
+    assert not np.all(across)
+
+
+def test_increment_snap_rounds_to_multiples():
+    values = np.array([0.24, 0.26, -0.74, 1.0])
+    assert values + layout.increment_snap(values, 0.5) == pytest.approx([0.0, 0.5, -0.5, 1.0])
+
+
+def test_increment_snap_zero_increment_is_a_no_op():
+    assert layout.increment_snap([0.3, 1.7], 0.0) == pytest.approx([0.0, 0.0])
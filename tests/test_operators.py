@@ -0,0 +1,61 @@
+"""Operator class checks against the stand-in ``bpy`` from ``benchmarks/standin.py``."""
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = "alignment_suite"
+
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+import standin  # noqa: E402
+
+standin.install()
+
+
+def _load(name):
+    # A bare package module, so importing the operators does not register the add-on
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [ROOT]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module(PACKAGE_NAME + "." + name)
+
+
+utils = _load("utils")
+ui = _load("ui")
+OPERATOR_MODULES = [_load(name) for name in ("ops_align", "ops_cursor", "ops_distribute", "ops_mirror", "ops_orient", "ops_snap", "ops_spacing")]
+SCENE_OPERATORS = [
+    cls for module in OPERATOR_MODULES for cls in module.classes if issubclass(cls, utils.SceneSettingsMixin)
+]
+
+
+@pytest.mark.parametrize("cls", SCENE_OPERATORS, ids=lambda cls: cls.bl_idname)
+def test_scene_settings_resolve_to_declared_properties(cls):
+    mapping = cls.scene_settings
+    assert mapping, "scene_settings resolves to the empty SceneSettingsMixin default"
+    assert set(mapping) <= set(utils.declared_properties(cls))
+    assert set(mapping.values()) <= set(utils.declared_properties(ui.ALIGNMENT_SUITE_Settings))
+
+
+def test_align_and_distance_operators_use_their_property_mixins():
+    align = _load("ops_align")
+    distribute = _load("ops_distribute")
+    for cls in (align.ALIGNMENT_SUITE_OT_align_objects, align.ALIGNMENT_SUITE_OT_align_objects_modal):
+        assert cls.scene_settings is align._AlignObjectsProperties.scene_settings
+    for cls in (
+        distribute.ALIGNMENT_SUITE_OT_distribute_by_distance,
+        distribute.ALIGNMENT_SUITE_OT_distribute_by_distance_modal,
+    ):
+        assert cls.scene_settings is distribute._DistributeByDistanceProperties.scene_settings
+
+
+@pytest.mark.parametrize("cls", SCENE_OPERATORS, ids=lambda cls: cls.bl_idname)
+def test_scene_backed_properties_skip_save(cls):
+    # Remembered last-used values would count as set and hide the panel settings
+    props = utils.declared_properties(cls)
+    for name in cls.scene_settings:
+        assert "SKIP_SAVE" in props[name].keywords.get("options", set()), name
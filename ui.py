@@ -1,181 +1,248 @@
 import bpy
 
+from . import profiling, recipes
 
-class ALIGNMENT_SUITE_PT_panel(bpy.types.Panel):
+
+class _AlignSuitePanel:
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = 'Align Suite'
+
+
+class _AlignSuiteSubPanel(_AlignSuitePanel):
+    bl_parent_id = 'ALIGNMENT_SUITE_PT_panel'
+    bl_options = {'DEFAULT_CLOSED'}
+
+
+# Buttons only carry what differs between them (mostly the axis); the
+# operators read everything else from the scene settings when invoked.
+
+class ALIGNMENT_SUITE_PT_panel(_AlignSuitePanel, bpy.types.Panel):
     bl_label = 'Alignment Suite'
 
     def draw(self, context):
-        layout = self.layout
-
-        col = layout.column(align=True)
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
         col.label(text="Align Objects")
         row = col.row(align=True)
         for axis in ('X', 'Y', 'Z'):
-            op = row.operator('alignment_suite.align_objects', text=f'Align {axis}')
-            op.axis = axis
-            op.mode = context.scene.alignment_suite_align_mode
-            op.use_bounds = context.scene.alignment_suite_use_bounds
-            op.which_bound = context.scene.alignment_suite_which_bound
-            op.offset = context.scene.alignment_suite_align_offset
+            row.operator('alignment_suite.align_objects', text=f'Align {axis}').axis = axis
+        row = col.row(align=True)
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.align_objects_modal', text=f'Drag {axis}', icon='MOUSE_MOVE').axis = axis
+        row = col.row(align=True)
+        row.prop(settings, 'align_axes', text='', toggle=True)
+        row.operator('alignment_suite.align_objects', text='Align Axes').axes = settings.align_axes
 
         col.separator()
-        col.prop(context.scene, 'alignment_suite_align_mode', text='Target')
-        col.prop(context.scene, 'alignment_suite_use_bounds', text='Use Bounds')
-        if context.scene.alignment_suite_use_bounds:
-            col.prop(context.scene, 'alignment_suite_which_bound', text='Bound')
+        col.prop(settings, 'align_mode', text='Target')
+        col.prop(settings, 'use_bounds', text='Use Bounds')
+        if settings.use_bounds:
+            col.prop(settings, 'which_bound', text='Bound')
+        col.prop(settings, 'exact_bounds', text='Exact Bounds')
+        row = col.row(align=True)
+        row.prop(settings, 'chunk_threshold', text='Chunk Above')
+        row.prop(settings, 'chunk_budget', text='Slice ms')
 
-        # Distribute
-        col.separator()
+
+class ALIGNMENT_SUITE_PT_distribute(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Distribute'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
         col.label(text="Distribute Objects")
         row = col.row(align=True)
-        op = row.operator('alignment_suite.distribute_objects', text='Distribute X')
-        op.axis = 'X'
-        op.spacing_mode = context.scene.alignment_suite_spacing_mode
-        op = row.operator('alignment_suite.distribute_objects', text='Distribute Y')
-        op.axis = 'Y'
-        op.spacing_mode = context.scene.alignment_suite_spacing_mode
-        op = row.operator('alignment_suite.distribute_objects', text='Distribute Z')
-        op.axis = 'Z'
-        op.spacing_mode = context.scene.alignment_suite_spacing_mode
-        col.prop(context.scene, 'alignment_suite_spacing_mode', text='Spacing')
-
-        # Distribute by distance
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.distribute_objects', text=f'Distribute {axis}').axis = axis
+        col.prop(settings, 'spacing_mode', text='Spacing')
+
         col.separator()
         col.label(text="Distribute By Distance")
         row = col.row(align=True)
         for axis in ('X', 'Y', 'Z'):
-            op = row.operator('alignment_suite.distribute_by_distance', text=f'{axis}')
-            op.axis = axis
-            op.distance_mode = context.scene.alignment_suite_distance_mode
-            op.distance = context.scene.alignment_suite_distance_value
+            row.operator('alignment_suite.distribute_by_distance', text=f'{axis}').axis = axis
         row = col.row(align=True)
-        col.prop(context.scene, 'alignment_suite_distance_mode', text='Mode')
-        col.prop(context.scene, 'alignment_suite_distance_value', text='Distance')
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.distribute_by_distance_modal', text=f'Drag {axis}', icon='MOUSE_MOVE').axis = axis
+        col.prop(settings, 'distance_mode', text='Mode')
+        col.prop(settings, 'distance_value', text='Distance')
 
-        # Grid
         col.separator()
-        col.label(text="Grid Arrange")
-        row = col.row(align=True)
-        op = row.operator('alignment_suite.distribute_grid', text='Arrange Grid')
-        op.primary_axis = context.scene.alignment_suite_grid_primary
-        op.secondary_axis = context.scene.alignment_suite_grid_secondary
-        op.columns = context.scene.alignment_suite_grid_columns
-        op.spacing_primary = context.scene.alignment_suite_grid_spacing_primary
-        op.spacing_secondary = context.scene.alignment_suite_grid_spacing_secondary
-        op.order_by_axis = context.scene.alignment_suite_grid_sort
-        grid = col.box()
-        grid.prop(context.scene, 'alignment_suite_grid_primary', text='Primary')
-        grid.prop(context.scene, 'alignment_suite_grid_secondary', text='Secondary')
-        grid.prop(context.scene, 'alignment_suite_grid_columns', text='Columns')
-        grid.prop(context.scene, 'alignment_suite_grid_spacing_primary', text='Primary Spacing')
-        grid.prop(context.scene, 'alignment_suite_grid_spacing_secondary', text='Secondary Spacing')
-        grid.prop(context.scene, 'alignment_suite_grid_sort', text='Sort By')
-
-        # Mirror
-        col.separator()
-        col.label(text="Mirror Objects")
+        col.label(text="Resolve Overlaps")
         row = col.row(align=True)
         for axis in ('X', 'Y', 'Z'):
-            op = row.operator('alignment_suite.mirror_objects', text=f'Mirror {axis}')
-            op.axis = axis
-            op.plane_origin_mode = context.scene.alignment_suite_plane_origin
-            op.duplicate = context.scene.alignment_suite_duplicate_on_mirror
+            row.operator('alignment_suite.resolve_overlaps', text=f'{axis}').axis = axis
+        col.prop(settings, 'overlap_gap', text='Gap')
 
-        col.prop(context.scene, 'alignment_suite_plane_origin', text='Plane Origin')
-        col.prop(context.scene, 'alignment_suite_duplicate_on_mirror', text='Duplicate')
+        col.separator()
+        col.label(text="Along Active Curve")
+        col.operator('alignment_suite.distribute_along_path', text='Distribute Along Path', icon='CURVE_DATA')
+        col.prop(settings, 'path_spacing', text='Spacing')
+        col.prop(settings, 'path_align', text='Align to Tangent')
+        if settings.path_align or settings.path_spacing == 'GAP':
+            row = col.row(align=True)
+            row.prop(settings, 'path_track', text='Track')
+            row.prop(settings, 'path_up', text='Up')
 
-        # Cursor/Origin
         col.separator()
-        col.label(text="Cursor / Origin")
+        col.label(text="Circle")
+        col.operator('alignment_suite.distribute_circle', text='Distribute Circle', icon='MESH_CIRCLE')
+        box = col.box()
+        box.prop(settings, 'circle_center', text='Center')
+        box.prop(settings, 'circle_normal', text='Normal')
+        box.prop(settings, 'circle_radius', text='Radius')
+        row = box.row(align=True)
+        row.prop(settings, 'circle_start', text='Start')
+        row.prop(settings, 'circle_end', text='End')
+        row = box.row(align=True)
+        row.prop(settings, 'circle_face', text='Face Center')
+        if settings.circle_face:
+            row.prop(settings, 'circle_track', text='Track')
+
+
+class ALIGNMENT_SUITE_PT_grid(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Grid Arrange'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
+        col.operator('alignment_suite.distribute_grid', text='Arrange Grid')
+        grid = col.box()
+        grid.prop(settings, 'grid_mode', text='Mode')
+        grid.prop(settings, 'grid_primary', text='Primary')
+        grid.prop(settings, 'grid_secondary', text='Secondary')
+        if settings.grid_mode == 'SHELF':
+            grid.prop(settings, 'grid_gap', text='Gap')
+            grid.prop(settings, 'grid_width', text='Target Width')
+        else:
+            grid.prop(settings, 'grid_columns', text='Columns')
+            grid.prop(settings, 'grid_spacing_primary', text='Primary Spacing')
+            grid.prop(settings, 'grid_spacing_secondary', text='Secondary Spacing')
+            grid.prop(settings, 'grid_sort', text='Sort By')
+
+
+class ALIGNMENT_SUITE_PT_mirror(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Mirror'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
         row = col.row(align=True)
-        op = row.operator('alignment_suite.set_cursor', text='Cursor X')
-        op.axis = 'X'
-        op.mode = context.scene.alignment_suite_cursor_mode
-        op = row.operator('alignment_suite.set_cursor', text='Cursor Y')
-        op.axis = 'Y'
-        op.mode = context.scene.alignment_suite_cursor_mode
-        op = row.operator('alignment_suite.set_cursor', text='Cursor Z')
-        op.axis = 'Z'
-        op.mode = context.scene.alignment_suite_cursor_mode
-        col.prop(context.scene, 'alignment_suite_cursor_mode', text='Cursor Mode')
-
-        # Mesh tools (visible in Edit mode too via separate panel)
-
-        # Orientation and Size
-        col.separator()
-        col.label(text="Orient / Size")
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.mirror_objects', text=f'Mirror {axis}').axis = axis
+
+        col.prop(settings, 'plane_origin', text='Plane Origin')
+        col.prop(settings, 'duplicate_on_mirror', text='Duplicate')
+        if settings.duplicate_on_mirror:
+            col.prop(settings, 'duplicate_data', text='Data')
+
+
+class ALIGNMENT_SUITE_PT_cursor(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Cursor / Origin'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
         row = col.row(align=True)
-        op = row.operator('alignment_suite.orient_to_point', text='Aim At Target')
-        op.local_axis = context.scene.alignment_suite_orient_local
-        op.up_axis = context.scene.alignment_suite_orient_up
-        op.target_mode = context.scene.alignment_suite_orient_target
-        op.invert = context.scene.alignment_suite_orient_invert
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.set_cursor', text=f'Cursor {axis}').axis = axis
+        col.operator('alignment_suite.set_cursor', text='Cursor XYZ').axes = (True, True, True)
+        col.prop(settings, 'cursor_mode', text='Cursor Mode')
+
+
+class ALIGNMENT_SUITE_PT_orient(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Orient / Size'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
+        col.operator('alignment_suite.orient_to_point', text='Aim At Target')
 
         row = col.row(align=True)
-        for axis in ('X','Y','Z'):
-            op = row.operator('alignment_suite.match_size_axis', text=f'Match {axis}')
-            op.axis = axis
-            op.size = context.scene.alignment_suite_match_size
-            op.uniform = context.scene.alignment_suite_match_uniform
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.match_size_axis', text=f'Match {axis}').axis = axis
 
         box = col.box()
-        box.prop(context.scene, 'alignment_suite_orient_local', text='Local Axis')
-        box.prop(context.scene, 'alignment_suite_orient_up', text='Up')
-        box.prop(context.scene, 'alignment_suite_orient_target', text='Target')
-        box.prop(context.scene, 'alignment_suite_orient_invert', text='Invert')
-        box.prop(context.scene, 'alignment_suite_match_size', text='Size')
-        box.prop(context.scene, 'alignment_suite_match_uniform', text='Uniform')
-
-        # Snapping & Spacing
-        col.separator()
-        col.label(text="Snap / Space")
+        box.prop(settings, 'orient_local', text='Local Axis')
+        box.prop(settings, 'orient_up', text='Up')
+        box.prop(settings, 'orient_target', text='Target')
+        box.prop(settings, 'orient_invert', text='Invert')
+        box.prop(settings, 'match_size', text='Size')
+        box.prop(settings, 'match_uniform', text='Uniform')
+
+
+class ALIGNMENT_SUITE_PT_snap(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Snap / Space'
+
+    def draw(self, context):
+        settings = context.scene.alignment_suite
+        col = self.layout.column(align=True)
         row = col.row(align=True)
-        for axis in ('X','Y','Z'):
-            op = row.operator('alignment_suite.snap_minmax_to_minmax', text=f'Snap {axis}')
-            op.axis = axis
-            op.source_side = context.scene.alignment_suite_snap_source
-            op.target_side = context.scene.alignment_suite_snap_target_side
-            op.target = context.scene.alignment_suite_snap_target
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.snap_minmax_to_minmax', text=f'Snap {axis}').axis = axis
         grid = col.box()
-        grid.prop(context.scene, 'alignment_suite_snap_source', text='Source Side')
-        grid.prop(context.scene, 'alignment_suite_snap_target_side', text='Target Side')
-        grid.prop(context.scene, 'alignment_suite_snap_target', text='Target')
+        grid.prop(settings, 'snap_source', text='Source Side')
+        grid.prop(settings, 'snap_target', text='Target')
+        if settings.snap_target != 'NEIGHBOR':
+            grid.prop(settings, 'snap_target_side', text='Target Side')
 
         row = col.row(align=True)
-        for axis in ('X','Y','Z'):
-            op = row.operator('alignment_suite.snap_to_increment', text=f'Round {axis}')
-            op.axis = axis
-            op.increment = context.scene.alignment_suite_snap_increment
-        col.prop(context.scene, 'alignment_suite_snap_increment', text='Increment')
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.snap_to_increment', text=f'Round {axis}').axis = axis
+        col.prop(settings, 'snap_increment', text='Increment')
 
         col.separator()
         col.label(text='Space Inside Range')
         row = col.row(align=True)
-        for axis in ('X','Y','Z'):
-            op = row.operator('alignment_suite.space_inside', text=f'{axis}')
-            op.axis = axis
-            op.range_min = context.scene.alignment_suite_space_min
-            op.range_max = context.scene.alignment_suite_space_max
-            op.mode = context.scene.alignment_suite_space_mode
-        box2 = col.box()
-        box2.prop(context.scene, 'alignment_suite_space_min', text='Min')
-        box2.prop(context.scene, 'alignment_suite_space_max', text='Max')
-        box2.prop(context.scene, 'alignment_suite_space_mode', text='Mode')
+        for axis in ('X', 'Y', 'Z'):
+            row.operator('alignment_suite.space_inside', text=f'{axis}').axis = axis
+        box = col.box()
+        box.prop(settings, 'space_min', text='Min')
+        box.prop(settings, 'space_max', text='Max')
+        box.prop(settings, 'space_mode', text='Mode')
+
+
+class ALIGNMENT_SUITE_PT_recipes(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Recipes'
+
+    def draw(self, context):
+        recipes.draw(self.layout.column(), context)
+
+
+class ALIGNMENT_SUITE_PT_profiling(_AlignSuiteSubPanel, bpy.types.Panel):
+    bl_label = 'Profiling'
+
+    @classmethod
+    def poll(cls, context):
+        return profiling.enabled
+
+    def draw(self, context):
+        profiling.draw(self.layout)
+
+
+panels = (
+    ALIGNMENT_SUITE_PT_panel,
+    ALIGNMENT_SUITE_PT_distribute,
+    ALIGNMENT_SUITE_PT_grid,
+    ALIGNMENT_SUITE_PT_mirror,
+    ALIGNMENT_SUITE_PT_cursor,
+    ALIGNMENT_SUITE_PT_orient,
+    ALIGNMENT_SUITE_PT_snap,
+    ALIGNMENT_SUITE_PT_recipes,
+    ALIGNMENT_SUITE_PT_profiling,
+)
 
 
 def _update_align_operator_props(self, context):
-    # No op: props are read when button pressed; keep for future live UI updates
+    # No op: props are read when the operator is invoked; keep for future live UI updates
     pass
 
 
-def register():
-    bpy.utils.register_class(ALIGNMENT_SUITE_PT_panel)
+class ALIGNMENT_SUITE_Settings(bpy.types.PropertyGroup):
+    """Panel state, stored once per scene as ``Scene.alignment_suite``."""
 
-    # Scene props for UI state
-    bpy.types.Scene.alignment_suite_align_mode = bpy.props.EnumProperty(
+    align_mode: bpy.props.EnumProperty(
         items=[
             ("WORLD", "World 0", "World origin"),
             ("MIN", "Min", "Selection minimum"),
@@ -188,74 +255,82 @@ def register():
         default="CENTER",
         update=_update_align_operator_props,
     )
-    bpy.types.Scene.alignment_suite_use_bounds = bpy.props.BoolProperty(name="Use Bounds", default=False, update=_update_align_operator_props)
-    bpy.types.Scene.alignment_suite_which_bound = bpy.props.EnumProperty(items=[("MIN", "Min", ""), ("CENTER", "Center", ""), ("MAX", "Max", "")], default="CENTER")
-    bpy.types.Scene.alignment_suite_align_offset = bpy.props.FloatProperty(name="Offset", default=0.0)
-    bpy.types.Scene.alignment_suite_spacing_mode = bpy.props.EnumProperty(items=[("GAP", "Equal Gap", ""), ("CENTER", "Equal Center", "")], default="GAP")
-    bpy.types.Scene.alignment_suite_distance_mode = bpy.props.EnumProperty(items=[("CENTER", "Center Distance", ""), ("GAP", "Gap Distance", "")], default="CENTER")
-    bpy.types.Scene.alignment_suite_distance_value = bpy.props.FloatProperty(name="Distance", default=1.0, min=0.0)
-    bpy.types.Scene.alignment_suite_plane_origin = bpy.props.EnumProperty(items=[("WORLD", "World", ""), ("CURSOR", "Cursor", ""), ("ACTIVE", "Active", ""), ("SELECTION", "Selection", "")], default="WORLD")
-    bpy.types.Scene.alignment_suite_duplicate_on_mirror = bpy.props.BoolProperty(name="Duplicate on Mirror", default=True)
-    bpy.types.Scene.alignment_suite_cursor_mode = bpy.props.EnumProperty(items=[("WORLD", "World 0", ""), ("MIN", "Min", ""), ("CENTER", "Center", ""), ("MAX", "Max", ""), ("ACTIVE", "Active", "")], default="CENTER")
+    use_bounds: bpy.props.BoolProperty(name="Use Bounds", default=False, update=_update_align_operator_props)
+    align_axes: bpy.props.BoolVectorProperty(name="Axes", size=3, subtype='XYZ', default=(True, True, False))
+    which_bound: bpy.props.EnumProperty(items=[("MIN", "Min", ""), ("CENTER", "Center", ""), ("MAX", "Max", "")], default="CENTER")
+    align_offset: bpy.props.FloatProperty(name="Offset", default=0.0)
+    exact_bounds: bpy.props.BoolProperty(
+        name="Exact Bounds",
+        description="Measure evaluated geometry instead of transformed bounding boxes",
+        default=False,
+    )
+    spacing_mode: bpy.props.EnumProperty(items=[("GAP", "Equal Gap", ""), ("CENTER", "Equal Center", "")], default="GAP")
+    distance_mode: bpy.props.EnumProperty(items=[("CENTER", "Center Distance", ""), ("GAP", "Gap Distance", "")], default="CENTER")
+    distance_value: bpy.props.FloatProperty(name="Distance", default=1.0, min=0.0)
+    overlap_gap: bpy.props.FloatProperty(name="Overlap Gap", default=0.0, min=0.0)
+    chunk_threshold: bpy.props.IntProperty(
+        name="Chunk Above",
+        description="Distribute and Mirror apply selections of this many objects or more in time slices, with progress and Esc to cancel (0: never)",
+        default=20000,
+        min=0,
+    )
+    chunk_budget: bpy.props.FloatProperty(name="Time Slice", description="Milliseconds of work per slice", default=30.0, min=1.0, max=1000.0)
+    path_spacing: bpy.props.EnumProperty(items=[('GAP','Equal Gap',''),('CENTER','Equal Center','')], default='CENTER')
+    path_align: bpy.props.BoolProperty(name="Align to Tangent", default=False)
+    path_track: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
+    path_up: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Z')
+    circle_center: bpy.props.EnumProperty(items=[('WORLD','World',''),('CURSOR','Cursor',''),('ACTIVE','Active',''),('SELECTION','Selection','')], default='SELECTION')
+    circle_normal: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Z')
+    circle_radius: bpy.props.FloatProperty(name="Radius", default=5.0, min=0.0)
+    circle_start: bpy.props.FloatProperty(name="Start Angle", default=0.0)
+    circle_end: bpy.props.FloatProperty(name="End Angle", default=360.0)
+    circle_face: bpy.props.BoolProperty(name="Face Center", default=False)
+    circle_track: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
+    plane_origin: bpy.props.EnumProperty(items=[("WORLD", "World", ""), ("CURSOR", "Cursor", ""), ("ACTIVE", "Active", ""), ("SELECTION", "Selection", "")], default="WORLD")
+    duplicate_on_mirror: bpy.props.BoolProperty(name="Duplicate on Mirror", default=True)
+    duplicate_data: bpy.props.EnumProperty(items=[("UNIQUE", "Copy Once", ""), ("LINKED", "Linked", ""), ("FULL", "Copy Each", "")], default="UNIQUE")
+    cursor_mode: bpy.props.EnumProperty(items=[("WORLD", "World 0", ""), ("MIN", "Min", ""), ("CENTER", "Center", ""), ("MAX", "Max", ""), ("ACTIVE", "Active", "")], default="CENTER")
 
     # Grid props
-    bpy.types.Scene.alignment_suite_grid_primary = bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='X')
-    bpy.types.Scene.alignment_suite_grid_secondary = bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
-    bpy.types.Scene.alignment_suite_grid_columns = bpy.props.IntProperty(name="Columns", default=3, min=1)
-    bpy.types.Scene.alignment_suite_grid_spacing_primary = bpy.props.FloatProperty(name="Primary Spacing", default=1.0, min=0.0)
-    bpy.types.Scene.alignment_suite_grid_spacing_secondary = bpy.props.FloatProperty(name="Secondary Spacing", default=1.0, min=0.0)
-    bpy.types.Scene.alignment_suite_grid_sort = bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='X')
+    grid_primary: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='X')
+    grid_secondary: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
+    grid_columns: bpy.props.IntProperty(name="Columns", default=3, min=1)
+    grid_spacing_primary: bpy.props.FloatProperty(name="Primary Spacing", default=1.0, min=0.0)
+    grid_spacing_secondary: bpy.props.FloatProperty(name="Secondary Spacing", default=1.0, min=0.0)
+    grid_sort: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='X')
+    grid_mode: bpy.props.EnumProperty(items=[('PITCH','Fixed Pitch',''),('SHELF','Shelf Pack','')], default='PITCH')
+    grid_gap: bpy.props.FloatProperty(name="Gap", default=0.1, min=0.0)
+    grid_width: bpy.props.FloatProperty(name="Target Width", default=0.0, min=0.0)
 
     # Orient/Size props
-    bpy.types.Scene.alignment_suite_orient_local = bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
-    bpy.types.Scene.alignment_suite_orient_up = bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Z')
-    bpy.types.Scene.alignment_suite_orient_target = bpy.props.EnumProperty(items=[('WORLD','World',''),('CURSOR','Cursor',''),('ACTIVE','Active',''),('SELECTION','Selection','')], default='SELECTION')
-    bpy.types.Scene.alignment_suite_orient_invert = bpy.props.BoolProperty(name='Invert Aim', default=False)
-    bpy.types.Scene.alignment_suite_match_size = bpy.props.FloatProperty(name='Match Size', default=1.0, min=0.0)
-    bpy.types.Scene.alignment_suite_match_uniform = bpy.props.BoolProperty(name='Uniform', default=False)
+    orient_local: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Y')
+    orient_up: bpy.props.EnumProperty(items=[('X','X',''),('Y','Y',''),('Z','Z','')], default='Z')
+    orient_target: bpy.props.EnumProperty(items=[('WORLD','World',''),('CURSOR','Cursor',''),('ACTIVE','Active',''),('SELECTION','Selection','')], default='SELECTION')
+    orient_invert: bpy.props.BoolProperty(name='Invert Aim', default=False)
+    match_size: bpy.props.FloatProperty(name='Match Size', default=1.0, min=0.0)
+    match_uniform: bpy.props.BoolProperty(name='Uniform', default=False)
 
     # Snap/Space props
-    bpy.types.Scene.alignment_suite_snap_source = bpy.props.EnumProperty(items=[('MIN','Min',''),('MAX','Max','')], default='MIN')
-    bpy.types.Scene.alignment_suite_snap_target_side = bpy.props.EnumProperty(items=[('MIN','Min',''),('MAX','Max','')], default='MIN')
-    bpy.types.Scene.alignment_suite_snap_target = bpy.props.EnumProperty(items=[('ACTIVE','Active',''),('CURSOR','Cursor',''),('WORLD','World 0','')], default='ACTIVE')
-    bpy.types.Scene.alignment_suite_snap_increment = bpy.props.FloatProperty(name='Increment', default=0.1, min=0.0)
-    bpy.types.Scene.alignment_suite_space_min = bpy.props.FloatProperty(name='Range Min', default=0.0)
-    bpy.types.Scene.alignment_suite_space_max = bpy.props.FloatProperty(name='Range Max', default=10.0)
-    bpy.types.Scene.alignment_suite_space_mode = bpy.props.EnumProperty(items=[('CENTER','Center',''),('GAP','Gap','')], default='CENTER')
+    snap_source: bpy.props.EnumProperty(items=[('MIN','Min',''),('MAX','Max','')], default='MIN')
+    snap_target_side: bpy.props.EnumProperty(items=[('MIN','Min',''),('MAX','Max','')], default='MIN')
+    snap_target: bpy.props.EnumProperty(items=[('ACTIVE','Active',''),('CURSOR','Cursor',''),('WORLD','World 0',''),('NEIGHBOR','Nearest Face','')], default='ACTIVE')
+    snap_increment: bpy.props.FloatProperty(name='Increment', default=0.1, min=0.0)
+    space_min: bpy.props.FloatProperty(name='Range Min', default=0.0)
+    space_max: bpy.props.FloatProperty(name='Range Max', default=10.0)
+    space_mode: bpy.props.EnumProperty(items=[('CENTER','Center',''),('GAP','Gap','')], default='CENTER')
 
+    recipes: bpy.props.CollectionProperty(type=recipes.ALIGNMENT_SUITE_Recipe)
 
-def unregister():
-    del bpy.types.Scene.alignment_suite_align_mode
-    del bpy.types.Scene.alignment_suite_use_bounds
-    del bpy.types.Scene.alignment_suite_which_bound
-    del bpy.types.Scene.alignment_suite_align_offset
-    del bpy.types.Scene.alignment_suite_spacing_mode
-    del bpy.types.Scene.alignment_suite_distance_mode
-    del bpy.types.Scene.alignment_suite_distance_value
-    del bpy.types.Scene.alignment_suite_plane_origin
-    del bpy.types.Scene.alignment_suite_duplicate_on_mirror
-    del bpy.types.Scene.alignment_suite_cursor_mode
-    del bpy.types.Scene.alignment_suite_grid_primary
-    del bpy.types.Scene.alignment_suite_grid_secondary
-    del bpy.types.Scene.alignment_suite_grid_columns
-    del bpy.types.Scene.alignment_suite_grid_spacing_primary
-    del bpy.types.Scene.alignment_suite_grid_spacing_secondary
-    del bpy.types.Scene.alignment_suite_grid_sort
-
-    del bpy.types.Scene.alignment_suite_orient_local
-    del bpy.types.Scene.alignment_suite_orient_up
-    del bpy.types.Scene.alignment_suite_orient_target
-    del bpy.types.Scene.alignment_suite_orient_invert
-    del bpy.types.Scene.alignment_suite_match_size
-    del bpy.types.Scene.alignment_suite_match_uniform
-
-    del bpy.types.Scene.alignment_suite_snap_source
-    del bpy.types.Scene.alignment_suite_snap_target_side
-    del bpy.types.Scene.alignment_suite_snap_target
-    del bpy.types.Scene.alignment_suite_snap_increment
-    del bpy.types.Scene.alignment_suite_space_min
-    del bpy.types.Scene.alignment_suite_space_max
-    del bpy.types.Scene.alignment_suite_space_mode
-    bpy.utils.unregister_class(ALIGNMENT_SUITE_PT_panel)
+
+def register():
+    bpy.utils.register_class(ALIGNMENT_SUITE_Settings)
+    bpy.types.Scene.alignment_suite = bpy.props.PointerProperty(type=ALIGNMENT_SUITE_Settings)
+    for cls in panels:
+        bpy.utils.register_class(cls)
 
 
+def unregister():
+    for cls in reversed(panels):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.alignment_suite
+    bpy.utils.unregister_class(ALIGNMENT_SUITE_Settings)
@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+import inspect
 import math
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 import bpy
-import bmesh
-from mathutils import Matrix, Vector
+from mathutils import Matrix, Quaternion, Vector
+
+from . import profiling
+from .lazy import lazy_import
+
+bmesh = lazy_import("bmesh")
+np = lazy_import("numpy")
 
 
 AXES = ("X", "Y", "Z")
@@ -14,37 +22,719 @@ def axis_index(axis: str) -> int:
     return {"X": 0, "Y": 1, "Z": 2}[axis]
 
 
-def world_bounds_of_object(obj: bpy.types.Object) -> Tuple[Vector, Vector]:
-    if not obj.data or not hasattr(obj.data, "vertices"):
-        # Fallback to object origin as degenerate bounds
-        w = obj.matrix_world.translation
-        return Vector((w.x, w.y, w.z)), Vector((w.x, w.y, w.z))
+# Local-space convex hull points of evaluated geometry, keyed by _geometry_key().
+# Linked duplicates without modifiers share one entry.
+_hull_cache: Dict[Tuple[str, int], np.ndarray] = {}
+
+_EVALUATED_GEOMETRY_TYPES = {"MESH", "CURVE", "SURFACE", "FONT", "META"}
+
+# Bounds and axis snapshots of recent selections, keyed by what was computed
+# and the session_uid of every object. An entry is only reused while the
+# geometry generation and the objects' world matrices are unchanged, which is
+# exactly the case when the redo panel undoes an operator and runs it again.
+_snapshot_cache: Dict[tuple, Tuple[int, np.ndarray, object]] = {}
+_SNAPSHOT_CACHE_SIZE = 16
+# Bumped by the depsgraph handler whenever evaluated geometry changes
+_geometry_generation = 0
+# Both caches are only used while register() has installed the handlers that
+# invalidate them; scripts importing the modules directly always recompute
+_caching = False
+
+
+def world_bounds_array(objs: Sequence[bpy.types.Object], exact: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (N, 3) world-space min and max arrays for ``objs``.
+
+    All ``bound_box`` corners and ``matrix_world`` matrices are gathered into
+    contiguous arrays and transformed in a single (N, 8, 4) x (N, 4, 4) pass.
+    Objects without vertex data keep their corners at the local origin, which
+    yields degenerate bounds at the object's world location.
+
+    With ``exact`` the bounds are measured from evaluated geometry instead,
+    see :func:`exact_world_bounds_array`. Results are cached per selection
+    (see :func:`cached_for`) and returned read-only.
+    """
+    if not len(objs):
+        return np.zeros((0, 3)), np.zeros((0, 3))
+    if exact:
+        return cached_for(("BOUNDS", True), objs, lambda: _read_only(*exact_world_bounds_array(objs)))
+    return cached_for(("BOUNDS", False), objs, lambda: _read_only(*_box_world_bounds_array(objs)))
+
+
+def _box_world_bounds_array(objs: Sequence[bpy.types.Object]) -> Tuple[np.ndarray, np.ndarray]:
+    count = len(objs)
+    profiling.count("bounds", count)
+    corners = np.zeros((count, 8, 4))
+    corners[..., 3] = 1.0
+    matrices = np.empty((count, 4, 4))
+    for i, obj in enumerate(objs):
+        matrices[i] = obj.matrix_world
+        if obj.data and hasattr(obj.data, "vertices"):
+            corners[i, :, :3] = obj.bound_box
+
+    world = np.matmul(corners, matrices.transpose(0, 2, 1))[..., :3]
+    return world.min(axis=1), world.max(axis=1)
+
+
+def exact_world_bounds_array(
+    objs: Sequence[bpy.types.Object],
+    depsgraph: Optional[bpy.types.Depsgraph] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Tight (N, 3) world bounds from evaluated, modifier-aware geometry.
+
+    Each object's evaluated vertices are reduced once to their convex hull,
+    cached per geometry, so later calls only transform the hull points.
+    Objects without geometry fall back to their world location.
+    """
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    count = len(objs)
+    profiling.count("bounds", count)
+    mins = np.empty((count, 3))
+    maxs = np.empty((count, 3))
+    for i, obj in enumerate(objs):
+        mat = np.array(obj.matrix_world, dtype=float)
+        points = local_hull_points(obj, depsgraph)
+        if len(points) == 0:
+            mins[i] = maxs[i] = mat[:3, 3]
+            continue
+        world = transform_points(points, mat)
+        mins[i] = world.min(axis=0)
+        maxs[i] = world.max(axis=0)
+    return mins, maxs
+
+
+def world_extents_along(
+    objs: Sequence[bpy.types.Object], directions: np.ndarray, exact: bool = False
+) -> np.ndarray:
+    """Width of each object along its own world-space unit direction, (N,) array.
+
+    Projects the same points :func:`world_bounds_array` measures (``bound_box``
+    corners, or with ``exact`` the evaluated hull) onto ``directions`` (N, 3),
+    so rotation and parent scale are taken into account. Objects without
+    geometry have zero width.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get() if exact else None
+    profiling.count("bounds", len(objs))
+    widths = np.zeros(len(objs))
+    for i, (obj, direction) in enumerate(zip(objs, directions)):
+        if exact:
+            points = local_hull_points(obj, depsgraph)
+        elif obj.data and hasattr(obj.data, "vertices"):
+            points = np.array(obj.bound_box, dtype=float).reshape(-1, 3)
+        else:
+            continue
+        if len(points):
+            along = transform_points(points, obj.matrix_world) @ direction
+            widths[i] = along.max() - along.min()
+    return widths
+
+
+def _geometry_key(obj: bpy.types.Object) -> Tuple[str, int]:
+    # Shape key values live on the mesh but changing them does not tag it,
+    # and the evaluated shape can differ per object, so those key by object
+    if obj.type == "MESH" and not obj.modifiers and obj.data.shape_keys is None:
+        return "DATA", obj.data.session_uid
+    return "OBJECT", obj.session_uid
+
+
+def local_hull_points(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> np.ndarray:
+    """Cached (K, 3) local-space convex hull points of the object's evaluated geometry."""
+    key = _geometry_key(obj)
+    points = _hull_cache.get(key)
+    if points is None:
+        points = hull_points(evaluated_local_coords(obj, depsgraph))
+        if _caching:
+            _hull_cache[key] = points
+        profiling.count("hulls")
+    return points
+
+
+def evaluated_local_coords(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> np.ndarray:
+    """Read evaluated vertex positions (object space) in bulk via ``foreach_get``."""
+    if obj.type == "ARMATURE" and obj.pose:
+        points = [co for pbone in obj.pose.bones for co in (pbone.head, pbone.tail)]
+        return np.array(points, dtype=float).reshape(-1, 3)
+    if obj.type not in _EVALUATED_GEOMETRY_TYPES:
+        return np.zeros((0, 3))
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh = obj_eval.to_mesh()
+    except RuntimeError:
+        return np.zeros((0, 3))
+    if mesh is None:
+        return np.zeros((0, 3))
+    try:
+        coords = np.empty(len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get("co", coords)
+    finally:
+        obj_eval.to_mesh_clear()
+    return coords.reshape(-1, 3)
+
+
+def curve_path_points(obj: bpy.types.Object) -> Tuple[np.ndarray, bool]:
+    """World-space polyline through the first spline of curve ``obj`` and whether it is closed.
+
+    Bezier segments are sampled ``resolution_u`` times each; poly and NURBS
+    splines use their control points. Closed splines repeat their first point
+    at the end so the polyline covers the whole loop.
+    """
+    splines = obj.data.splines
+    if not len(splines):
+        return np.zeros((0, 3)), False
+    spline = splines[0]
+    cyclic = bool(spline.use_cyclic_u)
+    if spline.type == "BEZIER":
+        knots = spline.bezier_points
+        co, left, right = (np.empty(len(knots) * 3) for _ in range(3))
+        knots.foreach_get("co", co)
+        knots.foreach_get("handle_left", left)
+        knots.foreach_get("handle_right", right)
+        co, left, right = (a.reshape(-1, 3) for a in (co, left, right))
+        segments = len(co) if cyclic else len(co) - 1
+        p0, p1 = co[:segments], right[:segments]
+        p2, p3 = np.roll(left, -1, axis=0)[:segments], np.roll(co, -1, axis=0)[:segments]
+        t = np.linspace(0.0, 1.0, max(spline.resolution_u, 1), endpoint=False)[None, :, None]
+        u = 1.0 - t
+        curve = (u ** 3) * p0[:, None] + 3.0 * u * u * t * p1[:, None] + 3.0 * u * t * t * p2[:, None] + (t ** 3) * p3[:, None]
+        points = np.vstack((curve.reshape(-1, 3), co[:1] if cyclic else co[-1:]))
+    else:
+        co = np.empty(len(spline.points) * 4)
+        spline.points.foreach_get("co", co)
+        points = co.reshape(-1, 4)[:, :3]
+        if cyclic and len(points):
+            points = np.vstack((points, points[:1]))
+    matrix = np.array(obj.matrix_world)
+    return points @ matrix[:3, :3].T + matrix[:3, 3], cyclic
+
+
+def hull_points(coords: np.ndarray) -> np.ndarray:
+    """Reduce a point cloud to the vertices of its convex hull.
+
+    The hull is built with ``bmesh.ops.convex_hull``; flat input falls back to
+    a 2D hull in the plane of the points. Any failure keeps all points, which
+    is still exact, just not compact.
+    """
+    if len(coords) <= 8:
+        return coords.copy()
+
+    mesh = bpy.data.meshes.new("~alignment_suite_hull")
+    bm = bmesh.new()
+    try:
+        mesh.vertices.add(len(coords))
+        mesh.vertices.foreach_set("co", coords.ravel())
+        bm.from_mesh(mesh)
+        bm.verts.index_update()
+        ret = bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+        hull = {elem.index for elem in ret["geom"] if isinstance(elem, bmesh.types.BMVert)}
+    except (RuntimeError, ValueError):
+        hull = set()
+    finally:
+        bm.free()
+        bpy.data.meshes.remove(mesh)
+
+    if len(hull) >= 4:
+        return coords[sorted(hull)]
+    return _planar_hull_points(coords)
+
+
+def _planar_hull_points(coords: np.ndarray) -> np.ndarray:
+    from mathutils.geometry import convex_hull_2d
+
+    center = coords.mean(axis=0)
+    _, sing, basis = np.linalg.svd(coords - center, full_matrices=False)
+    if sing[2] > 1e-6 * max(sing[0], 1e-12):
+        return coords.copy()
+    flat = (coords - center) @ basis[:2].T
+    indices = convex_hull_2d([tuple(p) for p in flat])
+    return coords[sorted(indices)] if indices else coords.copy()
+
+
+def clear_hull_cache() -> None:
+    _hull_cache.clear()
+
+
+def clear_snapshot_cache() -> None:
+    _snapshot_cache.clear()
+
+
+def cached_for(kind: tuple, objs: Sequence[bpy.types.Object], compute):
+    """Return ``compute()`` for ``objs``, reusing the last result while nothing it depends on changed.
+
+    ``kind`` names what is computed, including any options that change the
+    result. The value is recomputed after a geometry update or when any of the
+    objects' world matrices differ from when it was stored; the matrices are
+    read in bulk, so a hit costs far less than recomputing bounds.
+    """
+    if not _caching:
+        return compute()
+    key = kind + tuple(obj.session_uid for obj in objs)
+    matrices = object_matrices(objs)
+    entry = _snapshot_cache.get(key)
+    if entry is not None and entry[0] == _geometry_generation and np.array_equal(entry[1], matrices):
+        profiling.count("cache_hits")
+        return entry[2]
+    value = compute()
+    _snapshot_cache.pop(key, None)
+    _snapshot_cache[key] = (_geometry_generation, matrices, value)
+    while len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+        del _snapshot_cache[next(iter(_snapshot_cache))]
+    return value
+
+
+def _read_only(*arrays: np.ndarray):
+    for array in arrays:
+        array.setflags(write=False)
+    return arrays
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph) -> None:
+    global _geometry_generation
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        _geometry_generation += 1
+        original = update.id.original
+        uid = original.session_uid
+        _hull_cache.pop(("DATA", uid), None)
+        _hull_cache.pop(("OBJECT", uid), None)
 
-    mat = obj.matrix_world
-    corners = [mat @ Vector(corner) for corner in obj.bound_box]
-    min_v = Vector((min(v.x for v in corners), min(v.y for v in corners), min(v.z for v in corners)))
-    max_v = Vector((max(v.x for v in corners), max(v.y for v in corners), max(v.z for v in corners)))
-    return min_v, max_v
 
+@bpy.app.handlers.persistent
+def _on_load_post(*_args) -> None:
+    clear_hull_cache()
+    clear_snapshot_cache()
 
-def world_bounds_of_objects(objs: Iterable[bpy.types.Object]) -> Tuple[Vector, Vector]:
-    mins: Optional[Vector] = None
-    maxs: Optional[Vector] = None
-    for obj in objs:
-        mn, mx = world_bounds_of_object(obj)
-        if mins is None:
-            mins, maxs = mn.copy(), mx.copy()
-        else:
-            mins.x = min(mins.x, mn.x)
-            mins.y = min(mins.y, mn.y)
-            mins.z = min(mins.z, mn.z)
-            maxs.x = max(maxs.x, mx.x)
-            maxs.y = max(maxs.y, mx.y)
-            maxs.z = max(maxs.z, mx.z)
-    if mins is None:
+
+def world_bounds_of_object(obj: bpy.types.Object, exact: bool = False) -> Tuple[Vector, Vector]:
+    mins, maxs = world_bounds_array((obj,), exact)
+    return Vector(mins[0]), Vector(maxs[0])
+
+
+def world_bounds_of_objects(objs: Iterable[bpy.types.Object], exact: bool = False) -> Tuple[Vector, Vector]:
+    objs = list(objs)
+    if not objs:
         zero = Vector((0.0, 0.0, 0.0))
         return zero, zero
-    return mins, maxs  # type: ignore[return-value]
+    mins, maxs = world_bounds_array(objs, exact)
+    return Vector(mins.min(axis=0)), Vector(maxs.max(axis=0))
+
+
+class AxisSnapshot(NamedTuple):
+    """Immutable capture of a selection sorted along one axis.
+
+    Every array is in sorted order. ``mins``/``maxs`` are (N, 3) world bounds,
+    or copies of ``translations`` when the snapshot was taken without bounds.
+    """
+
+    objs: Tuple[bpy.types.Object, ...]
+    axis: int
+    translations: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self.translations[:, self.axis]
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.maxs[:, self.axis] - self.mins[:, self.axis]
+
+
+def axis_snapshot(
+    objs: Sequence[bpy.types.Object],
+    axis: str,
+    with_bounds: bool = True,
+    exact: bool = False,
+) -> AxisSnapshot:
+    """Sort ``objs`` along ``axis`` and capture their translations and bounds.
+
+    Cached like :func:`world_bounds_array`, so a redo re-execution on an
+    unchanged selection skips the reads and the sort.
+    """
+    idx = axis_index(axis)
+    kind = ("SNAPSHOT", idx, bool(with_bounds), bool(exact))
+    # Only arrays are cached: object references do not survive an undo step
+    order, translations, mins, maxs = cached_for(kind, objs, lambda: _axis_snapshot_arrays(objs, idx, with_bounds, exact))
+    return AxisSnapshot(tuple(objs[i] for i in order), idx, translations, mins, maxs)
+
+
+def _axis_snapshot_arrays(objs: Sequence[bpy.types.Object], idx: int, with_bounds: bool, exact: bool) -> tuple:
+    translations = np.array([obj.matrix_world.translation for obj in objs], dtype=float).reshape(-1, 3)
+    order = np.argsort(translations[:, idx], kind="stable")
+    translations = translations[order]
+    if with_bounds and len(objs):
+        mins, maxs = world_bounds_array([objs[i] for i in order], exact)
+    else:
+        mins, maxs = translations.copy(), translations.copy()
+    return _read_only(order, translations, mins, maxs)
+
+
+# Below this many writes per channel, plain property assignment is cheaper than
+# a foreach round trip over every object in the file.
+BULK_WRITE_MIN = 64
+
+
+class TransformBatch:
+    """Collects target transforms and commits them in one pass.
+
+    Operators queue locations, scales, rotations and world matrices instead of
+    assigning them one property at a time. :meth:`flush` writes each channel in
+    bulk (``foreach_set`` over ``bpy.data.objects`` for large batches), tags
+    the touched objects and runs a single view layer update.
+
+    World-space moves (:meth:`offset_world`) are planned against the state at
+    queue time and resolved parent-first on flush: each one is converted into
+    the object's parent space after subtracting what its moved ancestors
+    already carry it, and objects that their parents moved into place are
+    left untouched. Selected rigs and assemblies therefore align correctly
+    without evaluating the depsgraph between writes.
+    """
+
+    def __init__(self) -> None:
+        self._locations: Dict[bpy.types.Object, Vector] = {}
+        self._scales: Dict[bpy.types.Object, Vector] = {}
+        self._rotations: Dict[bpy.types.Object, Quaternion] = {}
+        self._matrices: Dict[bpy.types.Object, Matrix] = {}
+        self._world_moves: Dict[bpy.types.Object, np.ndarray] = {}
+        # Object order for take(), built once and walked with a cursor
+        self._take_order: List[bpy.types.Object] = []
+        self._take_cursor = 0
+
+    def __len__(self) -> int:
+        return len(
+            self._locations.keys()
+            | self._scales.keys()
+            | self._rotations.keys()
+            | self._matrices.keys()
+            | self._world_moves.keys()
+        )
+
+    def location(self, obj: bpy.types.Object) -> Vector:
+        """Pending location of ``obj``, or its current one."""
+        loc = self._locations.get(obj)
+        return loc.copy() if loc is not None else obj.location.copy()
+
+    def scale(self, obj: bpy.types.Object) -> Vector:
+        """Pending scale of ``obj``, or its current one."""
+        scale = self._scales.get(obj)
+        return scale.copy() if scale is not None else obj.scale.copy()
+
+    def set_location(self, obj: bpy.types.Object, location: Sequence[float]) -> None:
+        self._locations[obj] = Vector(location)
+
+    def offset_location(self, obj: bpy.types.Object, axis: int, delta: float) -> None:
+        loc = self.location(obj)
+        loc[axis] += float(delta)
+        self._locations[obj] = loc
+
+    def offset_world(self, obj: bpy.types.Object, delta: Sequence[float]) -> None:
+        """Queue a world-space translation; repeated calls accumulate."""
+        move = self._world_moves.get(obj)
+        if move is None:
+            move = self._world_moves[obj] = np.zeros(3)
+        move += np.asarray(delta, dtype=float)
+
+    def offset_world_axis(self, obj: bpy.types.Object, axis: int, delta: float) -> None:
+        delta_vec = np.zeros(3)
+        delta_vec[axis] = delta
+        self.offset_world(obj, delta_vec)
+
+    def offset_world_axis_many(self, objs: Sequence[bpy.types.Object], axis: int, deltas: Sequence[float]) -> None:
+        for obj, delta in zip(objs, deltas):
+            self.offset_world_axis(obj, axis, delta)
+
+    def set_scale(self, obj: bpy.types.Object, scale: Sequence[float]) -> None:
+        self._scales[obj] = Vector(scale)
+
+    def set_rotation(self, obj: bpy.types.Object, rotation: Quaternion) -> None:
+        """Queue a rotation; it is converted to the object's rotation mode on flush."""
+        self._rotations[obj] = rotation.copy()
+
+    def set_matrix_world(self, obj: bpy.types.Object, matrix: Matrix) -> None:
+        self._matrices[obj] = matrix.copy()
+
+    def take(self, count: int) -> TransformBatch:
+        """Move the transforms of the first ``count`` queued objects into a new batch.
+
+        World moves are resolved first, so the parts can be flushed one at a
+        time. Queued world matrices depend on the parents' evaluated matrices
+        and are not split; they all go into the first part. The queued objects
+        are ordered once and later calls continue from a cursor, so each part
+        costs O(count) however many objects are still queued.
+        """
+        self.resolve()
+        part = TransformBatch()
+        part._matrices, self._matrices = self._matrices, {}
+        if self._take_cursor >= len(self._take_order):
+            # Also picks up anything queued after the previous order ran out
+            self._take_order = list(dict.fromkeys([*self._locations, *self._scales, *self._rotations]))
+            self._take_cursor = 0
+        objs = self._take_order[self._take_cursor:self._take_cursor + count]
+        self._take_cursor += len(objs)
+        for source, target in (
+            (self._locations, part._locations),
+            (self._scales, part._scales),
+            (self._rotations, part._rotations),
+        ):
+            for obj in objs:
+                if obj in source:
+                    target[obj] = source.pop(obj)
+        return part
+
+    def originals(self) -> TransformBatch:
+        """A batch that puts back the current value of everything this one will write."""
+        self.resolve()
+        batch = TransformBatch()
+        for obj in self._matrices:
+            batch.set_matrix_world(obj, obj.matrix_world)
+        for obj in self._locations:
+            batch.set_location(obj, obj.location)
+        for obj in self._scales:
+            batch.set_scale(obj, obj.scale)
+        for obj in self._rotations:
+            batch.set_rotation(obj, _read_rotation(obj))
+        return batch
+
+    def flush(self, context: Optional[bpy.types.Context] = None, update: bool = True) -> int:
+        """Write every queued transform, update the view layer once and return the object count.
+
+        With ``update=False`` the view layer is left for Blender to update
+        on the next redraw, for callers that write a batch in several parts.
+        """
+        if context is None:
+            context = bpy.context
+        self.resolve()
+        count = len(self)
+        if not count:
+            return 0
+
+        for obj, matrix in self._matrices.items():
+            obj.matrix_world = matrix
+        _write_vectors("location", self._locations)
+        _write_vectors("scale", self._scales)
+        for obj, rotation in self._rotations.items():
+            _write_rotation(obj, rotation)
+
+        self._locations.clear()
+        self._scales.clear()
+        self._rotations.clear()
+        self._matrices.clear()
+        self._take_order = []
+        self._take_cursor = 0
+        profiling.count("objects", count)
+        if update:
+            context.view_layer.update()
+            profiling.count("depsgraph_updates")
+        return count
+
+    def resolve(self) -> None:
+        """Turn the queued world moves into locations, planned against the current state."""
+        # Total world displacement each object ends up with, filled parent-first
+        carried: Dict[bpy.types.Object, np.ndarray] = {}
+
+        def displacement(obj: Optional[bpy.types.Object]) -> np.ndarray:
+            if obj is None:
+                return np.zeros(3)
+            if obj not in carried:
+                carried[obj] = displacement(obj.parent)
+            return carried[obj]
+
+        for obj in sorted(self._world_moves, key=_hierarchy_depth):
+            move = self._world_moves[obj]
+            carried[obj] = move
+            residual = move - displacement(obj.parent)
+            if np.abs(residual).max() <= 1e-9:
+                continue  # already moved into place by its parent
+            local = world_to_parent_space(obj) @ Vector(residual)
+            self._locations[obj] = self.location(obj) + local
+        self._world_moves.clear()
+
+
+def _object_rows(objs: Sequence[bpy.types.Object]) -> np.ndarray:
+    """Index of each object in ``bpy.data.objects``, for bulk ``foreach`` access."""
+    objects = bpy.data.objects
+    uids = np.empty(len(objects), dtype=np.int32)
+    objects.foreach_get("session_uid", uids)
+    order = np.argsort(uids)
+    targets = np.fromiter((obj.session_uid for obj in objs), dtype=np.int32, count=len(objs))
+    return order[np.searchsorted(uids, targets, sorter=order)]
+
+
+def object_matrices(objs: Sequence[bpy.types.Object]) -> np.ndarray:
+    """World matrices of ``objs`` as flat (N, 16) rows, read in bulk for large selections.
+
+    Meant for comparing states: the element order differs between the bulk
+    and the per-object path, which is fine as long as the selection is the same.
+    """
+    if len(objs) < BULK_WRITE_MIN:
+        return np.array([np.array(obj.matrix_world).ravel() for obj in objs]).reshape(-1, 16)
+    objects = bpy.data.objects
+    data = np.empty(len(objects) * 16)
+    objects.foreach_get("matrix_world", data)
+    return data.reshape(-1, 16)[_object_rows(objs)]
+
+
+def world_to_parent_space(obj: bpy.types.Object) -> Matrix:
+    """3x3 matrix taking a world-space offset to a change of ``obj.location``."""
+    # Parent space -> world, whatever the parent type (object, bone, vertex)
+    parent_frame = (obj.matrix_world @ obj.matrix_basis.inverted_safe()).to_3x3()
+    return parent_frame.inverted_safe()
+
+
+def world_to_local_rotation(obj: bpy.types.Object, rotation: Quaternion) -> Quaternion:
+    """Local rotation that gives ``obj`` the world ``rotation`` under its current parent."""
+    parent_frame = (obj.matrix_world @ obj.matrix_basis.inverted_safe()).to_quaternion()
+    return parent_frame.inverted() @ rotation
+
+
+def has_ancestor_in(obj: bpy.types.Object, objs: Set[bpy.types.Object]) -> bool:
+    """Whether a parent of ``obj``, at any depth, is in ``objs``."""
+    parent = obj.parent
+    while parent is not None:
+        if parent in objs:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _hierarchy_depth(obj: bpy.types.Object) -> int:
+    depth = 0
+    while obj.parent is not None:
+        obj = obj.parent
+        depth += 1
+    return depth
+
+
+def _write_vectors(attr: str, values: Dict[bpy.types.Object, Vector]) -> None:
+    if len(values) < BULK_WRITE_MIN:
+        for obj, value in values.items():
+            setattr(obj, attr, value)
+        return
+    write_vector_array(attr, list(values), np.array([tuple(value) for value in values.values()]))
+
+
+def write_vector_array(attr: str, objs: Sequence[bpy.types.Object], values: np.ndarray) -> None:
+    """Write (N, 3) ``values`` to a vector property of ``objs`` with one ``foreach_set``.
+
+    Unlike :class:`TransformBatch` this does not update the view layer.
+    """
+    if len(objs) < BULK_WRITE_MIN:
+        for obj, value in zip(objs, values):
+            setattr(obj, attr, value)
+        return
+
+    objects = bpy.data.objects
+    total = len(objects)
+    rows = _object_rows(objs)
+
+    data = np.empty(total * 3)
+    objects.foreach_get(attr, data)
+    data = data.reshape(-1, 3)
+    data[rows] = values
+    objects.foreach_set(attr, data.ravel())
+    # foreach_set skips RNA updates, so tag the written objects explicitly
+    for obj in objs:
+        obj.update_tag(refresh={"OBJECT"})
+
+
+def _read_rotation(obj: bpy.types.Object) -> Quaternion:
+    mode = obj.rotation_mode
+    if mode == "QUATERNION":
+        return obj.rotation_quaternion.copy()
+    if mode == "AXIS_ANGLE":
+        angle, *axis = obj.rotation_axis_angle
+        return Quaternion(axis, angle)
+    return obj.rotation_euler.to_quaternion()
+
+
+def _write_rotation(obj: bpy.types.Object, rotation: Quaternion) -> None:
+    mode = obj.rotation_mode
+    if mode == "QUATERNION":
+        obj.rotation_quaternion = rotation
+    elif mode == "AXIS_ANGLE":
+        axis, angle = rotation.to_axis_angle()
+        obj.rotation_axis_angle = (angle, axis.x, axis.y, axis.z)
+    else:
+        obj.rotation_euler = rotation.to_euler(mode, obj.rotation_euler)
+
+
+class SceneSettingsMixin:
+    """Operator mixin that fills properties the caller left unset from the panel settings.
+
+    ``scene_settings`` maps operator property names to ``Scene.alignment_suite``
+    fields. Panel buttons only set what differs per button (usually the axis),
+    so the settings are read once when the operator runs instead of being
+    copied into every button on each redraw.
+
+    The mapped properties must be declared with ``options={"SKIP_SAVE"}``:
+    Blender otherwise restores their last-used values on invoke and marks them
+    as set, so later changes to the panel would be ignored.
+    """
+
+    scene_settings = {}
+
+    def invoke(self, context, event):
+        apply_scene_settings(self, context, self.scene_settings)
+        return self.execute(context)
+
+
+def apply_scene_settings(operator: bpy.types.Operator, context: bpy.types.Context, mapping: Dict[str, str]) -> None:
+    settings = getattr(context.scene, "alignment_suite", None)
+    if settings is None:
+        return
+    for prop, setting in mapping.items():
+        if not operator.properties.is_property_set(prop):
+            setattr(operator, prop, getattr(settings, setting))
+
+
+_PROPERTY_DEFAULTS = {"BoolProperty": False, "IntProperty": 0, "FloatProperty": 0.0, "StringProperty": ""}
+
+
+def declared_properties(cls: type) -> Dict[str, object]:
+    """The ``bpy.props`` annotations of an operator class and its mixins, by name."""
+    props = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in getattr(klass, "__annotations__", {}).items():
+            if hasattr(value, "keywords"):
+                props[name] = value
+    return props
+
+
+def property_default(prop) -> object:
+    keywords = prop.keywords
+    if "default" in keywords:
+        return keywords["default"]
+    items = keywords.get("items")
+    if items and not callable(items):
+        return items[0][0]
+    return _PROPERTY_DEFAULTS.get(prop.function.__name__)
+
+
+class ExecuteProxy:
+    """Stands in for an operator instance so its ``execute`` can run without ``bpy.ops``.
+
+    Properties come from ``values`` or their declared defaults; methods and
+    class attributes resolve on the operator class. Reports are collected in
+    ``reports``.
+    """
+
+    def __init__(self, cls: type, values: Dict[str, object]) -> None:
+        self._cls = cls
+        self.reports = []
+        for name, prop in declared_properties(cls).items():
+            setattr(self, name, values.get(name, property_default(prop)))
+
+    def __getattr__(self, name):
+        attr = getattr(self._cls, name)
+        if inspect.isfunction(inspect.getattr_static(self._cls, name, None)):
+            return attr.__get__(self)
+        return attr
+
+    def report(self, level, message) -> None:
+        self.reports.append((level, message))
 
 
 def selected_objects(context: bpy.types.Context) -> List[bpy.types.Object]:
@@ -64,40 +754,71 @@ def alignment_target_value(
     axis: str,
     mode: str,
     objs: Optional[Sequence[bpy.types.Object]] = None,
+    exact: bool = False,
 ) -> float:
-    idx = axis_index(axis)
+    return float(alignment_target(context, mode, objs, exact)[axis_index(axis)])
+
+
+def alignment_target(
+    context: bpy.types.Context,
+    mode: str,
+    objs: Optional[Sequence[bpy.types.Object]] = None,
+    exact: bool = False,
+) -> np.ndarray:
+    """Alignment target on all three axes at once, from a single bounds pass."""
     mode = mode.upper()
     if mode == "WORLD":
-        return 0.0
+        return np.zeros(3)
     if mode == "CURSOR":
-        return cursor_location(context)[idx]
+        return np.array(cursor_location(context), dtype=float)
 
     if objs is None:
         objs = selected_objects(context)
 
     if not objs:
-        return 0.0
+        return np.zeros(3)
 
     if mode == "ACTIVE":
         act = active_object(context)
         if not act:
             act = objs[0]
-        mn, mx = world_bounds_of_object(act)
-        return 0.5 * (mn[idx] + mx[idx])
+        mn, mx = world_bounds_of_object(act, exact)
+        return 0.5 * (np.array(mn) + np.array(mx))
 
-    mn_all, mx_all = world_bounds_of_objects(objs)
+    mn_all, mx_all = world_bounds_of_objects(objs, exact)
 
     if mode == "MIN":
-        return float(mn_all[idx])
+        return np.array(mn_all)
     if mode == "MAX":
-        return float(mx_all[idx])
+        return np.array(mx_all)
     # CENTER / MEDIAN
-    return 0.5 * (mn_all[idx] + mx_all[idx])
+    return 0.5 * (np.array(mn_all) + np.array(mx_all))
+
+
+def chosen_axes(axes: Sequence[bool], axis: str) -> List[int]:
+    """Indices of the axes ticked in a BoolVectorProperty, or just ``axis`` when none are."""
+    return [i for i, on in enumerate(axes) if on] or [axis_index(axis)]
 
 
-def set_object_world_location_axis(obj: bpy.types.Object, axis: str, value: float, use_bounds: bool, which_bound: str = "CENTER") -> None:
+def set_object_world_location_axis(
+    obj: bpy.types.Object,
+    axis: str,
+    value: float,
+    use_bounds: bool,
+    which_bound: str = "CENTER",
+    bounds: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
+    exact: bool = False,
+    batch: Optional[TransformBatch] = None,
+) -> None:
+    """Move ``obj`` along ``axis`` so its origin (or chosen bound) lands on ``value``.
+
+    With ``batch`` the new transform is queued instead of written immediately.
+    """
     idx = axis_index(axis)
     if not use_bounds:
+        if batch is not None:
+            batch.offset_world_axis(obj, idx, value - obj.matrix_world.translation[idx])
+            return
         # Set world translation component directly to avoid parent/constraint confusion
         mw = obj.matrix_world.copy()
         tr = mw.translation.copy()
@@ -107,14 +828,17 @@ def set_object_world_location_axis(obj: bpy.types.Object, axis: str, value: floa
         return
 
     # Align using bounding box: move so that min/center/max equals value
-    mn, mx = world_bounds_of_object(obj)
+    mn, mx = bounds if bounds is not None else world_bounds_of_object(obj, exact)
     current = 0.5 * (mn[idx] + mx[idx])
     if which_bound == "MIN":
         current = mn[idx]
     elif which_bound == "MAX":
         current = mx[idx]
     delta = value - current
-    obj.location[idx] += delta
+    if batch is not None:
+        batch.offset_world_axis(obj, idx, delta)
+    else:
+        obj.location[idx] += delta
 
 
 def bmesh_from_active() -> Tuple[bmesh.types.BMesh, bpy.types.Object]:
@@ -145,6 +869,7 @@ def set_selected_verts_axis(bm: bmesh.types.BMesh, obj: bpy.types.Object, axis:
 
 def bounds_of_selected_verts_world(bm: bmesh.types.BMesh, obj: bpy.types.Object) -> Tuple[Vector, Vector]:
     coords = selected_vert_world_coords(bm, obj)
+    profiling.count("bounds")
     if not coords:
         zero = Vector((0.0, 0.0, 0.0))
         return zero, zero
@@ -153,6 +878,51 @@ def bounds_of_selected_verts_world(bm: bmesh.types.BMesh, obj: bpy.types.Object)
     return min_v, max_v
 
 
+def transform_points(points: np.ndarray, matrix) -> np.ndarray:
+    """Apply a 4x4 affine ``matrix`` to (N, 3) ``points``."""
+    mat = np.array(matrix, dtype=float)
+    return points @ mat[:3, :3].T + mat[:3, 3]
+
+
+def supports_bulk_edit(obj: bpy.types.Object) -> bool:
+    """Whether the edit mesh can round-trip through the bulk array path.
+
+    Shape keys keep their own copy of the coordinates, so meshes that have them
+    use the per-vertex BMesh path instead.
+    """
+    return obj.type == "MESH" and obj.data.shape_keys is None
+
+
+def edit_mesh_arrays(obj: bpy.types.Object) -> Tuple[np.ndarray, np.ndarray]:
+    """Read (N, 3) local coordinates and the (N,) selection mask of an edit mesh in bulk."""
+    obj.update_from_editmode()
+    me = obj.data
+    count = len(me.vertices)
+    co = np.empty(count * 3)
+    sel = np.empty(count, dtype=bool)
+    me.vertices.foreach_get("co", co)
+    me.vertices.foreach_get("select", sel)
+    profiling.count("verts", count)
+    return co.reshape(-1, 3), sel
+
+
+def write_edit_mesh_coords(obj: bpy.types.Object, indices: np.ndarray, co: np.ndarray) -> None:
+    """Write (K, 3) local coordinates of the vertices at ``indices`` into the edit mesh.
+
+    The values go into the existing BMesh verts rather than reloading it from
+    the mesh, so the selection history and the active element are kept. Only
+    the given vertices are touched.
+    """
+    me = obj.data
+    bm = bmesh.from_edit_mesh(me)
+    verts = bm.verts
+    verts.ensure_lookup_table()
+    for index, value in zip(np.asarray(indices).tolist(), np.asarray(co).reshape(-1, 3).tolist()):
+        verts[index].co = value
+    bmesh.update_edit_mesh(me)
+    profiling.count("depsgraph_updates")
+
+
 def mirror_point_across_plane(point: Vector, axis: str, origin: Vector) -> Vector:
     idx = axis_index(axis)
     mirrored = point.copy()
@@ -180,7 +950,12 @@ def scale_object_world_axis(obj: bpy.types.Object, axis: str, factor: float) ->
     obj.matrix_world = new_mw
 
 
-def origin_point(context: bpy.types.Context, mode: str, objs: Optional[Sequence[bpy.types.Object]] = None) -> Vector:
+def origin_point(
+    context: bpy.types.Context,
+    mode: str,
+    objs: Optional[Sequence[bpy.types.Object]] = None,
+    exact: bool = False,
+) -> Vector:
     mode = mode.upper()
     if mode == "WORLD":
         return Vector((0.0, 0.0, 0.0))
@@ -194,7 +969,7 @@ def origin_point(context: bpy.types.Context, mode: str, objs: Optional[Sequence[
         objs = selected_objects(context)
     if not objs:
         return Vector((0.0, 0.0, 0.0))
-    mn, mx = world_bounds_of_objects(objs)
+    mn, mx = world_bounds_of_objects(objs, exact)
     return 0.5 * (mn + mx)
 
 
@@ -212,3 +987,21 @@ def radians(angle_degrees: float) -> float:
     return math.radians(angle_degrees)
 
 
+def register():
+    global _caching
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+    _caching = True
+
+
+def unregister():
+    global _caching
+    _caching = False
+    for handlers, fn in (
+        (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+        (bpy.app.handlers.load_post, _on_load_post),
+    ):
+        if fn in handlers:
+            handlers.remove(fn)
+    clear_hull_cache()
+    clear_snapshot_cache()